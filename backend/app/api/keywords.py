@@ -4,6 +4,7 @@ from typing import List, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, desc
+from sqlalchemy.exc import IntegrityError
 from app.core.database import get_db
 from app.models.place import SavedKeyword, RankHistory, Place
 from app.services.naver_place import NaverPlaceService
@@ -121,7 +122,12 @@ async def save_keyword(
     )
 
     db.add(saved_keyword)
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 순위 조회 중 같은 키워드가 먼저 저장된 경우 (유니크 제약)
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="이미 저장된 키워드입니다")
     await db.refresh(saved_keyword)
 
     # 첫 히스토리 기록 (모든 데이터 포함)
@@ -349,8 +355,9 @@ async def get_rank_history(
 
     # 히스토리 조회
     start_date = datetime.utcnow() - timedelta(days=days)
+    # 차트에 필요한 컬럼만 조회 (place_id+keyword+checked_at 복합 인덱스 범위 스캔)
     result = await db.execute(
-        select(RankHistory)
+        select(RankHistory.rank, RankHistory.total_results, RankHistory.checked_at)
         .where(
             and_(
                 RankHistory.place_id == keyword.place_id,
@@ -360,7 +367,7 @@ async def get_rank_history(
         )
         .order_by(desc(RankHistory.checked_at))
     )
-    history = result.scalars().all()
+    history = result.all()
 
     return [
         RankHistoryResponse(
@@ -2,13 +2,14 @@ from fastapi import APIRouter, HTTPException, Query, Depends
 from pydantic import BaseModel, Field
 from typing import List, Optional, Any, Dict
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, and_, case, func, insert
+from sqlalchemy.exc import IntegrityError
 from datetime import datetime, timedelta
 from app.services.naver_place import NaverPlaceService
 from app.services.place_analyzer import PlaceAnalyzer
 from app.services.naver_datalab import datalab_service
 from app.core.database import get_db
-from app.models.place import PlaceStats, RankHistory, TrackedPlace, KeywordFactorAnalysis, KeywordSearchLog, KeywordRankSnapshot, PlaceSaveTracker, PlaceSaveHistory
+from app.models.place import PlaceStats, RankHistory, TrackedPlace, KeywordFactorAnalysis, KeywordSearchLog, KeywordRankSnapshot, KeywordRankSnapshotEntry, PlaceSaveTracker, PlaceSaveHistory
 from app.services.scheduler import place_scheduler
 import logging
 
@@ -524,8 +525,9 @@ async def get_rank_history(
     """키워드 순위 히스토리 조회"""
     start_date = datetime.now() - timedelta(days=days)
 
+    # 차트에 필요한 컬럼만 조회 (place_id+keyword+checked_at 복합 인덱스 범위 스캔)
     result = await db.execute(
-        select(RankHistory)
+        select(RankHistory.rank, RankHistory.total_results, RankHistory.checked_at)
         .where(
             and_(
                 RankHistory.place_id == place_id,
@@ -535,7 +537,7 @@ async def get_rank_history(
         )
         .order_by(RankHistory.checked_at.desc())
     )
-    history = result.scalars().all()
+    history = result.all()
 
     # 순위 변화 계산
     rank_changes = []
@@ -787,7 +789,7 @@ async def trigger_rank_check_now():
 async def trigger_saved_keywords_refresh_now():
     """저장된 키워드 순위 크롤링 즉시 실행 (순위 추적 페이지용)"""
     import asyncio
-    asyncio.create_task(place_scheduler.refresh_saved_keywords())
+    asyncio.create_task(place_scheduler.refresh_saved_keywords(force=True))
     return {"message": "저장된 키워드 크롤링 시작됨 (백그라운드에서 실행중)"}
 
 
@@ -1343,23 +1345,8 @@ async def log_keyword_search(
 
 # ============== 키워드 순위 비교 분석 API ==============
 
-@router.post("/keywords/snapshot")
-async def save_keyword_rank_snapshot(
-    keyword: str = Query(..., min_length=2, description="키워드"),
-    db: AsyncSession = Depends(get_db)
-):
-    """
-    키워드 순위 스냅샷 저장
-
-    현재 키워드의 순위 데이터를 저장하여 누적 분석에 사용합니다.
-    """
-    # 키워드 검색
-    places = await naver_service.search_places(keyword, 50)
-
-    if not places:
-        raise HTTPException(status_code=404, detail="검색 결과가 없습니다")
-
-    # 스냅샷 데이터 생성
+def _build_rank_snapshot(keyword: str, places: List[Dict[str, Any]], snapshot_at: datetime) -> KeywordRankSnapshot:
+    """검색 결과로 순위 스냅샷 생성 (rank_data JSON + 정규화된 순위 항목)"""
     rank_data = [
         {
             "rank": idx + 1,
@@ -1373,13 +1360,33 @@ async def save_keyword_rank_snapshot(
         for idx, p in enumerate(places)
     ]
 
-    # 스냅샷 저장
-    snapshot = KeywordRankSnapshot(
+    return KeywordRankSnapshot(
         keyword=keyword,
         rank_data=rank_data,
         total_places=len(places),
-        snapshot_at=datetime.now()
+        snapshot_at=snapshot_at,
+        entries=[KeywordRankSnapshotEntry.from_rank_item(item) for item in rank_data]
     )
+
+
+@router.post("/keywords/snapshot")
+async def save_keyword_rank_snapshot(
+    keyword: str = Query(..., min_length=2, description="키워드"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    키워드 순위 스냅샷 저장
+
+    현재 키워드의 순위 데이터를 저장하여 누적 분석에 사용합니다.
+    """
+    # 키워드 검색
+    places = await naver_service.search_places(keyword, 50)
+
+    if not places:
+        raise HTTPException(status_code=404, detail="검색 결과가 없습니다")
+
+    # 스냅샷 저장
+    snapshot = _build_rank_snapshot(keyword, places, datetime.now())
     db.add(snapshot)
 
     # 키워드 검색 로그도 기록
@@ -1413,7 +1420,7 @@ async def save_keyword_rank_snapshot(
         "keyword": keyword,
         "total_places": len(places),
         "snapshot_at": datetime.now().isoformat(),
-        "top_5": rank_data[:5]
+        "top_5": snapshot.rank_data[:5]
     }
 
 
@@ -1598,18 +1605,18 @@ async def compare_places_in_keyword(
         raise HTTPException(status_code=400, detail="최대 10개까지 비교 가능합니다")
 
     start_date = datetime.now() - timedelta(days=days)
+    in_period = and_(
+        KeywordRankSnapshot.keyword == keyword,
+        KeywordRankSnapshot.snapshot_at >= start_date
+    )
 
+    # 스냅샷 목록 (rank_data JSON은 읽지 않음)
     result = await db.execute(
-        select(KeywordRankSnapshot)
-        .where(
-            and_(
-                KeywordRankSnapshot.keyword == keyword,
-                KeywordRankSnapshot.snapshot_at >= start_date
-            )
-        )
+        select(KeywordRankSnapshot.id, KeywordRankSnapshot.snapshot_at)
+        .where(in_period)
         .order_by(KeywordRankSnapshot.snapshot_at.asc())
     )
-    snapshots = result.scalars().all()
+    snapshots = result.all()
 
     if not snapshots:
         return {
@@ -1618,19 +1625,29 @@ async def compare_places_in_keyword(
             "message": "누적된 데이터가 없습니다."
         }
 
+    # 비교 대상 플레이스의 순위 항목만 조회
+    entry_result = await db.execute(
+        select(
+            KeywordRankSnapshotEntry.snapshot_id,
+            KeywordRankSnapshotEntry.place_id,
+            KeywordRankSnapshotEntry.rank,
+            KeywordRankSnapshotEntry.name
+        )
+        .join(KeywordRankSnapshot, KeywordRankSnapshotEntry.snapshot_id == KeywordRankSnapshot.id)
+        .where(in_period, KeywordRankSnapshotEntry.place_id.in_(ids))
+    )
+    entries = {(e.snapshot_id, e.place_id): e for e in entry_result.all()}
+
     # 각 플레이스별 순위 히스토리
     place_histories = {pid: [] for pid in ids}
 
     for snapshot in snapshots:
-        rank_data = snapshot.rank_data or []
-        rank_map = {str(item.get("place_id")): item for item in rank_data}
-
         for pid in ids:
-            item = rank_map.get(pid)
+            item = entries.get((snapshot.id, pid))
             place_histories[pid].append({
                 "snapshot_at": snapshot.snapshot_at.isoformat(),
-                "rank": item.get("rank") if item else None,
-                "name": item.get("name") if item else None
+                "rank": item.rank if item else None,
+                "name": item.name if item else None
             })
 
     # 비교 결과
@@ -1835,19 +1852,6 @@ async def save_multiple_snapshots_for_testing(
     if not places:
         raise HTTPException(status_code=404, detail="검색 결과가 없습니다")
 
-    rank_data = [
-        {
-            "rank": idx + 1,
-            "place_id": p.get("place_id"),
-            "name": p.get("name"),
-            "category": p.get("category"),
-            "visitor_review_count": p.get("visitor_review_count", 0),
-            "blog_review_count": p.get("blog_review_count", 0),
-            "save_count": p.get("save_count", 0)
-        }
-        for idx, p in enumerate(places)
-    ]
-
     # 여러 기간에 대해 스냅샷 저장 (테스트용)
     periods = [0, 1, 15, 20, 25, 30]
     saved = []
@@ -1855,12 +1859,7 @@ async def save_multiple_snapshots_for_testing(
     for days in periods:
         snapshot_time = datetime.now() - timedelta(days=days)
 
-        snapshot = KeywordRankSnapshot(
-            keyword=keyword,
-            rank_data=rank_data,
-            total_places=len(places),
-            snapshot_at=snapshot_time
-        )
+        snapshot = _build_rank_snapshot(keyword, places, snapshot_time)
         db.add(snapshot)
         saved.append(f"{days}일전")
 
@@ -1957,40 +1956,42 @@ async def get_hidden_keywords_with_ranks(
     # 히든 키워드 발굴
     hidden_keywords = await analyzer.find_hidden_keywords(place_id, place_info, max_keywords=35)
 
-    # 각 키워드별 일별 순위 조회
-    keyword_ranks = []
-
-    for kw_data in hidden_keywords:
-        keyword = kw_data["keyword"]
-
-        # 해당 키워드의 스냅샷 히스토리 조회
-        start_date = datetime.now() - timedelta(days=days)
+    # 모든 키워드의 스냅샷별 내 순위를 한 번에 조회 (순위권 밖이면 rank=None)
+    start_date = datetime.now() - timedelta(days=days)
+    daily_ranks_by_keyword = {kw_data["keyword"]: {} for kw_data in hidden_keywords}
+    if daily_ranks_by_keyword:
         result = await db.execute(
-            select(KeywordRankSnapshot)
+            select(
+                KeywordRankSnapshot.keyword,
+                KeywordRankSnapshot.snapshot_at,
+                func.min(KeywordRankSnapshotEntry.rank)
+            )
+            .outerjoin(
+                KeywordRankSnapshotEntry,
+                and_(
+                    KeywordRankSnapshotEntry.snapshot_id == KeywordRankSnapshot.id,
+                    KeywordRankSnapshotEntry.place_id == str(place_id)
+                )
+            )
             .where(
                 and_(
-                    KeywordRankSnapshot.keyword == keyword,
+                    KeywordRankSnapshot.keyword.in_(list(daily_ranks_by_keyword)),
                     KeywordRankSnapshot.snapshot_at >= start_date
                 )
             )
+            .group_by(KeywordRankSnapshot.id, KeywordRankSnapshot.keyword, KeywordRankSnapshot.snapshot_at)
             .order_by(KeywordRankSnapshot.snapshot_at.desc())
         )
-        snapshots = result.scalars().all()
+        # 날짜별 순위 매핑 (최신순으로 덮어써 같은 날은 가장 이른 스냅샷 값 유지)
+        for keyword, snapshot_at, place_rank in result.all():
+            daily_ranks_by_keyword[keyword][snapshot_at.strftime("%m-%d")] = place_rank
 
-        # 날짜별 순위 매핑
-        daily_ranks = {}
-        for snapshot in snapshots:
-            date_str = snapshot.snapshot_at.strftime("%m-%d")
-            rank_data = snapshot.rank_data or []
-
-            # 해당 place_id의 순위 찾기
-            place_rank = None
-            for item in rank_data:
-                if str(item.get("place_id")) == str(place_id):
-                    place_rank = item.get("rank")
-                    break
+    # 각 키워드별 일별 순위
+    keyword_ranks = []
 
-            daily_ranks[date_str] = place_rank
+    for kw_data in hidden_keywords:
+        keyword = kw_data["keyword"]
+        daily_ranks = daily_ranks_by_keyword[keyword]
 
         keyword_ranks.append({
             "keyword": keyword,
@@ -2048,25 +2049,7 @@ async def snapshot_all_hidden_keywords(
         places = await naver_service.search_places(keyword, 50)
 
         if places:
-            rank_data = [
-                {
-                    "rank": idx + 1,
-                    "place_id": p.get("place_id"),
-                    "name": p.get("name"),
-                    "category": p.get("category"),
-                    "visitor_review_count": p.get("visitor_review_count", 0),
-                    "blog_review_count": p.get("blog_review_count", 0),
-                    "save_count": p.get("save_count", 0)
-                }
-                for idx, p in enumerate(places)
-            ]
-
-            snapshot = KeywordRankSnapshot(
-                keyword=keyword,
-                rank_data=rank_data,
-                total_places=len(places),
-                snapshot_at=datetime.now()
-            )
+            snapshot = _build_rank_snapshot(keyword, places, datetime.now())
             db.add(snapshot)
             saved_keywords.append(keyword)
 
@@ -2426,7 +2409,12 @@ async def create_save_tracker(
         last_checked_at=datetime.now()
     )
     db.add(new_tracker)
-    await db.commit()
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 조회 중 같은 조합이 먼저 등록된 경우 (유니크 제약)
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="이미 등록된 플레이스+키워드 조합입니다")
     await db.refresh(new_tracker)
 
     return {
@@ -2486,45 +2474,35 @@ async def get_save_tracker_summary(
 
     전체 트래커 현황과 최근 변화 요약을 제공합니다.
     """
-    # 전체 트래커 수
-    total_result = await db.execute(
-        select(func.count(PlaceSaveTracker.id))
-    )
-    total_count = total_result.scalar()
-
-    # 활성 트래커 수
-    active_result = await db.execute(
-        select(func.count(PlaceSaveTracker.id)).where(PlaceSaveTracker.is_active == 1)
+    # 전체/활성 트래커 수
+    tracker_result = await db.execute(
+        select(
+            func.count(PlaceSaveTracker.id),
+            func.sum(case((PlaceSaveTracker.is_active == 1, 1), else_=0)),
+        )
     )
-    active_count = active_result.scalar()
+    total_count, active_count = tracker_result.one()
 
-    # 최근 7일 히스토리 기록 수
+    # 최근 7일 히스토리 기록 수와 순위 상승/하락, 저장수 증가 건수 (행을 불러오지 않고 집계)
     week_ago = datetime.now() - timedelta(days=7)
     history_result = await db.execute(
-        select(func.count(PlaceSaveHistory.id)).where(PlaceSaveHistory.recorded_at >= week_ago)
-    )
-    recent_history_count = history_result.scalar()
-
-    # 최근 히스토리에서 순위 상승/하락 업체
-    recent_history = await db.execute(
-        select(PlaceSaveHistory)
-        .where(PlaceSaveHistory.recorded_at >= week_ago)
-        .order_by(PlaceSaveHistory.recorded_at.desc())
+        select(
+            func.count(PlaceSaveHistory.id),
+            func.sum(case((PlaceSaveHistory.rank_change > 0, 1), else_=0)),
+            func.sum(case((PlaceSaveHistory.rank_change < 0, 1), else_=0)),
+            func.sum(case((PlaceSaveHistory.save_change > 0, 1), else_=0)),
+        ).where(PlaceSaveHistory.recorded_at >= week_ago)
     )
-    histories = recent_history.scalars().all()
-
-    rising_count = sum(1 for h in histories if h.rank_change and h.rank_change > 0)
-    falling_count = sum(1 for h in histories if h.rank_change and h.rank_change < 0)
-    save_increasing_count = sum(1 for h in histories if h.save_change and h.save_change > 0)
+    recent_history_count, rising_count, falling_count, save_increasing_count = history_result.one()
 
     return {
         "total_trackers": total_count,
-        "active_trackers": active_count,
+        "active_trackers": active_count or 0,
         "recent_7days": {
             "history_records": recent_history_count,
-            "rank_rising": rising_count,
-            "rank_falling": falling_count,
-            "save_increasing": save_increasing_count
+            "rank_rising": rising_count or 0,
+            "rank_falling": falling_count or 0,
+            "save_increasing": save_increasing_count or 0
         },
         "info": {
             "description": "플레이스 저장 체크 현황입니다",
@@ -2558,6 +2536,7 @@ async def check_all_save_trackers(
         }
 
     results = []
+    history_rows = []
     success_count = 0
     error_count = 0
 
@@ -2610,21 +2589,20 @@ async def check_all_save_trackers(
             tracker.blog_review_count = new_blog_review
             tracker.last_checked_at = datetime.now()
 
-            # 히스토리 기록
+            # 히스토리 기록 (루프 종료 후 일괄 INSERT)
             if record_history:
-                history = PlaceSaveHistory(
-                    tracker_id=tracker.id,
-                    rank=new_rank,
-                    save_count=new_save_count,
-                    visitor_review_count=new_visitor_review,
-                    blog_review_count=new_blog_review,
-                    rank_change=rank_change,
-                    save_change=save_change,
-                    visitor_review_change=visitor_review_change,
-                    blog_review_change=blog_review_change,
-                    recorded_at=datetime.now()
-                )
-                db.add(history)
+                history_rows.append({
+                    "tracker_id": tracker.id,
+                    "rank": new_rank,
+                    "save_count": new_save_count,
+                    "visitor_review_count": new_visitor_review,
+                    "blog_review_count": new_blog_review,
+                    "rank_change": rank_change,
+                    "save_change": save_change,
+                    "visitor_review_change": visitor_review_change,
+                    "blog_review_change": blog_review_change,
+                    "recorded_at": datetime.now(),
+                })
 
             results.append({
                 "tracker_id": tracker.id,
@@ -2649,6 +2627,8 @@ async def check_all_save_trackers(
             })
             error_count += 1
 
+    if history_rows:
+        await db.execute(insert(PlaceSaveHistory), history_rows)
     await db.commit()
 
     return {
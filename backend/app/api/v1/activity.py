@@ -9,7 +9,6 @@ from datetime import datetime, date, timedelta
 from typing import List, Optional
 from pydantic import BaseModel, Field
 import numpy as np
-from scipy import stats
 
 from app.models.place import UserActivityLog
 from app.services.adlog_proxy import adlog_service, AdlogApiError
@@ -366,9 +365,12 @@ async def update_activity_results(
         result = await db.execute(d1_query)
         d1_logs = result.scalars().all()
 
-        for log in d1_logs:
+        d1_results = await adlog_service.fetch_keywords_bulk([log.keyword for log in d1_logs])
+
+        for log, raw_data in zip(d1_logs, d1_results):
             try:
-                raw_data = await adlog_service.fetch_keyword_analysis(log.keyword)
+                if isinstance(raw_data, BaseException):
+                    raise raw_data
                 places = raw_data.get("places", [])
 
                 for place in places:
@@ -401,9 +403,12 @@ async def update_activity_results(
         result = await db.execute(d7_query)
         d7_logs = result.scalars().all()
 
-        for log in d7_logs:
+        d7_results = await adlog_service.fetch_keywords_bulk([log.keyword for log in d7_logs])
+
+        for log, raw_data in zip(d7_logs, d7_results):
             try:
-                raw_data = await adlog_service.fetch_keyword_analysis(log.keyword)
+                if isinstance(raw_data, BaseException):
+                    raise raw_data
                 places = raw_data.get("places", [])
 
                 for place in places:
@@ -88,13 +88,15 @@ async def analyze_keyword(
             raise HTTPException(status_code=404, detail="검색 결과가 없습니다.")
 
         # 4. 크롤링 결과에 N1, N2, N3 계산하여 추가
+        # 파라미터는 루프 전에 한 번만 검증/스냅샷
+        prepared_params = formula_calculator.prepare(cached_params)
         places = []
         for idx, naver_place in enumerate(naver_places):
             rank = idx + 1
 
             # 파라미터가 있으면 자체 계산, 없으면 기본값
-            if cached_params and formula_calculator.can_calculate(cached_params):
-                indices = formula_calculator.calculate_all_indices(cached_params, rank)
+            if prepared_params is not None:
+                indices = formula_calculator.calculate_all_indices(prepared_params, rank)
             else:
                 indices = {"n1": 50.0, "n2": 50.0, "n3": 50.0}  # 기본값
 
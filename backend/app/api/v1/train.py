@@ -17,8 +17,8 @@ import logging
 
 from app.core.database import get_db
 from app.services.scheduler import get_training_status, place_scheduler
-from app.ml.trainer import keyword_trainer
-from app.ml.analyzer import model_analyzer
+# trainer/analyzer는 app.ml 지연 export로 첫 호출 시 로드 (API 프로세스 시작 시 scipy 로딩 방지)
+from app import ml
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/train", tags=["training"])
@@ -119,7 +119,7 @@ async def train_all(
     if sync:
         # 동기 실행
         try:
-            result = await keyword_trainer.train_all_keywords(db)
+            result = await ml.keyword_trainer.train_all_keywords(db)
 
             return BatchTrainingResultResponse(
                 success=result["success"],
@@ -178,7 +178,7 @@ async def train_keyword(
     logger.info(f"[Train API] Manual training requested for keyword: {keyword}")
 
     try:
-        result = await keyword_trainer.train_keyword(db, keyword)
+        result = await ml.keyword_trainer.train_keyword(db, keyword)
 
         return TrainingResultResponse(
             keyword=result["keyword"],
@@ -231,7 +231,7 @@ async def get_report(
     - 마지막 학습 시간
     """
     try:
-        report = await keyword_trainer.get_training_report(db)
+        report = await ml.keyword_trainer.get_training_report(db)
 
         return TrainingReportResponse(
             parameters=report["parameters"],
@@ -260,7 +260,7 @@ async def analyze_keyword_accuracy(
     - MAE, RMSE, R² 계산
     """
     try:
-        analysis = await model_analyzer.analyze_accuracy(db, keyword)
+        analysis = await ml.model_analyzer.analyze_accuracy(db, keyword)
 
         return AccuracyAnalysisResponse(
             keyword=analysis["keyword"],
@@ -294,7 +294,7 @@ async def get_accuracy_report(
     - 전체 통계 요약
     """
     try:
-        report = await model_analyzer.generate_report(db)
+        report = await ml.model_analyzer.generate_report(db)
 
         return AccuracyReportResponse(
             success=report["success"],
@@ -328,7 +328,7 @@ async def get_keyword_comparison(
     - 에러율 계산
     """
     try:
-        comparison = await model_analyzer.get_keyword_comparison(db, keyword, limit)
+        comparison = await ml.model_analyzer.get_keyword_comparison(db, keyword, limit)
 
         return comparison
 
@@ -8,7 +8,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 from typing import List, Optional
 import numpy as np
-from scipy import stats
 
 from app.models.schemas import (
     SubmitDataRequest,
@@ -131,6 +130,9 @@ def calculate_correlation(x: List[float], y: List[float]) -> tuple:
     x_clean = [p[0] for p in valid_pairs]
     y_clean = [p[1] for p in valid_pairs]
 
+    # scipy는 상관계수 계산 시에만 로드
+    from scipy import stats
+
     try:
         correlation, p_value = stats.pearsonr(x_clean, y_clean)
         return float(correlation), float(p_value)
@@ -13,6 +13,7 @@ import hashlib
 import json
 import logging
 import os
+import orjson
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -21,6 +22,11 @@ logger = logging.getLogger(__name__)
 CACHE_DIR = Path(__file__).parent.parent.parent / ".cache" / "adlog"
 
 
+def _dump_entry(entry: Dict[str, Any]) -> bytes:
+    """캐시 엔트리를 UTF-8 JSON 바이트로 직렬화 (orjson, 알 수 없는 타입은 str 처리)"""
+    return orjson.dumps(entry, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
 class PersistentCache:
     """파일 기반 영속 캐시 - 서버 재시작에도 캐시 유지"""
 
@@ -68,9 +74,9 @@ class PersistentCache:
                 return None
 
             try:
-                async with aiofiles.open(cache_path, 'r', encoding='utf-8') as f:
+                async with aiofiles.open(cache_path, 'rb') as f:
                     content = await f.read()
-                    entry = json.loads(content)
+                    entry = orjson.loads(content)
 
                 expires_at = datetime.fromisoformat(entry["expires_at"])
                 if datetime.now() > expires_at:
@@ -109,8 +115,8 @@ class PersistentCache:
 
         async with self._lock:
             try:
-                async with aiofiles.open(cache_path, 'w', encoding='utf-8') as f:
-                    await f.write(json.dumps(entry, ensure_ascii=False, default=str))
+                async with aiofiles.open(cache_path, 'wb') as f:
+                    await f.write(_dump_entry(entry))
                 self._stats["sets"] += 1
                 logger.info(f"ADLOG Cache SET: {key[:16]}... (TTL: {ttl}s)")
             except OSError as e:
@@ -150,9 +156,9 @@ class PersistentCache:
 
             for cache_file in self._cache_dir.glob("*.json"):
                 try:
-                    async with aiofiles.open(cache_file, 'r', encoding='utf-8') as f:
+                    async with aiofiles.open(cache_file, 'rb') as f:
                         content = await f.read()
-                        entry = json.loads(content)
+                        entry = orjson.loads(content)
 
                     expires_at = datetime.fromisoformat(entry["expires_at"])
                     if now > expires_at:
@@ -276,6 +282,14 @@ class RateLimiter:
             self._save_calls(calls)
             return True
 
+    async def release(self) -> None:
+        """마지막 호출 기록 반환 (acquire 후 실제 호출하지 않은 경우)"""
+        async with self._lock:
+            calls = self._load_calls()
+            if calls:
+                calls.remove(max(calls))
+                self._save_calls(calls)
+
     async def wait_if_needed(self) -> float:
         """필요시 대기 후 호출 기록"""
         async with self._lock:
@@ -6,6 +6,7 @@ from pydantic_settings import BaseSettings
 from pydantic import SecretStr
 from typing import Optional, List
 import os
+import re
 
 
 class Settings(BaseSettings):
@@ -93,12 +94,36 @@ class Settings(BaseSettings):
     # CORS Settings
     # ===========================================
     ALLOWED_ORIGINS: str = "http://localhost:3000,https://place-chi.vercel.app,https://place-analytics.vercel.app"
+    # Vercel 팀 slug - 설정 시 우리 프로젝트의 프리뷰 URL
+    # (place-chi-<hash>-<slug>.vercel.app, place-chi-git-<branch>-<slug>.vercel.app) 허용
+    VERCEL_TEAM_SLUG: str = ""
+    # origin 정규식 직접 지정 (fullmatch 기준, 비우면 allowed_origin_regex 기본 패턴 사용)
+    ALLOWED_ORIGIN_REGEX: str = ""
 
     @property
     def allowed_origins_list(self) -> List[str]:
         """Parse ALLOWED_ORIGINS to list"""
         return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
 
+    @property
+    def allowed_origin_regex(self) -> str:
+        """
+        CORS origin 정규식 (allow_credentials=True로 사용되므로 소유한 origin만 매칭)
+
+        로컬 개발 + Vercel 프로덕션(place-chi, place-analytics) URL,
+        VERCEL_TEAM_SLUG가 있으면 해당 팀의 프리뷰 URL까지 허용
+        """
+        if self.ALLOWED_ORIGIN_REGEX:
+            return self.ALLOWED_ORIGIN_REGEX
+
+        preview = ""
+        if self.VERCEL_TEAM_SLUG:
+            preview = rf"(-[a-z0-9-]+-{re.escape(self.VERCEL_TEAM_SLUG)})?"
+        return (
+            rf"https://place-(chi|analytics){preview}\.vercel\.app"
+            r"|http://(localhost|127\.0\.0\.1):(3000|5173|8080)"
+        )
+
     # ===========================================
     # Rate Limiting
     # ===========================================
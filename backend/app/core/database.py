@@ -1,4 +1,5 @@
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy import Integer, inspect, text
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.pool import NullPool
 from app.core.config import settings
@@ -55,6 +56,35 @@ async def get_db():
             await session.close()
 
 
+def _upgrade_legacy_schema(conn) -> None:
+    """
+    create_all이 변경하지 않는 기존 테이블 스키마 보정
+
+    - saved_keywords.last_crawled_at: 컬럼 추가 (인덱스는 db_maintenance에서 CONCURRENTLY로 생성)
+    - saved_keywords.is_active: integer → boolean (PostgreSQL 전용, 모델은 Boolean, 필터는 = true)
+    이미 보정된 DB에서는 컬럼 정보 조회만 하고 끝난다.
+    """
+    columns = {column["name"]: column for column in inspect(conn).get_columns("saved_keywords")}
+
+    if "last_crawled_at" not in columns:
+        if conn.dialect.name == "postgresql":
+            ddl = "ALTER TABLE saved_keywords ADD COLUMN IF NOT EXISTS last_crawled_at TIMESTAMP"
+        else:
+            ddl = "ALTER TABLE saved_keywords ADD COLUMN last_crawled_at DATETIME"
+        conn.execute(text(ddl))
+        logger.info("Added saved_keywords.last_crawled_at column")
+
+    if conn.dialect.name != "postgresql":
+        return
+
+    if isinstance(columns["is_active"]["type"], Integer):
+        conn.execute(text(
+            "ALTER TABLE saved_keywords "
+            "ALTER COLUMN is_active TYPE boolean USING is_active::boolean"
+        ))
+        logger.info("Converted saved_keywords.is_active from integer to boolean")
+
+
 async def init_db():
     """
     데이터베이스 초기화 - 테이블 생성
@@ -65,6 +95,9 @@ async def init_db():
     try:
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(_upgrade_legacy_schema)
+        # 기존 테이블의 누락 인덱스 생성/스냅샷 항목 이관은 시작 시 실행하지 않음
+        # (쓰기 차단 방지) - 배포 후 python -m app.core.db_maintenance 로 별도 실행
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.error(f"Database init failed: {e}")
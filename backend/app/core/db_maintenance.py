@@ -0,0 +1,150 @@
+"""
+Database Maintenance
+앱 시작(init_db)과 분리해서 한 번씩 실행하는 DB 작업
+
+- 기존 테이블에 누락된 인덱스 생성 (PostgreSQL은 CREATE INDEX CONCURRENTLY - 쓰기 차단 없음)
+  (init_db가 기존 테이블에 추가한 컬럼의 인덱스 포함, 예: ix_saved_keywords_last_crawled_at)
+- rank_data JSON만 있는 기존 스냅샷의 순위 항목 이관
+
+실행: python -m app.core.db_maintenance  (backend 디렉토리에서, 배포 후 1회)
+"""
+import asyncio
+import logging
+import re
+
+from sqlalchemy import select, text
+from sqlalchemy.orm import selectinload, Session
+from sqlalchemy.schema import CreateIndex
+
+from app.core.database import Base, engine
+
+logger = logging.getLogger(__name__)
+
+# CREATE [UNIQUE] INDEX → CREATE [UNIQUE] INDEX CONCURRENTLY
+_CREATE_INDEX_PREFIX = re.compile(r"^CREATE (UNIQUE )?INDEX ")
+
+
+def _concurrent_create_index_sql(index, dialect) -> str:
+    """CREATE INDEX CONCURRENTLY IF NOT EXISTS 문 생성 (PostgreSQL)"""
+    ddl = str(CreateIndex(index, if_not_exists=True).compile(dialect=dialect))
+    return _CREATE_INDEX_PREFIX.sub(r"CREATE \1INDEX CONCURRENTLY ", ddl, count=1)
+
+
+async def create_missing_indexes() -> int:
+    """
+    모델에 선언됐지만 DB에 없는 인덱스 생성
+
+    create_all은 이미 있는 테이블에 새 인덱스를 추가하지 않으므로 배포 후 별도로 실행한다.
+    인덱스마다 개별 실행하며, 하나가 실패해도 나머지는 계속 진행한다.
+
+    Returns:
+        실패한 인덱스 수
+    """
+    indexes = [index for table in Base.metadata.sorted_tables for index in table.indexes]
+    failed = 0
+
+    if engine.dialect.name != "postgresql":
+        for index in indexes:
+            try:
+                async with engine.begin() as conn:
+                    await conn.run_sync(lambda sync_conn: index.create(sync_conn, checkfirst=True))
+            except Exception as e:
+                failed += 1
+                logger.error(f"Index creation failed: {index.name}: {e}")
+        return failed
+
+    # CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없으므로 autocommit 연결 사용
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+        # 이전 실행이 중단돼 남은 INVALID 인덱스는 IF NOT EXISTS에 걸리므로 먼저 제거
+        names = [index.name for index in indexes]
+        invalid = (await conn.execute(
+            text(
+                "SELECT c.relname FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE NOT i.indisvalid AND c.relname = ANY(:names)"
+            ),
+            {"names": names},
+        )).scalars().all()
+        for name in invalid:
+            logger.warning(f"Dropping invalid index left by an interrupted build: {name}")
+            await conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}"'))
+
+        for index in indexes:
+            try:
+                await conn.execute(text(_concurrent_create_index_sql(index, conn.dialect)))
+            except Exception as e:
+                failed += 1
+                logger.error(f"Index creation failed: {index.name}: {e}")
+                # 실패한 CONCURRENTLY 빌드는 INVALID 인덱스를 남기므로 정리
+                await conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS "{index.name}"'))
+
+    return failed
+
+
+def _backfill_rank_snapshot_entries(conn, chunk_size: int = 200) -> None:
+    """
+    rank_data JSON만 있는 기존 스냅샷의 순위 항목을 정규화 테이블로 이관
+
+    항목이 없는 스냅샷만 대상으로 하므로 여러 번 실행해도 안전하다.
+    """
+    from app.models.place import KeywordRankSnapshot, KeywordRankSnapshotEntry
+
+    session = Session(bind=conn)
+    snapshot_ids = session.scalars(
+        select(KeywordRankSnapshot.id)
+        .where(~KeywordRankSnapshot.entries.any())
+        .order_by(KeywordRankSnapshot.id)
+    ).all()
+
+    migrated = 0
+    for start in range(0, len(snapshot_ids), chunk_size):
+        chunk = snapshot_ids[start:start + chunk_size]
+        # entries 컬렉션을 청크 단위 IN 쿼리 한 번으로 로드 (대입 시 스냅샷별 지연 로딩 방지)
+        snapshots = session.scalars(
+            select(KeywordRankSnapshot)
+            .where(KeywordRankSnapshot.id.in_(chunk))
+            .options(selectinload(KeywordRankSnapshot.entries))
+        ).all()
+        for snapshot in snapshots:
+            snapshot.entries = [
+                KeywordRankSnapshotEntry.from_rank_item(item)
+                for item in snapshot.rank_data or []
+                if item.get("rank") is not None
+            ]
+            migrated += bool(snapshot.entries)
+        session.flush()
+        session.expunge_all()
+
+    session.close()
+    if migrated:
+        logger.info(f"Backfilled rank entries for {migrated} keyword snapshots")
+
+
+async def backfill_rank_snapshot_entries() -> None:
+    """스냅샷 순위 항목 이관 (별도 트랜잭션)"""
+    async with engine.begin() as conn:
+        await conn.run_sync(_backfill_rank_snapshot_entries)
+
+
+async def main() -> int:
+    # Import models to register them with Base
+    import app.models  # noqa: F401
+
+    try:
+        failed = await create_missing_indexes()
+        await backfill_rank_snapshot_entries()
+    finally:
+        await engine.dispose()
+
+    if failed:
+        logger.error(f"DB maintenance finished with {failed} failed index builds")
+    else:
+        logger.info("DB maintenance finished")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    raise SystemExit(asyncio.run(main()))
@@ -1,11 +1,15 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from app.core.config import settings
 from app.core.database import init_db
 from app.api import api_router
 from app.services.scheduler import place_scheduler
+from app.services.naver_place import close_http_session
+from app.services.adlog_proxy import adlog_service
 import logging
+import re
 
 # 로깅 설정
 logging.basicConfig(
@@ -42,43 +46,40 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error stopping scheduler: {e}")
 
+    # 네이버 크롤링용 공유 HTTP 세션 종료
+    await close_http_session()
+    # ADLOG API용 공유 HTTP 클라이언트 종료
+    await adlog_service.aclose()
+
 
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="네이버 플레이스 순위 분석 및 시뮬레이션 API",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # 응답 직렬화는 orjson(네이티브)으로 처리 - 분석/시뮬레이션 응답의 중첩 리스트·실수가 많음
+    default_response_class=ORJSONResponse,
 )
 
 # CORS 설정 - 프로덕션 환경을 위해 명시적으로 설정
 # 주의: Vercel 프론트엔드에서 요청 시 정확한 origin이 필요
-default_origins = [
-    # 로컬 개발 환경
-    "http://localhost:3000",
-    "http://127.0.0.1:3000",
-    "http://localhost:5173",
-    "http://127.0.0.1:5173",
-    "http://localhost:8080",
-    "http://127.0.0.1:8080",
-    # 프로덕션 환경 - Vercel
-    "https://place-chi.vercel.app",
-    "https://place-analytics.vercel.app",
-    # Vercel Preview URLs (와일드카드 패턴은 지원 안됨, 필요시 추가)
-]
+# 로컬 개발 환경 + Vercel 프로덕션(+팀 프리뷰) URL은 정규식 한 번으로 매칭
+origin_regex = re.compile(settings.allowed_origin_regex)
 
-# 환경변수에서 추가 origins 가져오기
-env_origins = settings.allowed_origins_list
-origins = list(set(default_origins + env_origins))
-
-# 빈 문자열 제거
-origins = [o for o in origins if o and o.strip()]
+# 환경변수에서 추가 origins 가져오기 (정규식으로 이미 허용되는 origin과 빈 문자열 제외)
+origins = [
+    o.strip() for o in settings.allowed_origins_list
+    if o and o.strip() and not origin_regex.fullmatch(o.strip())
+]
 
-logger.info(f"CORS allowed origins: {origins}")
+logger.info(f"CORS allowed origin regex: {origin_regex.pattern}")
+logger.info(f"CORS allowed extra origins: {origins}")
 
 # CORS 미들웨어 - 가장 먼저 추가해야 함
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
+    allow_origin_regex=origin_regex.pattern,
     allow_credentials=True,
     allow_methods=["*"],  # 모든 HTTP 메서드 허용
     allow_headers=["*"],  # 모든 헤더 허용
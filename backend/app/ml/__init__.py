@@ -1,7 +1,33 @@
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# predictor는 가벼운 모듈이고 하위 모듈명과 이름이 같으므로 즉시 import
 from app.ml.predictor import predictor, PredictionService
-from app.ml.trainer import keyword_trainer, KeywordTrainer
-from app.ml.analyzer import model_analyzer, ModelAnalyzer
-from app.ml.correlation_analyzer import CorrelationAnalyzer, get_correlation_analyzer
+
+if TYPE_CHECKING:
+    from app.ml.trainer import keyword_trainer, KeywordTrainer
+    from app.ml.analyzer import model_analyzer, ModelAnalyzer
+    from app.ml.correlation_analyzer import CorrelationAnalyzer, get_correlation_analyzer
+
+# 하위 모듈은 처음 접근할 때 import (numpy/scipy 로딩을 실제 사용 시점까지 지연)
+_LAZY_EXPORTS = {
+    "keyword_trainer": "app.ml.trainer",
+    "KeywordTrainer": "app.ml.trainer",
+    "model_analyzer": "app.ml.analyzer",
+    "ModelAnalyzer": "app.ml.analyzer",
+    "CorrelationAnalyzer": "app.ml.correlation_analyzer",
+    "get_correlation_analyzer": "app.ml.correlation_analyzer",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "predictor", "PredictionService",
@@ -6,23 +6,61 @@
 2. 오차율 리포트 생성
 3. 키워드별 정확도 통계
 """
+import asyncio
+import heapq
 import logging
-from typing import Dict, Any, List, Optional
+from itertools import groupby
+from typing import Dict, Any, List, Optional, Sequence
 from datetime import datetime
 
 import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, distinct
+from sqlalchemy import Row, select, func, distinct
 
 from app.models.place import KeywordParameter, AdlogTrainingData
 from app.services.parameter_extractor import parameter_repository
+from app.services.formula_calculator import formula_calculator
 
 logger = logging.getLogger(__name__)
 
+# 리포트 생성 시 동시에 분석할 키워드 수 상한
+REPORT_CONCURRENCY = 16
+
+# 정확도 분석에 필요한 학습 데이터 컬럼 (ORM 객체 대신 Row 튜플로 조회)
+_ACCURACY_COLUMNS = (
+    AdlogTrainingData.rank,
+    AdlogTrainingData.index_n1,
+    AdlogTrainingData.index_n2,
+    AdlogTrainingData.index_n3,
+)
+
+# 정확도 분석 결과 캐시 최대 항목 수
+ACCURACY_CACHE_SIZE = 1024
+
 
 class ModelAnalyzer:
     """학습된 모델 정확도 분석"""
 
+    def __init__(self):
+        # (키워드, 최신 수집 시각, 데이터 수, 파라미터 갱신 시각) → 분석 결과
+        # 학습 데이터나 파라미터가 바뀌지 않았으면 재계산하지 않음
+        self._accuracy_cache: Dict[tuple, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _cache_key(params: KeywordParameter, latest_collected_at, row_count: int) -> tuple:
+        return (params.keyword, latest_collected_at, row_count, params.updated_at)
+
+    def _get_cached(self, key: tuple) -> Optional[Dict[str, Any]]:
+        return self._accuracy_cache.get(key)
+
+    def _set_cached(self, key: tuple, analysis: Dict[str, Any]) -> None:
+        if not analysis.get("success"):
+            return
+        if len(self._accuracy_cache) >= ACCURACY_CACHE_SIZE:
+            # 가장 오래된 항목 제거 (dict는 삽입 순서 유지)
+            self._accuracy_cache.pop(next(iter(self._accuracy_cache)))
+        self._accuracy_cache[key] = analysis
+
     async def analyze_accuracy(
         self,
         db: AsyncSession,
@@ -42,9 +80,6 @@ class ModelAnalyzer:
         """
         logger.info(f"Analyzing accuracy for keyword: {keyword}")
 
-        # 지연 import (순환 참조 방지)
-        from app.services.formula_calculator import formula_calculator
-
         # 1. 파라미터 조회
         params = await parameter_repository.get_by_keyword(db, keyword)
 
@@ -63,14 +98,49 @@ class ModelAnalyzer:
                 "is_reliable": False,
             }
 
-        # 2. 학습 데이터 조회
+        # 2. 학습 데이터 변경 여부 확인 (변경 없으면 캐시 반환)
         result = await db.execute(
-            select(AdlogTrainingData)
+            select(func.max(AdlogTrainingData.collected_at), func.count())
+            .where(AdlogTrainingData.keyword == keyword)
+        )
+        latest_collected_at, row_count = result.one()
+        cache_key = self._cache_key(params, latest_collected_at, row_count)
+
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+
+        # 3. 학습 데이터 조회
+        result = await db.execute(
+            select(*_ACCURACY_COLUMNS)
             .where(AdlogTrainingData.keyword == keyword)
             .order_by(AdlogTrainingData.collected_at.desc())
         )
-        training_data = result.scalars().all()
+        training_data = result.all()
+
+        analysis = self._analyze_rows(keyword, params, training_data)
+        self._set_cached(cache_key, analysis)
+        return analysis
+
+    def _analyze_rows(
+        self,
+        keyword: str,
+        params: KeywordParameter,
+        training_data: Sequence[Row],
+        analyzed_at: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        미리 조회한 학습 데이터로 정확도 분석 (DB 조회 없음)
+
+        Args:
+            keyword: 검색 키워드
+            params: 계산 가능한 키워드 파라미터
+            training_data: 해당 키워드의 학습 데이터 (rank, index_n1~n3 컬럼 Row)
+            analyzed_at: 분석 시각 ISO 문자열 (리포트에서 키워드별로 다시 만들지 않도록 전달)
 
+        Returns:
+            정확도 분석 결과
+        """
         if len(training_data) < 3:
             return {
                 "keyword": keyword,
@@ -78,42 +148,21 @@ class ModelAnalyzer:
                 "error": f"데이터 부족: {len(training_data)}개",
             }
 
-        # 3. 예측값 vs 실제값 비교
-        n1_actual = []
-        n1_predicted = []
-        n2_actual = []
-        n2_predicted = []
-        n3_actual = []
-        n3_predicted = []
-
-        for data in training_data:
-            if data.rank is None or data.rank <= 0:
-                continue
-
-            # 예측값 계산
-            indices = formula_calculator.calculate_all_indices(params, data.rank)
-
-            # N1 비교
-            if data.index_n1 is not None and indices["n1"] is not None:
-                n1_actual.append(data.index_n1)
-                n1_predicted.append(indices["n1"])
-
-            # N2 비교
-            if data.index_n2 is not None and indices["n2"] is not None:
-                n2_actual.append(data.index_n2)
-                n2_predicted.append(indices["n2"])
+        # 예측값 vs 실제값 비교 (유효 순위 전체를 한 번에 계산)
+        rows = [d for d in training_data if d.rank is not None and d.rank > 0]
+        ranks = np.array([d.rank for d in rows], dtype=np.float64)
+        n1_pred, n2_pred, n3_pred = formula_calculator.calculate_all_indices_vec(params, ranks)
 
-            # N3 비교
-            if data.index_n3 is not None and indices["n3"] is not None:
-                n3_actual.append(data.index_n3)
-                n3_predicted.append(indices["n3"])
+        n1_actual, n1_predicted = self._pair_actual(rows, "index_n1", n1_pred)
+        n2_actual, n2_predicted = self._pair_actual(rows, "index_n2", n2_pred)
+        n3_actual, n3_predicted = self._pair_actual(rows, "index_n3", n3_pred)
 
-        # 4. 통계 계산
+        # 통계 계산
         n1_stats = self._calculate_metrics(n1_actual, n1_predicted, "N1")
         n2_stats = self._calculate_metrics(n2_actual, n2_predicted, "N2")
         n3_stats = self._calculate_metrics(n3_actual, n3_predicted, "N3")
 
-        # 5. 전체 정확도 (N2 기준, 가장 중요)
+        # 전체 정확도 (N2 기준, 가장 중요)
         overall_accuracy = None
         if n2_stats and n2_stats.get("r_squared") is not None:
             overall_accuracy = round(n2_stats["r_squared"] * 100, 2)
@@ -127,9 +176,22 @@ class ModelAnalyzer:
             "n1_metrics": n1_stats,
             "n2_metrics": n2_stats,
             "n3_metrics": n3_stats,
-            "analyzed_at": datetime.utcnow().isoformat(),
+            "analyzed_at": analyzed_at or datetime.utcnow().isoformat(),
         }
 
+    @staticmethod
+    def _pair_actual(
+        rows: Sequence[Row],
+        column: str,
+        predicted: Optional[np.ndarray]
+    ) -> tuple:
+        """실제값이 있는 행만 골라 (실제값, 예측값) 배열 쌍 반환"""
+        if predicted is None:
+            return [], []
+        actual = np.array([getattr(d, column) for d in rows], dtype=np.float64)
+        mask = ~np.isnan(actual)
+        return actual[mask], predicted[mask]
+
     def _calculate_metrics(
         self,
         actual: List[float],
@@ -152,27 +214,35 @@ class ModelAnalyzer:
             return None
 
         try:
-            actual_arr = np.array(actual)
-            predicted_arr = np.array(predicted)
+            actual_arr = np.asarray(actual, dtype=np.float64)
+            predicted_arr = np.asarray(predicted, dtype=np.float64)
+            n = actual_arr.size
+
+            # 오차 배열을 한 번만 만들고 모든 지표에서 재사용
+            diff = np.subtract(actual_arr, predicted_arr)
+            abs_diff = np.abs(diff)
 
             # MAE (Mean Absolute Error)
-            mae = float(np.mean(np.abs(actual_arr - predicted_arr)))
+            mae = float(abs_diff.mean())
 
             # RMSE (Root Mean Squared Error)
-            rmse = float(np.sqrt(np.mean((actual_arr - predicted_arr) ** 2)))
+            ss_res = float(np.dot(diff, diff))
+            rmse = float(np.sqrt(ss_res / n))
 
             # R² (Coefficient of Determination)
-            ss_res = np.sum((actual_arr - predicted_arr) ** 2)
-            ss_tot = np.sum((actual_arr - np.mean(actual_arr)) ** 2)
+            ss_tot = float(actual_arr.var() * n)
             r_squared = float(1 - (ss_res / ss_tot)) if ss_tot > 0 else 0.0
 
             # MAPE (Mean Absolute Percentage Error)
-            # 0으로 나누는 것 방지
-            non_zero_mask = actual_arr != 0
-            if np.sum(non_zero_mask) > 0:
-                mape = float(np.mean(
-                    np.abs((actual_arr[non_zero_mask] - predicted_arr[non_zero_mask]) / actual_arr[non_zero_mask])
-                ) * 100)
+            # 0으로 나누는 것 방지 (실제값 0인 항목은 제외)
+            non_zero_count = np.count_nonzero(actual_arr)
+            if non_zero_count > 0:
+                ratios = np.divide(
+                    abs_diff, np.abs(actual_arr),
+                    out=np.zeros_like(abs_diff),
+                    where=actual_arr != 0
+                )
+                mape = float(ratios.sum() / non_zero_count * 100)
             else:
                 mape = None
 
@@ -222,39 +292,97 @@ class ModelAnalyzer:
                 "success": True,
                 "total_keywords": 0,
                 "message": "No reliable parameters to analyze",
-                "generated_at": datetime.utcnow().isoformat(),
+                "generated_at": start_time.isoformat(),
+            }
+
+        # 2. 계산 가능한 키워드만 한 번 걸러냄 (이후 단계에서는 재확인하지 않음)
+        usable_params = [p for p in reliable_params if formula_calculator.can_calculate(p)]
+
+        # 3. 키워드별 학습 데이터 변경 여부 확인 → 캐시에 없는 키워드만 다시 분석
+        data_versions = {}
+        if usable_params:
+            result = await db.execute(
+                select(
+                    AdlogTrainingData.keyword,
+                    func.max(AdlogTrainingData.collected_at),
+                    func.count(),
+                )
+                .where(AdlogTrainingData.keyword.in_([p.keyword for p in usable_params]))
+                .group_by(AdlogTrainingData.keyword)
+            )
+            data_versions = {keyword: (latest, count) for keyword, latest, count in result.all()}
+
+        cache_keys = {
+            p.keyword: self._cache_key(p, *data_versions.get(p.keyword, (None, 0)))
+            for p in usable_params
+        }
+        stale_keywords = [k for k, key in cache_keys.items() if self._get_cached(key) is None]
+
+        # 4. 캐시에 없는 키워드의 학습 데이터를 한 번에 조회 후 키워드별로 분류
+        rows_by_keyword = {}
+        if stale_keywords:
+            result = await db.execute(
+                select(AdlogTrainingData.keyword, *_ACCURACY_COLUMNS)
+                .where(AdlogTrainingData.keyword.in_(stale_keywords))
+                .order_by(AdlogTrainingData.keyword, AdlogTrainingData.collected_at.desc())
+            )
+            rows_by_keyword = {
+                keyword: list(rows)
+                for keyword, rows in groupby(result.all(), key=lambda d: d.keyword)
             }
 
-        # 2. 각 키워드 분석
+        # 5. 각 키워드 분석 (세마포어로 동시 실행 수 제한, 계산은 스레드에서)
+        sem = asyncio.Semaphore(REPORT_CONCURRENCY)
+        analyzed_at = start_time.isoformat()
+
+        async def _one(params: KeywordParameter) -> Dict[str, Any]:
+            cache_key = cache_keys[params.keyword]
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+            async with sem:
+                analysis = await asyncio.to_thread(
+                    self._analyze_rows,
+                    params.keyword,
+                    params,
+                    rows_by_keyword.get(params.keyword, []),
+                    analyzed_at,
+                )
+            self._set_cached(cache_key, analysis)
+            return analysis
+
+        analyses = await asyncio.gather(
+            *[_one(p) for p in usable_params],
+            return_exceptions=True,
+        )
+
         keyword_results = []
         total_r_squared = []
         total_mae = []
         total_rmse = []
 
-        for params in reliable_params:
-            try:
-                analysis = await self.analyze_accuracy(db, params.keyword)
-
-                if analysis["success"]:
-                    keyword_results.append({
-                        "keyword": params.keyword,
-                        "sample_count": analysis["sample_count"],
-                        "overall_accuracy_percent": analysis.get("overall_accuracy_percent"),
-                        "n2_r_squared": analysis["n2_metrics"]["r_squared"] if analysis.get("n2_metrics") else None,
-                    })
-
-                    if analysis.get("n2_metrics"):
-                        if analysis["n2_metrics"].get("r_squared") is not None:
-                            total_r_squared.append(analysis["n2_metrics"]["r_squared"])
-                        if analysis["n2_metrics"].get("mae") is not None:
-                            total_mae.append(analysis["n2_metrics"]["mae"])
-                        if analysis["n2_metrics"].get("rmse") is not None:
-                            total_rmse.append(analysis["n2_metrics"]["rmse"])
-
-            except Exception as e:
-                logger.error(f"[Analyzer] Error analyzing keyword '{params.keyword}': {str(e)}")
-
-        # 3. 전체 통계
+        for params, analysis in zip(usable_params, analyses):
+            if isinstance(analysis, Exception):
+                logger.error(f"[Analyzer] Error analyzing keyword '{params.keyword}': {str(analysis)}")
+                continue
+
+            if analysis["success"]:
+                keyword_results.append({
+                    "keyword": params.keyword,
+                    "sample_count": analysis["sample_count"],
+                    "overall_accuracy_percent": analysis.get("overall_accuracy_percent"),
+                    "n2_r_squared": analysis["n2_metrics"]["r_squared"] if analysis.get("n2_metrics") else None,
+                })
+
+                if analysis.get("n2_metrics"):
+                    if analysis["n2_metrics"].get("r_squared") is not None:
+                        total_r_squared.append(analysis["n2_metrics"]["r_squared"])
+                    if analysis["n2_metrics"].get("mae") is not None:
+                        total_mae.append(analysis["n2_metrics"]["mae"])
+                    if analysis["n2_metrics"].get("rmse") is not None:
+                        total_rmse.append(analysis["n2_metrics"]["rmse"])
+
+        # 6. 전체 통계
         end_time = datetime.utcnow()
         duration = (end_time - start_time).total_seconds()
 
@@ -268,9 +396,9 @@ class ModelAnalyzer:
                 "avg_rmse": round(np.mean(total_rmse), 4) if total_rmse else None,
                 "avg_accuracy_percent": round(np.mean(total_r_squared) * 100, 2) if total_r_squared else None,
             },
-            "keywords": sorted(keyword_results, key=lambda x: x.get("n2_r_squared") or 0, reverse=True)[:20],
+            "keywords": heapq.nlargest(20, keyword_results, key=lambda x: x.get("n2_r_squared") or 0),
             "duration_seconds": round(duration, 2),
-            "generated_at": datetime.utcnow().isoformat(),
+            "generated_at": end_time.isoformat(),
         }
 
         logger.info(
@@ -298,9 +426,6 @@ class ModelAnalyzer:
         Returns:
             비교 결과
         """
-        # 지연 import (순환 참조 방지)
-        from app.services.formula_calculator import formula_calculator
-
         # 1. 파라미터 조회
         params = await parameter_repository.get_by_keyword(db, keyword)
 
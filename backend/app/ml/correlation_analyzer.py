@@ -9,12 +9,14 @@ Correlation Analyzer
 - 유입수 → 순위 변화 패턴
 등을 분석합니다.
 """
+from collections import defaultdict
+from operator import attrgetter
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, date, timedelta
 from dataclasses import dataclass
 import numpy as np
-from scipy import stats
-from sqlalchemy import select, and_
+from scipy.special import stdtr
+from sqlalchemy import select, and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
@@ -22,8 +24,157 @@ from app.models.place import UserActivityLog
 
 logger = logging.getLogger(__name__)
 
+# 분석 대상 활동 유형 (컬럼명, 표시명)
+ACTIVITY_TYPES = (
+    ("blog_review_added", "블로그 리뷰"),
+    ("visit_review_added", "방문자 리뷰"),
+    ("save_added", "저장수"),
+    ("inflow_added", "유입수"),
+)
+
+
+# 순위/N3 변화 계산에 필요한 컬럼
+_CHANGE_COLUMNS = (
+    UserActivityLog.rank_before,
+    UserActivityLog.rank_after_1d,
+    UserActivityLog.rank_after_7d,
+    UserActivityLog.n3_before,
+    UserActivityLog.n3_after_1d,
+    UserActivityLog.n3_after_7d,
+)
+
+# 순위/N3 변화 컬럼을 한 번에 꺼내는 getter (모듈 로드 시 한 번만 생성)
+_change_getter = attrgetter(*(c.key for c in _CHANGE_COLUMNS))
+_amount_getter = attrgetter(*(field for field, _ in ACTIVITY_TYPES))
+
+
+def _change_block(logs: List[UserActivityLog]) -> np.ndarray:
+    """로그의 순위/N3 컬럼을 (로그 수, 6) float64 행렬로 추출 (None → NaN)"""
+    return np.array(
+        list(map(_change_getter, logs)), dtype=np.float64
+    ).reshape(-1, len(_CHANGE_COLUMNS))
+
+
+def _amount_block(logs: List[UserActivityLog]) -> np.ndarray:
+    """로그의 활동량 컬럼을 (로그 수, 활동 유형 수) float64 행렬로 추출"""
+    return np.array(
+        list(map(_amount_getter, logs)), dtype=np.float64
+    ).reshape(-1, len(ACTIVITY_TYPES))
+
+
+def _filter_changes(
+    amounts: np.ndarray,
+    rb: np.ndarray,
+    ra1: np.ndarray,
+    ra7: np.ndarray,
+    nb: np.ndarray,
+    na1: np.ndarray,
+    na7: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    활동 로그 배열에서 D+1/D+7 순위·N3 변화를 한 번에 계산
+
+    Returns:
+        (amounts_1d, rank_changes_1d, amounts_7d, rank_changes_7d, n3_changes_1d, n3_changes_7d)
+    """
+    has_rb = ~np.isnan(rb)
+    has_nb = ~np.isnan(nb)
+    mask_1d = has_rb & ~np.isnan(ra1)
+    mask_7d = has_rb & ~np.isnan(ra7)
+    mask_n3_1d = has_nb & ~np.isnan(na1)
+    mask_n3_7d = has_nb & ~np.isnan(na7)
+
+    return (
+        amounts[mask_1d],
+        rb[mask_1d] - ra1[mask_1d],  # 양수 = 상승
+        amounts[mask_7d],
+        rb[mask_7d] - ra7[mask_7d],
+        na1[mask_n3_1d] - nb[mask_n3_1d],
+        na7[mask_n3_7d] - nb[mask_n3_7d],
+    )
+
+
+def _pearson_fit_batch(
+    pairs: List[Tuple[np.ndarray, np.ndarray]],
+) -> List[Tuple[Optional[float], Optional[float], Optional[float], Optional[float]]]:
+    """
+    여러 (x, y) 쌍의 피어슨 상관계수·p-value와 단순 선형회귀 계수를 한 번에 계산
+
+    scipy pearsonr/linregress를 각각 호출하면 입력 검증과 사용하지 않는
+    통계량(표준오차 등) 계산이 반복되므로, 쌍들을 NaN으로 패딩한 2차원 배열로
+    쌓아 행 단위 합계로 닫힌 형태 계산을 하고 p-value도 t분포 CDF ufunc 한 번으로 구합니다.
 
-@dataclass
+    Returns:
+        쌍별 (corr, p_value, slope, intercept) - 계산 불가한 값은 None
+    """
+    k = len(pairs)
+    results: List[Tuple[Optional[float], Optional[float], Optional[float], Optional[float]]] = [
+        (None, None, None, None)
+    ] * k
+    if k == 0:
+        return results
+
+    xs = [np.asarray(x, dtype=np.float64) for x, _ in pairs]
+    ys = [np.asarray(y, dtype=np.float64) for _, y in pairs]
+    width = max(max(x.size for x in xs), 1)
+
+    X = np.full((k, width), np.nan)
+    Y = np.full((k, width), np.nan)
+    for i, (x, y) in enumerate(zip(xs, ys)):
+        # 길이가 다른 쌍은 계산하지 않음 (전부 NaN으로 남김)
+        if x.size == y.size:
+            X[i, :x.size] = x
+            Y[i, :y.size] = y
+
+    valid = ~np.isnan(X)
+    n = valid.sum(axis=1)
+    safe_n = np.maximum(n, 1)
+    mean_x = np.where(valid, X, 0.0).sum(axis=1) / safe_n
+    mean_y = np.where(valid, Y, 0.0).sum(axis=1) / safe_n
+
+    dx = np.where(valid, X - mean_x[:, None], 0.0)
+    dy = np.where(valid, Y - mean_y[:, None], 0.0)
+    sxx = np.einsum("ij,ij->i", dx, dx)
+    syy = np.einsum("ij,ij->i", dy, dy)
+    sxy = np.einsum("ij,ij->i", dx, dy)
+
+    # x가 모두 같으면 회귀/상관 모두 정의되지 않음
+    can_fit = (n >= 2) & (sxx > 0)
+    can_corr = can_fit & (n >= 3) & (syy > 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = sxy / sxx
+        intercept = mean_y - slope * mean_x
+        corr = np.clip(sxy / np.sqrt(sxx * syy), -1.0, 1.0)
+        t = corr * np.sqrt((n - 2) / (1.0 - corr * corr))
+
+    # |r| = 1이면 t가 무한대 → p-value 0
+    p_val = np.zeros(k)
+    finite = can_corr & np.isfinite(t)
+    if finite.any():
+        # 양측 검정: 2 * P(T <= -|t|), 자유도 n-2 (scipy.stats 분포 객체 대신 ufunc 사용)
+        p_val[finite] = stdtr(n[finite] - 2, -np.abs(t[finite])) * 2
+
+    for i in range(k):
+        if not can_fit[i]:
+            continue
+        if can_corr[i]:
+            results[i] = (float(corr[i]), float(p_val[i]), float(slope[i]), float(intercept[i]))
+        else:
+            results[i] = (None, None, float(slope[i]), float(intercept[i]))
+
+    return results
+
+
+def _pearson_fit(
+    x: np.ndarray,
+    y: np.ndarray,
+) -> Tuple[Optional[float], Optional[float], Optional[float], Optional[float]]:
+    """단일 (x, y) 쌍의 상관계수·p-value·회귀 계수 계산"""
+    return _pearson_fit_batch([(x, y)])[0]
+
+
+@dataclass(slots=True)
 class ActivityEffect:
     """활동 효과 데이터"""
     activity_type: str
@@ -55,7 +206,7 @@ class ActivityEffect:
     rank_7d_intercept: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class KeywordAnalysisResult:
     """키워드별 분석 결과"""
     keyword: str
@@ -98,48 +249,42 @@ class CorrelationAnalyzer:
         """
         since_date = date.today() - timedelta(days=days)
 
-        query = select(UserActivityLog).where(
-            and_(
-                UserActivityLog.activity_date >= since_date,
-                UserActivityLog.rank_before.isnot(None),
-            )
-        )
-
+        base_filter = [
+            UserActivityLog.activity_date >= since_date,
+            UserActivityLog.rank_before.isnot(None),
+        ]
         if keyword:
-            query = query.where(UserActivityLog.keyword == keyword)
-
-        result = await self.db.execute(query)
-        logs = result.scalars().all()
+            base_filter.append(UserActivityLog.keyword == keyword)
+
+        # 전체/D+1/D+7 샘플 수는 집계 쿼리로 조회
+        result = await self.db.execute(
+            select(
+                func.count(),
+                func.count(UserActivityLog.rank_after_1d),
+                func.count(UserActivityLog.rank_after_7d),
+            ).where(and_(*base_filter))
+        )
+        total_samples, samples_with_d1, samples_with_d7 = result.one()
 
-        if len(logs) < min_samples:
+        if total_samples < min_samples:
             return {
                 "success": False,
-                "error": f"분석을 위한 데이터가 부족합니다. 최소 {min_samples}개 필요, 현재 {len(logs)}개",
-                "sample_count": len(logs),
+                "error": f"분석을 위한 데이터가 부족합니다. 최소 {min_samples}개 필요, 현재 {total_samples}개",
+                "sample_count": total_samples,
             }
 
-        # 활동 유형별 분석
+        # 활동 유형별 분석 - 활동량 > 0 인 행의 필요한 컬럼만 조회
         effects = []
 
-        # 블로그 리뷰
-        blog_effect = self._analyze_activity(logs, "blog_review_added", "블로그 리뷰")
-        if blog_effect:
-            effects.append(blog_effect)
-
-        # 방문자 리뷰
-        visit_effect = self._analyze_activity(logs, "visit_review_added", "방문자 리뷰")
-        if visit_effect:
-            effects.append(visit_effect)
-
-        # 저장수
-        save_effect = self._analyze_activity(logs, "save_added", "저장수")
-        if save_effect:
-            effects.append(save_effect)
-
-        # 유입수
-        inflow_effect = self._analyze_activity(logs, "inflow_added", "유입수")
-        if inflow_effect:
-            effects.append(inflow_effect)
+        for field_name, activity_name in ACTIVITY_TYPES:
+            amount_column = getattr(UserActivityLog, field_name)
+            result = await self.db.execute(
+                select(amount_column, *_CHANGE_COLUMNS)
+                .where(and_(*base_filter, amount_column > 0))
+            )
+            effect = self._analyze_activity(result.all(), field_name, activity_name)
+            if effect:
+                effects.append(effect)
 
         # 최적 활동 찾기
         best_1d = self._find_best_activity(effects, "avg_rank_change_1d")
@@ -152,9 +297,9 @@ class CorrelationAnalyzer:
             "success": True,
             "keyword": keyword,
             "period_days": days,
-            "total_samples": len(logs),
-            "samples_with_d1": len([l for l in logs if l.rank_after_1d is not None]),
-            "samples_with_d7": len([l for l in logs if l.rank_after_7d is not None]),
+            "total_samples": total_samples,
+            "samples_with_d1": samples_with_d1,
+            "samples_with_d7": samples_with_d7,
             "effects": [self._effect_to_dict(e) for e in effects],
             "best_activity_1d": best_1d,
             "best_activity_7d": best_7d,
@@ -185,35 +330,28 @@ class CorrelationAnalyzer:
         result = await self.db.execute(query)
         logs = result.scalars().all()
 
-        # 키워드별 그룹핑
-        keyword_logs: Dict[str, List] = {}
-        for log in logs:
-            if log.keyword not in keyword_logs:
-                keyword_logs[log.keyword] = []
-            keyword_logs[log.keyword].append(log)
+        # 활동량/순위 변화 컬럼을 요청당 한 번만 행렬로 추출 (키워드별로는 행 인덱스로 슬라이스)
+        amounts = _amount_block(logs)
+        changes = _change_block(logs)
+
+        # 키워드별 그룹핑 (행 인덱스)
+        keyword_rows: Dict[str, List[int]] = defaultdict(list)
+        for i, log in enumerate(logs):
+            keyword_rows[log.keyword].append(i)
 
         results = []
-        for keyword, kw_logs in keyword_logs.items():
-            if len(kw_logs) < min_samples:
+        for keyword, rows in keyword_rows.items():
+            if len(rows) < min_samples:
                 continue
 
-            effects = []
-
-            blog_effect = self._analyze_activity(kw_logs, "blog_review_added", "블로그 리뷰")
-            if blog_effect:
-                effects.append(blog_effect)
-
-            visit_effect = self._analyze_activity(kw_logs, "visit_review_added", "방문자 리뷰")
-            if visit_effect:
-                effects.append(visit_effect)
-
-            save_effect = self._analyze_activity(kw_logs, "save_added", "저장수")
-            if save_effect:
-                effects.append(save_effect)
+            kw_amounts = amounts[rows]
+            kw_changes = changes[rows]
 
-            inflow_effect = self._analyze_activity(kw_logs, "inflow_added", "유입수")
-            if inflow_effect:
-                effects.append(inflow_effect)
+            effects = []
+            for col, (_, activity_name) in enumerate(ACTIVITY_TYPES):
+                effect = self._analyze_amounts(kw_amounts[:, col], kw_changes, activity_name)
+                if effect:
+                    effects.append(effect)
 
             if effects:
                 best_1d = self._find_best_activity(effects, "avg_rank_change_1d")
@@ -222,7 +360,7 @@ class CorrelationAnalyzer:
 
                 results.append(KeywordAnalysisResult(
                     keyword=keyword,
-                    sample_count=len(kw_logs),
+                    sample_count=len(rows),
                     activity_effects=effects,
                     best_activity_1d=best_1d,
                     best_activity_7d=best_7d,
@@ -264,106 +402,102 @@ class CorrelationAnalyzer:
         activity_name: str
     ) -> Optional[ActivityEffect]:
         """단일 활동 유형 분석"""
+        amounts_all = np.fromiter(
+            map(attrgetter(field_name), logs), dtype=np.float64, count=len(logs)
+        )
+        return self._analyze_amounts(amounts_all, _change_block(logs), activity_name)
 
-        # 해당 활동이 있는 로그만 필터링
-        active_logs = [l for l in logs if getattr(l, field_name) > 0]
+    def _analyze_amounts(
+        self,
+        amounts_all: np.ndarray,
+        changes: np.ndarray,
+        activity_name: str
+    ) -> Optional[ActivityEffect]:
+        """
+        활동량 열과 순위/N3 변화 행렬로 단일 활동 유형 분석
 
-        if len(active_logs) < 2:
+        Args:
+            amounts_all: 로그별 활동량 (로그 수,)
+            changes: _change_block 형식의 순위/N3 컬럼 행렬 (로그 수, 6)
+            activity_name: 활동 표시명
+        """
+        # 마스크로 활동이 있는 로그만 필터링
+        active = amounts_all > 0
+        sample_count = int(np.count_nonzero(active))
+
+        if sample_count < 2:
             return None
 
-        amounts = [getattr(l, field_name) for l in active_logs]
-        total_amount = sum(amounts)
-
-        # D+1 순위 변화 분석
-        rank_changes_1d = []
-        amounts_1d = []
-        for log in active_logs:
-            if log.rank_before is not None and log.rank_after_1d is not None:
-                change = log.rank_before - log.rank_after_1d  # 양수 = 상승
-                rank_changes_1d.append(change)
-                amounts_1d.append(getattr(log, field_name))
-
-        # D+7 순위 변화 분석
-        rank_changes_7d = []
-        amounts_7d = []
-        for log in active_logs:
-            if log.rank_before is not None and log.rank_after_7d is not None:
-                change = log.rank_before - log.rank_after_7d
-                rank_changes_7d.append(change)
-                amounts_7d.append(getattr(log, field_name))
-
-        # N3 변화 분석
-        n3_changes_1d = []
-        n3_changes_7d = []
-        for log in active_logs:
-            if log.n3_before is not None and log.n3_after_1d is not None:
-                n3_changes_1d.append(log.n3_after_1d - log.n3_before)
-            if log.n3_before is not None and log.n3_after_7d is not None:
-                n3_changes_7d.append(log.n3_after_7d - log.n3_before)
+        amounts = amounts_all[active]
+        total_amount = int(amounts.sum())
+
+        (
+            amounts_1d, rank_changes_1d,
+            amounts_7d, rank_changes_7d,
+            n3_changes_1d, n3_changes_7d,
+        ) = _filter_changes(amounts, *changes[active].T)
 
         effect = ActivityEffect(
             activity_type=activity_name,
-            sample_count=len(active_logs),
+            sample_count=sample_count,
             total_amount=total_amount,
         )
 
+        # 순위/N3 상관관계와 회귀분석을 한 번에 계산
+        pairs = {}
+        if amounts_1d.size >= 3:
+            pairs["rank_1d"] = (amounts_1d, rank_changes_1d)
+        if amounts_7d.size >= 3:
+            pairs["rank_7d"] = (amounts_7d, rank_changes_7d)
+        if n3_changes_1d.size >= 3:
+            pairs["n3_1d"] = (amounts_1d[:n3_changes_1d.size], n3_changes_1d)
+        if n3_changes_7d.size >= 3:
+            pairs["n3_7d"] = (amounts_7d[:n3_changes_7d.size], n3_changes_7d)
+
+        fits = dict(zip(pairs, self._correlate_and_fit_many(list(pairs.values()))))
+
         # D+1 상관관계 및 회귀분석
-        if len(amounts_1d) >= 3:
-            corr, p_val = self._safe_pearsonr(amounts_1d, rank_changes_1d)
+        if "rank_1d" in fits:
+            corr, p_val, slope, intercept = fits["rank_1d"]
             effect.correlation_rank_1d = corr
             effect.p_value_rank_1d = p_val
             effect.avg_rank_change_1d = np.mean(rank_changes_1d)
-
-            # 회귀분석
-            slope, intercept = self._linear_regression(amounts_1d, rank_changes_1d)
             effect.rank_1d_slope = slope
             effect.rank_1d_intercept = intercept
 
         # D+7 상관관계 및 회귀분석
-        if len(amounts_7d) >= 3:
-            corr, p_val = self._safe_pearsonr(amounts_7d, rank_changes_7d)
+        if "rank_7d" in fits:
+            corr, p_val, slope, intercept = fits["rank_7d"]
             effect.correlation_rank_7d = corr
             effect.p_value_rank_7d = p_val
             effect.avg_rank_change_7d = np.mean(rank_changes_7d)
-
-            slope, intercept = self._linear_regression(amounts_7d, rank_changes_7d)
             effect.rank_7d_slope = slope
             effect.rank_7d_intercept = intercept
 
         # N3 상관관계
-        if len(n3_changes_1d) >= 3:
-            corr, p_val = self._safe_pearsonr(amounts_1d[:len(n3_changes_1d)], n3_changes_1d)
+        if "n3_1d" in fits:
+            corr, p_val, _, _ = fits["n3_1d"]
             effect.correlation_n3_1d = corr
             effect.p_value_n3_1d = p_val
             effect.avg_n3_change_1d = np.mean(n3_changes_1d)
 
-        if len(n3_changes_7d) >= 3:
-            corr, p_val = self._safe_pearsonr(amounts_7d[:len(n3_changes_7d)], n3_changes_7d)
+        if "n3_7d" in fits:
+            corr, p_val, _, _ = fits["n3_7d"]
             effect.correlation_n3_7d = corr
             effect.p_value_n3_7d = p_val
             effect.avg_n3_change_7d = np.mean(n3_changes_7d)
 
         return effect
 
-    def _safe_pearsonr(self, x: List[float], y: List[float]) -> Tuple[Optional[float], Optional[float]]:
-        """안전한 피어슨 상관계수 계산"""
-        try:
-            if len(x) < 3 or len(y) < 3:
-                return None, None
-            corr, p_val = stats.pearsonr(x, y)
-            return round(corr, 4), round(p_val, 4)
-        except Exception:
-            return None, None
-
-    def _linear_regression(self, x: List[float], y: List[float]) -> Tuple[Optional[float], Optional[float]]:
-        """선형 회귀분석"""
-        try:
-            if len(x) < 2:
-                return None, None
-            slope, intercept, _, _, _ = stats.linregress(x, y)
-            return round(slope, 4), round(intercept, 4)
-        except Exception:
-            return None, None
+    def _correlate_and_fit_many(
+        self,
+        pairs: List[Tuple[np.ndarray, np.ndarray]]
+    ) -> List[Tuple[Optional[float], Optional[float], Optional[float], Optional[float]]]:
+        """여러 쌍의 상관계수, p-value, 회귀 기울기/절편을 한 번에 계산 (소수점 4자리)"""
+        return [
+            tuple(None if v is None else round(v, 4) for v in fit)
+            for fit in _pearson_fit_batch(pairs)
+        ]
 
     def _find_best_activity(
         self,
@@ -391,32 +525,38 @@ class CorrelationAnalyzer:
     ) -> str:
         """추천 문구 생성"""
         parts = []
+        by_type = {effect.activity_type: effect for effect in effects}
 
-        # 유의미한 상관관계 찾기
-        significant_effects = []
+        # 유의미한 상관관계 찾기 (p < 0.05, r > 0.3)
         for effect in effects:
-            if effect.p_value_rank_1d is not None and effect.p_value_rank_1d < 0.05:
-                if effect.correlation_rank_1d is not None and effect.correlation_rank_1d > 0.3:
-                    significant_effects.append((effect.activity_type, "1일 후", effect.correlation_rank_1d))
-            if effect.p_value_rank_7d is not None and effect.p_value_rank_7d < 0.05:
-                if effect.correlation_rank_7d is not None and effect.correlation_rank_7d > 0.3:
-                    significant_effects.append((effect.activity_type, "7일 후", effect.correlation_rank_7d))
-
-        if significant_effects:
-            for activity, period, corr in significant_effects:
-                parts.append(f"{activity}와 {period} 순위 상승 간에 유의미한 상관관계가 있습니다 (r={corr:.2f}).")
-
-        if best_1d:
-            for effect in effects:
-                if effect.activity_type == best_1d and effect.avg_rank_change_1d is not None:
-                    if effect.avg_rank_change_1d > 0:
-                        parts.append(f"단기적으로는 {best_1d} 활동이 평균 {effect.avg_rank_change_1d:.1f}순위 상승 효과를 보입니다.")
-
-        if best_7d and best_7d != best_1d:
-            for effect in effects:
-                if effect.activity_type == best_7d and effect.avg_rank_change_7d is not None:
-                    if effect.avg_rank_change_7d > 0:
-                        parts.append(f"장기적으로는 {best_7d} 활동이 평균 {effect.avg_rank_change_7d:.1f}순위 상승 효과를 보입니다.")
+            if (
+                effect.p_value_rank_1d is not None and effect.p_value_rank_1d < 0.05
+                and effect.correlation_rank_1d is not None and effect.correlation_rank_1d > 0.3
+            ):
+                parts.append(
+                    f"{effect.activity_type}와 1일 후 순위 상승 간에 유의미한 상관관계가 있습니다 "
+                    f"(r={effect.correlation_rank_1d:.2f})."
+                )
+            if (
+                effect.p_value_rank_7d is not None and effect.p_value_rank_7d < 0.05
+                and effect.correlation_rank_7d is not None and effect.correlation_rank_7d > 0.3
+            ):
+                parts.append(
+                    f"{effect.activity_type}와 7일 후 순위 상승 간에 유의미한 상관관계가 있습니다 "
+                    f"(r={effect.correlation_rank_7d:.2f})."
+                )
+
+        best_1d_effect = by_type.get(best_1d) if best_1d else None
+        if best_1d_effect is not None:
+            change = best_1d_effect.avg_rank_change_1d
+            if change is not None and change > 0:
+                parts.append(f"단기적으로는 {best_1d} 활동이 평균 {change:.1f}순위 상승 효과를 보입니다.")
+
+        best_7d_effect = by_type.get(best_7d) if best_7d and best_7d != best_1d else None
+        if best_7d_effect is not None:
+            change = best_7d_effect.avg_rank_change_7d
+            if change is not None and change > 0:
+                parts.append(f"장기적으로는 {best_7d} 활동이 평균 {change:.1f}순위 상승 효과를 보입니다.")
 
         if not parts:
             return "아직 충분한 데이터가 수집되지 않아 유의미한 패턴을 발견하지 못했습니다. 지속적인 활동 기록이 필요합니다."
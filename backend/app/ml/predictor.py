@@ -8,12 +8,23 @@ N3 = f(N1, N2) 공식 (2차 다항식 모델)
 공식:
 N3 = -0.288554 + 3.350482*N1 + 0.159362*N2 + 0.438085*N1*N2 - 3.715231*N1² - 0.851072*N2²
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
+# N3 2차 다항식 계수 (정확도 99.16%)
+N3_INTERCEPT = -0.288554
+N3_N1 = 3.350482
+N3_N2 = 0.159362
+N3_N1N2 = 0.438085
+N3_N1_SQ = -3.715231
+N3_N2_SQ = -0.851072
+
+
 def calculate_n3(n1: float, n2: float) -> float:
     """
     N1, N2로 N3 계산 (2차 다항식 모델)
@@ -31,23 +42,71 @@ def calculate_n3(n1: float, n2: float) -> float:
     n1_scaled = n1 / 100.0 if n1 > 1 else n1
     n2_scaled = n2 / 100.0 if n2 > 1 else n2
 
-    # 2차 다항식 공식 (정확도 99.16%)
-    n3 = (-0.288554
-          + 3.350482 * n1_scaled
-          + 0.159362 * n2_scaled
-          + 0.438085 * n1_scaled * n2_scaled
-          - 3.715231 * n1_scaled**2
-          - 0.851072 * n2_scaled**2)
+    # 2차 다항식 공식 (정확도 99.16%) - Horner 형태로 묶어 곱셈 횟수 축소
+    n3 = (N3_INTERCEPT
+          + n1_scaled * (N3_N1 + N3_N1_SQ * n1_scaled + N3_N1N2 * n2_scaled)
+          + n2_scaled * (N3_N2 + N3_N2_SQ * n2_scaled))
 
     # [백업] 기존 공식 (정확도 91.23%)
     # n3 = -0.255112 * n1_scaled - 0.137087 * n2_scaled + 0.932150 * n1_scaled * n2_scaled + 0.381767
 
-    # 0-1 범위로 클램프
-    n3 = max(0.0, min(1.0, n3))
+    # 0-1 범위로 클램프 (내장 max/min 호출 대신 비교문)
+    if n3 < 0.0:
+        n3 = 0.0
+    elif n3 > 1.0:
+        n3 = 1.0
 
     return n3
 
 
+def calculate_n3_array(n1: np.ndarray, n2: np.ndarray) -> np.ndarray:
+    """
+    calculate_n3의 배열 버전 (여러 업체의 N3를 한 번에 계산)
+
+    Args:
+        n1: 키워드지수 배열 (0-1 또는 0-100 스케일)
+        n2: 품질점수 배열 (0-1 또는 0-100 스케일)
+
+    Returns:
+        N3 종합경쟁력 배열 (0-1 스케일)
+    """
+    n1 = np.asarray(n1, dtype=np.float64)
+    n2 = np.asarray(n2, dtype=np.float64)
+    s1 = np.where(n1 > 1, n1 / 100.0, n1)
+    s2 = np.where(n2 > 1, n2 / 100.0, n2)
+
+    n3 = (N3_INTERCEPT
+          + s1 * (N3_N1 + N3_N1_SQ * s1 + N3_N1N2 * s2)
+          + s2 * (N3_N2 + N3_N2_SQ * s2))
+
+    # 계산 결과 배열에 그대로 클램프 (추가 배열 할당 없음, 스칼라 입력은 일반 clip)
+    return np.clip(n3, 0.0, 1.0, out=n3 if isinstance(n3, np.ndarray) else None)
+
+
+def n3_rank(
+    n1_arr: np.ndarray,
+    n2_arr: np.ndarray,
+    my_n1: float,
+    my_n2: float
+) -> Tuple[int, float]:
+    """
+    경쟁사 N3와 내 N3를 한 번의 배열 계산으로 구하고 N3 기준 순위 반환
+
+    Args:
+        n1_arr: 경쟁사 키워드지수 배열
+        n2_arr: 경쟁사 품질점수 배열
+        my_n1: 내 키워드지수
+        my_n2: 내 (예측) 품질점수
+
+    Returns:
+        (순위, 내 N3) - 순위는 내 N3보다 높은 경쟁사 수 + 1, N3는 0-1 스케일
+    """
+    # 내 값을 마지막 원소로 붙여 경쟁사와 같은 계산 경로로 한 번에 평가
+    n3 = calculate_n3_array(np.append(n1_arr, my_n1), np.append(n2_arr, my_n2))
+    my_n3 = n3[-1]
+    return int(np.count_nonzero(n3[:-1] > my_n3)) + 1, float(my_n3)
+
+
 def calculate_n3_change(n1: float, current_n2: float, predicted_n2: float) -> float:
     """
     N2 변화에 따른 N3 변화량 계산
@@ -85,14 +144,35 @@ class PredictionService:
         "visit_review": {"amount": 50, "unit": "개"},
     }
 
+    # 추천 전략 한글 타입명
+    TYPE_NAMES = {
+        "inflow": "유입수",
+        "blog_review": "블로그리뷰",
+        "visit_review": "방문자리뷰",
+    }
+
     def __init__(self):
         self.coefficients = self.DEFAULT_COEFFICIENTS.copy()
         self.model_loaded = False
+        self._refresh_coef_vec()
+
+    def _refresh_coef_vec(self):
+        """계수 dict → 고정 순서 계수 벡터 (simulate 벡터 연산용) 및 추천 전략 기본 효과"""
+        self._feature_order = tuple(self.coefficients)
+        self._coef_vec = np.fromiter(
+            self.coefficients.values(), dtype=np.float64, count=len(self._feature_order)
+        )
+        # 추천 효과는 계수와 고정 수량에만 의존하므로 계수 변경 시에만 다시 계산
+        self._base_effects = {
+            feature: self.calculate_effect(feature, info["amount"])
+            for feature, info in self.RECOMMENDED_AMOUNTS.items()
+        }
 
     def load_model(self, coefficients: Optional[Dict[str, float]] = None):
         """모델 계수 로드"""
         if coefficients:
             self.coefficients.update(coefficients)
+            self._refresh_coef_vec()
             self.model_loaded = True
             logger.info("Model coefficients loaded")
 
@@ -111,7 +191,10 @@ class PredictionService:
         Returns:
             예상 점수 증가량 (소수점 4자리)
         """
-        coef = self.coefficients.get(feature, 0)
+        coef = self.coefficients.get(feature)
+        if not coef or not amount:
+            return 0.0
+
         effect = amount * coef * 100  # N2 스케일 → 0-100 스케일
         return round(effect, 4)
 
@@ -134,17 +217,22 @@ class PredictionService:
         Returns:
             시뮬레이션 결과 (N2 및 N3 변화량 포함)
         """
-        effects = {}
-        total_effect = 0.0
-
-        for feature, amount in inputs.items():
-            if feature in self.coefficients and amount > 0:
-                effect = self.calculate_effect(feature, amount)
-                effects[feature] = {
-                    "amount": amount,
-                    "effect": effect
-                }
-                total_effect += effect
+        # 항목별 효과를 계수 벡터와 한 번에 계산 (N2 스케일 → 0-100 스케일)
+        amounts = np.fromiter(
+            (inputs.get(f, 0) for f in self._feature_order),
+            dtype=np.float64,
+            count=len(self._feature_order),
+        )
+        active = np.flatnonzero(amounts > 0)
+        eff_vec = amounts[active] * self._coef_vec[active] * 100.0
+        # 합계는 반올림 전 값으로 누적하고, 반올림은 출력 시 한 번만 수행
+        total_effect = float(eff_vec.sum())
+        rounded = np.round(eff_vec, 4)
+
+        effects = {
+            self._feature_order[i]: {"amount": inputs[self._feature_order[i]], "effect": float(eff)}
+            for i, eff in zip(active, rounded)
+        }
 
         predicted_score = round(current_score + total_effect, 4)
 
@@ -157,15 +245,17 @@ class PredictionService:
 
         # N1이 제공되면 N3 변화량도 계산
         if n1 is not None:
+            # 공식으로 계산한 현재 N3 (변화량 계산과 실제값이 없을 때 함께 사용)
+            current_n3_calc = calculate_n3(n1, current_score) * 100
+
             # 현재 N3: 실제 API 값이 있으면 사용, 없으면 공식으로 계산
             if current_n3_actual is not None:
                 current_n3 = current_n3_actual  # 실제 API 값 사용 (이미 0-100 스케일)
             else:
-                current_n3 = calculate_n3(n1, current_score) * 100  # 공식으로 계산
+                current_n3 = current_n3_calc
 
             # 예측 N3: N2 증가분에 비례하여 N3도 증가한다고 가정
             # N2 변화에 따른 N3 변화 비율 계산
-            current_n3_calc = calculate_n3(n1, current_score) * 100
             predicted_n3_calc = calculate_n3(n1, predicted_score) * 100
             n3_change_ratio = predicted_n3_calc - current_n3_calc
 
@@ -207,36 +297,29 @@ class PredictionService:
         recommendations = []
 
         for feature, info in self.RECOMMENDED_AMOUNTS.items():
-            amount = info["amount"]
-            unit = info["unit"]
-            effect = self.calculate_effect(feature, amount)
-
-            # 한글 타입명 변환
-            type_names = {
-                "inflow": "유입수",
-                "blog_review": "블로그리뷰",
-                "visit_review": "방문자리뷰",
-            }
-
-            rec = {
-                "type": type_names.get(feature, feature),
-                "amount": amount,
-                "unit": unit,
+            effect = self._base_effects[feature]
+
+            recommendations.append({
+                "type": self.TYPE_NAMES.get(feature, feature),
+                "amount": info["amount"],
+                "unit": info["unit"],
                 "effect": effect,
                 "description": f"N2(품질점수) +{effect:.2f}점 상승",
-            }
-
-            # N1이 있으면 N3 효과도 계산
-            if current_n1 is not None:
-                predicted_score = current_score + effect
-                current_n3 = calculate_n3(current_n1, current_score) * 100
-                predicted_n3 = calculate_n3(current_n1, predicted_score) * 100
-                n3_effect = predicted_n3 - current_n3
+            })
+
+        # N1이 있으면 N3 효과도 계산 (전략별 예측 N2를 한 번에 계산)
+        if current_n1 is not None and recommendations:
+            current_n3 = calculate_n3(current_n1, current_score) * 100
+            predicted_scores = np.array([current_score + rec["effect"] for rec in recommendations])
+            predicted_n3 = calculate_n3_array(
+                np.full(predicted_scores.shape, current_n1), predicted_scores
+            ) * 100
+
+            for rec, n3_value in zip(recommendations, predicted_n3):
+                n3_effect = float(n3_value) - current_n3
                 rec["n3_effect"] = round(n3_effect, 4)
                 rec["description"] = f"N3(경쟁력) +{n3_effect:.2f}점 상승 → 순위 상승 기대"
 
-            recommendations.append(rec)
-
         # 효과 높은 순으로 정렬
         recommendations.sort(key=lambda x: x["effect"], reverse=True)
 
@@ -261,32 +344,24 @@ class PredictionService:
         Returns:
             예상 순위
         """
+        competitor_scores = [c.get("scores", {}) for c in competitors]
+        quality_scores = np.fromiter(
+            (sc.get("quality_score", 0) for sc in competitor_scores),
+            dtype=np.float64,
+            count=len(competitor_scores),
+        )
+
         if use_n3 and my_n1 is not None:
-            # N3 기준으로 순위 계산
-            my_predicted_n3 = calculate_n3(my_n1, predicted_score) * 100
-
-            # 경쟁사들의 N3 점수 목록
-            competitor_n3_scores = []
-            for c in competitors:
-                c_n1 = c.get("scores", {}).get("keyword_score", 0)
-                c_n2 = c.get("scores", {}).get("quality_score", 0)
-                c_n3 = calculate_n3(c_n1, c_n2) * 100
-                competitor_n3_scores.append(c_n3)
-
-            # 내 예측 N3도 추가
-            all_n3_scores = competitor_n3_scores + [my_predicted_n3]
-
-            # 내림차순 정렬 후 순위 찾기
-            all_n3_scores.sort(reverse=True)
-            rank = all_n3_scores.index(my_predicted_n3) + 1
+            # N3 기준으로 순위 계산 (경쟁사/내 N3 계산과 순위 집계를 한 번에)
+            keyword_scores = np.fromiter(
+                (sc.get("keyword_score", 0) for sc in competitor_scores),
+                dtype=np.float64,
+                count=len(competitor_scores),
+            )
+            rank, _ = n3_rank(keyword_scores, quality_scores, my_n1, predicted_score)
         else:
-            # 기존 N2 기준 순위 계산
-            scores = [c.get("scores", {}).get("quality_score", 0) for c in competitors]
-            scores.append(predicted_score)
-
-            # 내림차순 정렬 후 순위 찾기
-            scores.sort(reverse=True)
-            rank = scores.index(predicted_score) + 1
+            # 기존 N2 기준 순위 계산 (내 점수보다 높은 경쟁사 수 + 1, 동점은 앞 순위)
+            rank = int(np.count_nonzero(quality_scores > predicted_score)) + 1
 
         return rank
 
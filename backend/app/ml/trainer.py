@@ -6,14 +6,16 @@
 2. 학습 결과를 keyword_parameters 테이블에 저장
 3. 정확도 검증 및 리포트 생성
 """
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
+import time
+from itertools import groupby
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from datetime import datetime
 
 import numpy as np
-from scipy import stats
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, distinct
+from sqlalchemy import Row, select, func, distinct, case
 
 from app.models.place import KeywordParameter, AdlogTrainingData
 from app.services.parameter_extractor import parameter_extractor, parameter_repository
@@ -24,6 +26,16 @@ logger = logging.getLogger(__name__)
 # 학습 설정
 MIN_SAMPLES = 10  # 최소 샘플 수
 MIN_R_SQUARED = 0.3  # 최소 결정계수
+TRAIN_CONCURRENCY = 8  # 일괄 학습 시 동시에 계산할 키워드 수
+TRAIN_FETCH_SIZE = 1000  # 일괄 학습 데이터 스트리밍 시 한 번에 가져올 행 수
+
+# 학습에 필요한 컬럼만 조회 (ORM 객체 생성 비용 절감)
+_TRAINING_COLUMNS = (
+    AdlogTrainingData.keyword,
+    AdlogTrainingData.rank,
+    AdlogTrainingData.index_n1,
+    AdlogTrainingData.index_n2,
+)
 
 
 class KeywordTrainer:
@@ -37,27 +49,29 @@ class KeywordTrainer:
         self,
         db: AsyncSession,
         keyword: str
-    ) -> List[AdlogTrainingData]:
+    ) -> Sequence[Row]:
         """
         특정 키워드의 학습 데이터 조회
 
+        학습에 필요한 컬럼만 Row로 조회 (ORM 객체 생성 생략)
+
         Args:
             db: DB 세션
             keyword: 검색 키워드
 
         Returns:
-            학습 데이터 리스트
+            학습 데이터 Row 리스트 (keyword, rank, index_n1, index_n2)
         """
         result = await db.execute(
-            select(AdlogTrainingData)
+            select(*_TRAINING_COLUMNS)
             .where(AdlogTrainingData.keyword == keyword)
             .order_by(AdlogTrainingData.collected_at.desc())
         )
-        return result.scalars().all()
+        return result.all()
 
     def calculate_n1_from_data(
         self,
-        training_data: List[AdlogTrainingData]
+        training_data: Sequence[Any]
     ) -> Dict[str, Optional[float]]:
         """
         학습 데이터에서 N1 파라미터 계산
@@ -65,30 +79,29 @@ class KeywordTrainer:
         N1은 키워드별 고정 상수 (평균값)
 
         Args:
-            training_data: 학습 데이터 리스트
+            training_data: 학습 데이터 (ORM 객체 또는 Row, 속성으로 접근)
 
         Returns:
             {"n1_constant": float, "n1_std": float}
         """
-        n1_values = []
-
-        for data in training_data:
-            if data.index_n1 is not None and data.index_n1 > 0:
-                n1_values.append(data.index_n1)
+        n1_values = np.fromiter(
+            (d.index_n1 for d in training_data if d.index_n1 is not None and d.index_n1 > 0),
+            dtype=np.float64,
+        )
 
-        if not n1_values:
+        if n1_values.size == 0:
             logger.warning("No valid N1 values found in training data")
             return {"n1_constant": None, "n1_std": None}
 
-        n1_constant = float(np.mean(n1_values))
-        n1_std = float(np.std(n1_values)) if len(n1_values) > 1 else 0.0
+        n1_constant = float(n1_values.mean())
+        n1_std = float(n1_values.std()) if n1_values.size > 1 else 0.0
 
-        logger.info(f"N1 calculated: mean={n1_constant:.4f}, std={n1_std:.4f}, count={len(n1_values)}")
+        logger.info(f"N1 calculated: mean={n1_constant:.4f}, std={n1_std:.4f}, count={n1_values.size}")
         return {"n1_constant": n1_constant, "n1_std": n1_std}
 
     def calculate_n2_from_data(
         self,
-        training_data: List[AdlogTrainingData]
+        training_data: Sequence[Any]
     ) -> Dict[str, Optional[float]]:
         """
         학습 데이터에서 N2 파라미터 계산 (선형 회귀)
@@ -96,31 +109,42 @@ class KeywordTrainer:
         N2 = slope * rank + intercept
 
         Args:
-            training_data: 학습 데이터 리스트
+            training_data: 학습 데이터 (ORM 객체 또는 Row, 속성으로 접근)
 
         Returns:
             {"n2_slope": float, "n2_intercept": float, "n2_r_squared": float}
         """
-        ranks = []
-        n2_values = []
-
-        for data in training_data:
-            if (
-                data.rank is not None and
-                data.index_n2 is not None and
-                data.rank > 0
-            ):
-                ranks.append(data.rank)
-                n2_values.append(data.index_n2)
+        # 유효한 (rank, N2) 쌍을 한 번의 순회로 배열에 적재한 뒤 열로 분리
+        pairs = np.fromiter(
+            (
+                (d.rank, d.index_n2) for d in training_data
+                if d.rank is not None and d.index_n2 is not None and d.rank > 0
+            ),
+            dtype=[("rank", np.float64), ("n2", np.float64)],
+        )
+        ranks = pairs["rank"]
+        n2_values = pairs["n2"]
 
         if len(ranks) < 3:
             logger.warning(f"Not enough data points for N2 regression: {len(ranks)} points")
             return {"n2_slope": None, "n2_intercept": None, "n2_r_squared": None}
 
         try:
-            # scipy.stats.linregress 사용
-            slope, intercept, r_value, p_value, std_err = stats.linregress(ranks, n2_values)
-            r_squared = r_value ** 2
+            # 최소제곱 닫힌 형태 (p-value/표준오차는 사용하지 않으므로 linregress 불필요)
+            x_mean = ranks.mean()
+            y_mean = n2_values.mean()
+            xm = ranks - x_mean
+            ym = n2_values - y_mean
+            sxx = float(xm @ xm)
+            syy = float(ym @ ym)
+            sxy = float(xm @ ym)
+
+            if sxx == 0.0:
+                raise ValueError("all rank values are identical")
+
+            slope = sxy / sxx
+            intercept = y_mean - slope * x_mean
+            r_squared = (sxy * sxy) / (sxx * syy) if syy > 0.0 else 0.0
 
             logger.info(
                 f"N2 regression: slope={slope:.6f}, intercept={intercept:.4f}, "
@@ -157,12 +181,40 @@ class KeywordTrainer:
         # 1. 학습 데이터 조회
         training_data = await self.get_training_data(db, keyword)
 
+        # 2~4. 파라미터 계산 및 신뢰성 판단
+        params, result = self._fit_keyword(keyword, training_data)
+
+        # 5. 파라미터 저장/업데이트
+        if params is not None:
+            await parameter_repository.save_or_update(db, params)
+            await db.commit()
+            logger.info(f"Keyword '{keyword}' training completed: reliable={params['is_reliable']}")
+
+        return result
+
+    def _fit_keyword(
+        self,
+        keyword: str,
+        training_data: Sequence[Any],
+        trained_at: Optional[datetime] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+        """
+        학습 데이터로 키워드 파라미터 계산 (DB 접근 없음)
+
+        Args:
+            keyword: 검색 키워드
+            training_data: 학습 데이터 (rank, index_n1, index_n2 속성 필요)
+            trained_at: 학습 시각 (일괄 학습 시 배치 전체가 같은 값을 공유, 없으면 현재 시각)
+
+        Returns:
+            (저장할 파라미터 또는 None, 학습 결과 딕셔너리)
+        """
         if len(training_data) < self.min_samples:
             logger.warning(
                 f"Not enough samples for keyword '{keyword}': "
                 f"{len(training_data)} < {self.min_samples}"
             )
-            return {
+            return None, {
                 "keyword": keyword,
                 "success": False,
                 "error": f"샘플 부족 ({len(training_data)} < {self.min_samples})",
@@ -184,7 +236,6 @@ class KeywordTrainer:
             len(training_data) >= self.min_samples
         )
 
-        # 5. 파라미터 저장/업데이트
         params = {
             "keyword": keyword,
             "n1_constant": n1_params["n1_constant"],
@@ -194,15 +245,10 @@ class KeywordTrainer:
             "n2_r_squared": n2_params["n2_r_squared"],
             "sample_count": len(training_data),
             "is_reliable": is_reliable,
-            "last_trained_at": datetime.utcnow(),
+            "last_trained_at": trained_at or datetime.utcnow(),
         }
 
-        await parameter_repository.save_or_update(db, params)
-        await db.commit()
-
-        logger.info(f"Keyword '{keyword}' training completed: reliable={is_reliable}")
-
-        return {
+        return params, {
             "keyword": keyword,
             "success": True,
             "is_reliable": is_reliable,
@@ -214,25 +260,6 @@ class KeywordTrainer:
             "n2_r_squared": n2_params["n2_r_squared"],
         }
 
-    async def get_all_keywords(
-        self,
-        db: AsyncSession
-    ) -> List[str]:
-        """
-        학습 데이터가 있는 모든 키워드 조회
-
-        Args:
-            db: DB 세션
-
-        Returns:
-            키워드 리스트
-        """
-        result = await db.execute(
-            select(distinct(AdlogTrainingData.keyword))
-        )
-        keywords = result.scalars().all()
-        return list(keywords)
-
     async def train_all_keywords(
         self,
         db: AsyncSession
@@ -247,10 +274,50 @@ class KeywordTrainer:
             학습 결과 요약
         """
         logger.info("[Trainer] Starting batch training for all keywords")
-        start_time = datetime.utcnow()
+        start_time = datetime.utcnow()  # 배치 전체의 학습 시각으로도 사용
+        started = time.monotonic()
+
+        # 1. 전체 학습 데이터를 키워드 순으로 스트리밍하면서 키워드 단위로 묶어 바로 계산 투입
+        #    (세마포어로 동시 계산 수를 제한해 메모리에는 진행 중인 키워드의 데이터만 유지)
+        sem = asyncio.Semaphore(TRAIN_CONCURRENCY)
+        tasks: List[Tuple[str, asyncio.Task]] = []
 
-        # 1. 모든 키워드 조회
-        keywords = await self.get_all_keywords(db)
+        async def _fit(keyword: str, rows: List[Row]) -> Tuple[Optional[Dict[str, Any]], Dict[str, Any]]:
+            try:
+                return await asyncio.to_thread(self._fit_keyword, keyword, rows, start_time)
+            finally:
+                sem.release()
+
+        async def _dispatch(keyword: str, rows: List[Row]) -> None:
+            await sem.acquire()
+            tasks.append((keyword, asyncio.create_task(_fit(keyword, rows))))
+
+        result = await db.stream(
+            select(*_TRAINING_COLUMNS)
+            .order_by(AdlogTrainingData.keyword, AdlogTrainingData.collected_at.desc())
+            .execution_options(yield_per=TRAIN_FETCH_SIZE)
+        )
+        current_keyword, current_rows = None, []
+        try:
+            async for partition in result.partitions():
+                for keyword, rows in groupby(partition, key=lambda d: d.keyword):
+                    if keyword != current_keyword:
+                        if current_rows:
+                            await _dispatch(current_keyword, current_rows)
+                        current_keyword, current_rows = keyword, []
+                    current_rows.extend(rows)
+            if current_rows:
+                await _dispatch(current_keyword, current_rows)
+        except BaseException:
+            # 스트리밍이 중단되면 이미 투입한 계산 태스크를 정리한 뒤 예외 전파
+            for _, task in tasks:
+                task.cancel()
+            await asyncio.gather(*[task for _, task in tasks], return_exceptions=True)
+            raise
+        finally:
+            await result.close()
+
+        keywords = [keyword for keyword, _ in tasks]
         total_count = len(keywords)
 
         logger.info(f"[Trainer] Found {total_count} keywords to train")
@@ -266,31 +333,52 @@ class KeywordTrainer:
                 "message": "No keywords to train",
             }
 
-        # 2. 각 키워드 학습
+        # 2. 남은 계산 완료 대기
+        fits = await asyncio.gather(
+            *[task for _, task in tasks],
+            return_exceptions=True,
+        )
+
+        # 3. 계산 결과 집계
         trained_count = 0
         skipped_count = 0
         reliable_count = 0
         errors = []
+        staged = []  # (키워드, 결과, 저장할 파라미터)
 
-        for keyword in keywords:
-            try:
-                result = await self.train_keyword(db, keyword)
-
-                if result["success"]:
-                    trained_count += 1
-                    if result.get("is_reliable"):
-                        reliable_count += 1
-                else:
-                    skipped_count += 1
+        for keyword, fit in zip(keywords, fits):
+            if isinstance(fit, Exception):
+                logger.error(f"[Trainer] Error training keyword '{keyword}': {str(fit)}")
+                errors.append({"keyword": keyword, "error": str(fit)})
+                skipped_count += 1
+                continue
 
-            except Exception as e:
-                logger.error(f"[Trainer] Error training keyword '{keyword}': {str(e)}")
-                errors.append({"keyword": keyword, "error": str(e)})
+            params, fit_result = fit
+            if params is not None:
+                staged.append((keyword, fit_result, params))
+            else:
                 skipped_count += 1
 
-        # 3. 결과 요약
+        # 4. 학습된 파라미터를 한 번에 저장하고 한 번만 커밋
+        if staged:
+            try:
+                await parameter_repository.save_or_update_many(db, [p for _, _, p in staged])
+                await db.commit()
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"[Trainer] Error saving trained parameters: {str(e)}")
+                errors.extend({"keyword": keyword, "error": str(e)} for keyword, _, _ in staged)
+                skipped_count += len(staged)
+                staged = []
+
+        for _, fit_result, _ in staged:
+            trained_count += 1
+            if fit_result.get("is_reliable"):
+                reliable_count += 1
+
+        # 5. 결과 요약
+        duration = time.monotonic() - started
         end_time = datetime.utcnow()
-        duration = (end_time - start_time).total_seconds()
 
         result = {
             "success": True,
@@ -329,45 +417,30 @@ class KeywordTrainer:
         Returns:
             학습 리포트 딕셔너리
         """
-        # 1. 키워드 파라미터 통계
-        total_result = await db.execute(
-            select(func.count(KeywordParameter.id))
-        )
-        total_keywords = total_result.scalar() or 0
-
-        reliable_result = await db.execute(
-            select(func.count(KeywordParameter.id))
-            .where(KeywordParameter.is_reliable.is_(True))
-        )
-        reliable_keywords = reliable_result.scalar() or 0
-
-        avg_r2_result = await db.execute(
-            select(func.avg(KeywordParameter.n2_r_squared))
-            .where(KeywordParameter.n2_r_squared.isnot(None))
-        )
-        avg_r_squared = avg_r2_result.scalar()
-
-        avg_sample_result = await db.execute(
-            select(func.avg(KeywordParameter.sample_count))
+        # 1. 키워드 파라미터 통계 + 최근 학습 시간 (집계 쿼리 한 번)
+        # AVG는 NULL을 제외하므로 n2_r_squared 평균에 별도 필터 불필요
+        param_stats = await db.execute(
+            select(
+                func.count(KeywordParameter.id),
+                func.sum(case((KeywordParameter.is_reliable.is_(True), 1), else_=0)),
+                func.avg(KeywordParameter.n2_r_squared),
+                func.avg(KeywordParameter.sample_count),
+                func.max(KeywordParameter.last_trained_at),
+            )
         )
-        avg_sample_count = avg_sample_result.scalar() or 0
+        total_keywords, reliable_keywords, avg_r_squared, avg_sample_count, last_trained_at = param_stats.one()
+        total_keywords = total_keywords or 0
+        reliable_keywords = reliable_keywords or 0
+        avg_sample_count = avg_sample_count or 0
 
         # 2. 학습 데이터 통계
-        training_data_result = await db.execute(
-            select(func.count(AdlogTrainingData.id))
-        )
-        total_training_data = training_data_result.scalar() or 0
-
-        unique_keywords_result = await db.execute(
-            select(func.count(distinct(AdlogTrainingData.keyword)))
-        )
-        unique_keywords = unique_keywords_result.scalar() or 0
-
-        # 3. 최근 학습 시간
-        last_trained_result = await db.execute(
-            select(func.max(KeywordParameter.last_trained_at))
+        data_stats = await db.execute(
+            select(
+                func.count(AdlogTrainingData.id),
+                func.count(distinct(AdlogTrainingData.keyword)),
+            )
         )
-        last_trained_at = last_trained_result.scalar()
+        total_training_data, unique_keywords = data_stats.one()
 
         return {
             "parameters": {
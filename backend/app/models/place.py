@@ -1,8 +1,12 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, Text, ForeignKey, JSON, Boolean, Date
+from sqlalchemy import Column, Integer, SmallInteger, String, DateTime, Float, Text, ForeignKey, JSON, Boolean, Date, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from datetime import datetime, date
 from app.core.database import Base
 
+# PostgreSQL에서는 JSONB(바이너리 저장, 인덱싱/포함 연산 지원), 그 외 DB는 JSON
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Place(Base):
     """플레이스 정보 캐시 테이블"""
@@ -28,9 +32,9 @@ class Place(Base):
 
     # 추가 정보
     description = Column(Text, nullable=True)
-    menu_info = Column(JSON, nullable=True)  # [{"name": "메뉴명", "price": "가격"}]
-    keywords = Column(JSON, nullable=True)  # ["키워드1", "키워드2"]
-    business_hours = Column(JSON, nullable=True)
+    menu_info = Column(JSONType, nullable=True)  # [{"name": "메뉴명", "price": "가격"}]
+    keywords = Column(JSONType, nullable=True)  # ["키워드1", "키워드2"]
+    business_hours = Column(JSONType, nullable=True)
     thumbnail_url = Column(String(500), nullable=True)
 
     # 타임스탬프
@@ -49,8 +53,8 @@ class PlaceSearch(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     place_id = Column(String(50), index=True, nullable=False)
     keyword = Column(String(255), nullable=False)
-    rank = Column(Integer, nullable=True)  # 순위 (없으면 300위 밖)
-    total_results = Column(Integer, nullable=True)
+    rank = Column(SmallInteger, nullable=True)  # 순위 (없으면 300위 밖)
+    total_results = Column(SmallInteger, nullable=True)
     searched_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
@@ -60,12 +64,16 @@ class PlaceSearch(Base):
 class RankHistory(Base):
     """순위 히스토리 테이블"""
     __tablename__ = "rank_history"
+    __table_args__ = (
+        # 업체+키워드별 기간 조회 및 checked_at 정렬
+        Index("ix_rank_history_place_keyword_checked", "place_id", "keyword", "checked_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     place_id = Column(String(50), ForeignKey("places.place_id"), nullable=False)
     keyword = Column(String(255), nullable=False, index=True)
-    rank = Column(Integer, nullable=True)
-    total_results = Column(Integer, nullable=True)
+    rank = Column(SmallInteger, nullable=True)
+    total_results = Column(SmallInteger, nullable=True)
 
     # 일별 스냅샷 데이터
     visitor_review_count = Column(Integer, default=0)
@@ -82,20 +90,26 @@ class SavedKeyword(Base):
     """저장된 키워드 (순위 추적용)"""
     __tablename__ = "saved_keywords"
 
+    __table_args__ = (
+        # 사용자별 업체+키워드 중복 저장 방지
+        UniqueConstraint("user_id", "place_id", "keyword", name="uq_saved_keywords_user_place_keyword"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     place_id = Column(String(50), nullable=False, index=True)
     place_name = Column(String(255), nullable=True)
     keyword = Column(String(255), nullable=False)
-    last_rank = Column(Integer, nullable=True)
-    best_rank = Column(Integer, nullable=True)
+    last_rank = Column(SmallInteger, nullable=True)
+    best_rank = Column(SmallInteger, nullable=True)
 
     # 플레이스 정보
     visitor_review_count = Column(Integer, default=0)
     blog_review_count = Column(Integer, default=0)
     place_score = Column(Float, nullable=True)
 
-    is_active = Column(Integer, default=True)  # 활성화 여부
+    is_active = Column(Boolean, default=True)  # 활성화 여부
+    last_crawled_at = Column(DateTime, nullable=True, index=True)  # 마지막 자동 크롤링 시간
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -106,9 +120,13 @@ class SavedKeyword(Base):
 class PlaceStats(Base):
     """플레이스 일별 통계 (리뷰 수, 저장 수 변화 추적)"""
     __tablename__ = "place_stats"
+    __table_args__ = (
+        # 업체별 날짜 조회 및 기간 스캔 (place_id 단독 조회도 처리)
+        Index("ix_place_stats_place_date", "place_id", "date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    place_id = Column(String(50), nullable=False, index=True)
+    place_id = Column(String(50), nullable=False)
     place_name = Column(String(255), nullable=True)
 
     # 일별 스냅샷 데이터
@@ -129,7 +147,7 @@ class TrackedPlace(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     place_id = Column(String(50), nullable=False, index=True)
     place_name = Column(String(255), nullable=True)
-    keywords = Column(JSON, nullable=True)  # ["키워드1", "키워드2"] - 순위 추적할 키워드들
+    keywords = Column(JSONType, nullable=True)  # ["키워드1", "키워드2"] - 순위 추적할 키워드들
     is_active = Column(Integer, default=1)  # 1: 활성, 0: 비활성
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -176,23 +194,82 @@ class KeywordSearchLog(Base):
 class KeywordRankSnapshot(Base):
     """키워드별 순위 스냅샷 (누적 데이터 분석용)"""
     __tablename__ = "keyword_rank_snapshots"
+    __table_args__ = (
+        # 키워드별 기간 조회 및 snapshot_at 정렬 (keyword 단독 조회도 처리)
+        Index("ix_keyword_rank_snapshots_keyword_snapshot", "keyword", "snapshot_at"),
+        # 키워드 없는 기간 스캔 - 추가 전용 테이블이라 PostgreSQL에서는 BRIN (그 외 DB는 일반 인덱스)
+        Index(
+            "ix_keyword_rank_snapshots_snapshot_brin", "snapshot_at",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    keyword = Column(String(255), nullable=False, index=True)
+    keyword = Column(String(255), nullable=False)
 
     # 순위 데이터 (JSON으로 상위 50개 저장)
     # [{"rank": 1, "place_id": "123", "name": "업체명", "visitor_review_count": 100, ...}, ...]
-    rank_data = Column(JSON, nullable=True)
-    total_places = Column(Integer, default=0)
+    rank_data = Column(JSONType, nullable=True)
+    total_places = Column(SmallInteger, default=0)
 
     # 스냅샷 시간
-    snapshot_at = Column(DateTime, default=datetime.utcnow, index=True)
+    snapshot_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    entries = relationship("KeywordRankSnapshotEntry", back_populates="snapshot", cascade="all, delete-orphan")
+
+
+class KeywordRankSnapshotEntry(Base):
+    """
+    키워드 순위 스냅샷의 개별 순위 항목 (rank_data 정규화)
+    - 특정 플레이스의 순위 추이를 JSON 전체를 읽지 않고 인덱스로 조회
+    """
+    __tablename__ = "keyword_rank_snapshot_entries"
+    __table_args__ = (
+        # 스냅샷별 순위순 조회
+        Index("ix_keyword_rank_snapshot_entries_snapshot_rank", "snapshot_id", "rank"),
+        # 플레이스별 스냅샷 순위 조회
+        Index("ix_keyword_rank_snapshot_entries_place_snapshot", "place_id", "snapshot_id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    snapshot_id = Column(Integer, ForeignKey("keyword_rank_snapshots.id", ondelete="CASCADE"), nullable=False)
+
+    rank = Column(SmallInteger, nullable=False)
+    place_id = Column(String(50), nullable=True)
+    name = Column(String(255), nullable=True)
+    category = Column(String(255), nullable=True)
+    visitor_review_count = Column(Integer, default=0)
+    blog_review_count = Column(Integer, default=0)
+    save_count = Column(Integer, default=0)
+
+    # Relationships
+    snapshot = relationship("KeywordRankSnapshot", back_populates="entries")
+
+    @classmethod
+    def from_rank_item(cls, item: dict) -> "KeywordRankSnapshotEntry":
+        """rank_data 항목 → 순위 항목"""
+        place_id = item.get("place_id")
+        return cls(
+            rank=item.get("rank"),
+            place_id=str(place_id) if place_id is not None else None,
+            name=item.get("name"),
+            category=item.get("category"),
+            visitor_review_count=item.get("visitor_review_count", 0),
+            blog_review_count=item.get("blog_review_count", 0),
+            save_count=item.get("save_count", 0),
+        )
 
 
 class PlaceSaveTracker(Base):
     """플레이스 저장 체크 - 키워드별 플레이스 저장수 추적"""
     __tablename__ = "place_save_trackers"
 
+    __table_args__ = (
+        # 업체+키워드 조합당 트래커 하나 (등록 API의 중복 검사 기준과 동일)
+        UniqueConstraint("place_id", "keyword", name="uq_place_save_trackers_place_keyword"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
 
@@ -208,7 +285,7 @@ class PlaceSaveTracker(Base):
     group_name = Column(String(100), default="기본")
 
     # 최신 데이터
-    current_rank = Column(Integer, nullable=True)  # 현재 순위
+    current_rank = Column(SmallInteger, nullable=True)  # 현재 순위
     current_save_count = Column(Integer, default=0)  # 현재 저장수
     visitor_review_count = Column(Integer, default=0)
     blog_review_count = Column(Integer, default=0)
@@ -231,24 +308,33 @@ class PlaceSaveTracker(Base):
 class PlaceSaveHistory(Base):
     """플레이스 저장수 히스토리 (주간 자동 기록)"""
     __tablename__ = "place_save_history"
+    __table_args__ = (
+        # 트래커별 기간 조회 및 recorded_at 정렬
+        Index("ix_place_save_history_tracker_recorded", "tracker_id", "recorded_at"),
+        # 최근 N일 전체 집계 - 추가 전용 테이블이라 PostgreSQL에서는 BRIN (그 외 DB는 일반 인덱스)
+        Index(
+            "ix_place_save_history_recorded_brin", "recorded_at",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     tracker_id = Column(Integer, ForeignKey("place_save_trackers.id"), nullable=False)
 
     # 기록 데이터
-    rank = Column(Integer, nullable=True)
+    rank = Column(SmallInteger, nullable=True)
     save_count = Column(Integer, default=0)
     visitor_review_count = Column(Integer, default=0)
     blog_review_count = Column(Integer, default=0)
 
     # 변화량 (이전 기록 대비)
-    rank_change = Column(Integer, nullable=True)  # 양수면 순위 상승
+    rank_change = Column(SmallInteger, nullable=True)  # 양수면 순위 상승
     save_change = Column(Integer, nullable=True)  # 저장수 변화
     visitor_review_change = Column(Integer, nullable=True)
     blog_review_change = Column(Integer, nullable=True)
 
     # 기록 시간
-    recorded_at = Column(DateTime, default=datetime.utcnow, index=True)
+    recorded_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
     tracker = relationship("PlaceSaveTracker", back_populates="history")
@@ -261,19 +347,28 @@ class AdlogTrainingData(Base):
     - N1, N2, N3, V(방문자리뷰), B(블로그리뷰), S(저장수) 등 저장
     """
     __tablename__ = "adlog_training_data"
+    __table_args__ = (
+        # 키워드별 학습 데이터 조회 및 collected_at 정렬 (keyword 단독 조회도 처리)
+        Index("ix_adlog_training_data_keyword_collected", "keyword", "collected_at"),
+        # 수집 시각 기간 스캔 - 추가 전용 테이블이라 PostgreSQL에서는 BRIN (그 외 DB는 일반 인덱스)
+        Index(
+            "ix_adlog_training_data_collected_brin", "collected_at",
+            postgresql_using="brin", postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
     # 검색 키워드
-    keyword = Column(String(255), nullable=False, index=True)
+    keyword = Column(String(255), nullable=False)
 
     # 플레이스 정보
     place_id = Column(String(50), nullable=False, index=True)
     place_name = Column(String(255), nullable=True)
 
     # 순위 정보
-    rank = Column(Integer, nullable=True, index=True)
-    rank_change = Column(Integer, nullable=True)  # 순위 변동
+    rank = Column(SmallInteger, nullable=True, index=True)
+    rank_change = Column(SmallInteger, nullable=True)  # 순위 변동
 
     # ADLOG 지수 (N1, N2, N3)
     index_n1 = Column(Float, default=0)  # place_index1
@@ -287,7 +382,7 @@ class AdlogTrainingData(Base):
     save_count = Column(Integer, default=0)            # S: 저장 수
 
     # 수집 시간
-    collected_at = Column(DateTime, default=datetime.utcnow, index=True)
+    collected_at = Column(DateTime, default=datetime.utcnow)
 
     # 만료일 (30일 후 삭제 대상)
     expires_at = Column(DateTime, nullable=False, index=True)
@@ -314,14 +409,12 @@ class UserInputData(Base):
 
     # 사용자 입력 데이터
     inflow = Column(Integer, nullable=False)  # 유입수
-    # reservation 컬럼은 deprecated (하위 호환성을 위해 유지하되 사용하지 않음)
-    reservation = Column(Integer, nullable=True, default=0)  # deprecated
 
     # ADLOG에서 가져온 값
     n1 = Column(Float, nullable=True)  # 키워드 지수
     n2 = Column(Float, nullable=True)  # 품질 점수
     n3 = Column(Float, nullable=True)  # 종합 경쟁력
-    rank = Column(Integer, nullable=True)  # 현재 순위
+    rank = Column(SmallInteger, nullable=True)  # 현재 순위
 
     # 메트릭스 (ADLOG에서 가져온 값)
     visitor_review_count = Column(Integer, default=0)
@@ -394,18 +487,18 @@ class UserActivityLog(Base):
     inflow_added = Column(Integer, default=0)  # 증가한 유입수
 
     # 당시 순위/지수 스냅샷
-    rank_before = Column(Integer, nullable=True)
+    rank_before = Column(SmallInteger, nullable=True)
     n1_before = Column(Float, nullable=True)
     n2_before = Column(Float, nullable=True)
     n3_before = Column(Float, nullable=True)
 
     # D+1 결과 (다음날 업데이트)
-    rank_after_1d = Column(Integer, nullable=True)
+    rank_after_1d = Column(SmallInteger, nullable=True)
     n3_after_1d = Column(Float, nullable=True)
     measured_at_1d = Column(DateTime, nullable=True)
 
     # D+7 결과 (7일 후 업데이트)
-    rank_after_7d = Column(Integer, nullable=True)
+    rank_after_7d = Column(SmallInteger, nullable=True)
     n3_after_7d = Column(Float, nullable=True)
     measured_at_7d = Column(DateTime, nullable=True)
 
@@ -2,12 +2,16 @@
 Pydantic Schemas
 API 요청/응답 스키마 정의
 """
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import re
 
 
+# 키워드 허용 문자 (한글, 영문, 숫자, 공백) - 요청마다 쓰이므로 모듈 로드 시 한 번만 컴파일
+KEYWORD_PATTERN = re.compile(r'[가-힣a-zA-Z0-9\s]+')
+
+
 # ===========================================
 # Request Schemas
 # ===========================================
@@ -18,16 +22,14 @@ class AnalyzeRequest(BaseModel):
     place_name: Optional[str] = Field(None, max_length=100, description="업체명 (선택)")
     inflow: Optional[int] = Field(None, ge=0, le=1000000, description="오늘 유입수")
 
-    @validator('keyword')
-    def validate_keyword(cls, v):
-        if not re.match(r'^[가-힣a-zA-Z0-9\s]+$', v):
-            raise ValueError('키워드에 허용되지 않는 문자가 포함되어 있습니다.')
-        return v.strip()
+    # 문자열 앞뒤 공백은 pydantic-core에서 검증 전에 제거
+    model_config = ConfigDict(str_strip_whitespace=True, str_max_length=500)
 
-    @validator('place_name')
-    def validate_place_name(cls, v):
-        if v:
-            return v.strip()
+    @field_validator('keyword')
+    @classmethod
+    def validate_keyword(cls, v: str) -> str:
+        if not KEYWORD_PATTERN.fullmatch(v):
+            raise ValueError('키워드에 허용되지 않는 문자가 포함되어 있습니다.')
         return v
 
 
@@ -175,11 +177,14 @@ class SubmitDataRequest(BaseModel):
     place_name: Optional[str] = Field(None, max_length=255, description="업체명")
     inflow: int = Field(..., ge=0, le=1000000, description="유입수")
 
-    @validator('keyword')
-    def validate_keyword(cls, v):
-        if not re.match(r'^[가-힣a-zA-Z0-9\s]+$', v):
+    model_config = ConfigDict(str_strip_whitespace=True, str_max_length=500)
+
+    @field_validator('keyword')
+    @classmethod
+    def validate_keyword(cls, v: str) -> str:
+        if not KEYWORD_PATTERN.fullmatch(v):
             raise ValueError('키워드에 허용되지 않는 문자가 포함되어 있습니다.')
-        return v.strip()
+        return v
 
 
 class SubmitDataResponse(BaseModel):
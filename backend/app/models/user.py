@@ -12,6 +12,15 @@ class MembershipType(str, enum.Enum):
     ENTERPRISE = "enterprise"
 
 
+# 멤버십별 일일 검색 한도 (daily_limit 조회마다 새로 만들지 않도록 모듈 상수로 유지)
+DAILY_LIMITS = {
+    MembershipType.FREE: 10,
+    MembershipType.BASIC: 50,
+    MembershipType.PRO: 200,
+    MembershipType.ENTERPRISE: 1000,
+}
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -39,10 +48,4 @@ class User(Base):
 
     @property
     def daily_limit(self) -> int:
-        limits = {
-            MembershipType.FREE: 10,
-            MembershipType.BASIC: 50,
-            MembershipType.PRO: 200,
-            MembershipType.ENTERPRISE: 1000
-        }
-        return limits.get(self.membership_type, 10)
+        return DAILY_LIMITS.get(self.membership_type, DAILY_LIMITS[MembershipType.FREE])
@@ -7,18 +7,36 @@ ADLOG API를 숨기고 우리 서비스로 변환하는 프록시
 import httpx
 import os
 import re
-import json
+import orjson
 import asyncio
+import time
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any
+from operator import itemgetter
+from typing import Optional, List, Dict, Any, Set, Union
 from app.core.config import settings
 from app.core.cache import adlog_cache, adlog_rate_limiter, adlog_hourly_limiter
+from sqlalchemy import insert
 from app.core.database import AsyncSessionLocal
 from app.models.place import AdlogTrainingData
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 숫자 문자열에서 자주 등장하는 기호 (콤마, 부호, 증감 화살표, 퍼센트, 공백) 삭제 테이블
+_NUMERIC_DELETE_TABLE = str.maketrans("", "", ",+-▲▼%％ \t")
+# 삭제 테이블로 처리되지 않는 문자가 남은 경우에만 사용하는 정규식
+_NON_NUMERIC_PATTERN = re.compile(r'[^\d.]')
+# 키워드에서 제거할 문자 (XSS, Injection 방지)
+_KEYWORD_FORBIDDEN = str.maketrans("", "", '<>"\';')
+
+
+def _strip_non_numeric(str_value: str) -> str:
+    """숫자와 소수점만 남기기 (흔한 기호는 translate로 제거하고 나머지가 있을 때만 정규식 사용)"""
+    cleaned = str_value.translate(_NUMERIC_DELETE_TABLE)
+    if not cleaned or cleaned.replace('.', '').isdecimal():
+        return cleaned
+    return _NON_NUMERIC_PATTERN.sub('', cleaned)
+
 
 def parse_int_safe(value: Any) -> Optional[int]:
     """
@@ -34,8 +52,8 @@ def parse_int_safe(value: Any) -> Optional[int]:
         return int(value)
 
     try:
-        # 문자열로 변환
-        str_value = str(value).strip()
+        # 문자열로 변환 (이미 문자열이면 str() 호출 생략)
+        str_value = value.strip() if type(value) is str else str(value).strip()
         if not str_value:
             return None
 
@@ -43,7 +61,7 @@ def parse_int_safe(value: Any) -> Optional[int]:
         is_negative = str_value.startswith('-') or '▼' in str_value
 
         # 숫자와 소수점만 남기기 (콤마, +, ▲, ▼ 등 제거)
-        cleaned = re.sub(r'[^\d.]', '', str_value)
+        cleaned = _strip_non_numeric(str_value)
 
         if not cleaned:
             return None
@@ -66,7 +84,7 @@ def parse_float_safe(value: Any) -> float:
         return float(value)
 
     try:
-        str_value = str(value).strip()
+        str_value = value.strip() if type(value) is str else str(value).strip()
         if not str_value:
             return 0.0
 
@@ -74,7 +92,7 @@ def parse_float_safe(value: Any) -> float:
         is_negative = str_value.startswith('-') or '▼' in str_value
 
         # 숫자와 소수점만 남기기
-        cleaned = re.sub(r'[^\d.]', '', str_value)
+        cleaned = _strip_non_numeric(str_value)
 
         if not cleaned:
             return 0.0
@@ -104,7 +122,7 @@ def get_adlog_proxy_list() -> List[Dict[str, Any]]:
     proxy_list_json = os.getenv("ADLOG_PROXY_LIST")
     if proxy_list_json:
         try:
-            parsed = json.loads(proxy_list_json)
+            parsed = orjson.loads(proxy_list_json)
             if isinstance(parsed, list):
                 for p in parsed:
                     if isinstance(p, dict) and "url" in p:
@@ -119,7 +137,7 @@ def get_adlog_proxy_list() -> List[Dict[str, Any]]:
                         })
                 if proxies:
                     return proxies
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.warning("ADLOG_PROXY_LIST is not valid JSON, falling back to single proxy")
 
     # 방법 2: ADLOG 전용 프록시 URL (하위 호환)
@@ -130,13 +148,17 @@ def get_adlog_proxy_list() -> List[Dict[str, Any]]:
             "name": adlog_proxy_url.split("//")[-1].split(":")[0]
         })
 
+    # 중복 URL 확인용
+    seen_urls = {p["url"] for p in proxies}
+
     # 방법 3: 공용 프록시 URL (하위 호환)
     proxy_url = os.getenv("PROXY_URL")
-    if proxy_url and proxy_url not in [p["url"] for p in proxies]:
+    if proxy_url and proxy_url not in seen_urls:
         proxies.append({
             "url": proxy_url,
             "name": proxy_url.split("//")[-1].split(":")[0]
         })
+        seen_urls.add(proxy_url)
 
     # 방법 4: 개별 설정으로 URL 조합
     host = os.getenv("PROXY_HOST")
@@ -149,7 +171,7 @@ def get_adlog_proxy_list() -> List[Dict[str, Any]]:
             url = f"http://{user}:{password}@{host}:{port}"
         else:
             url = f"http://{host}:{port}"
-        if url not in [p["url"] for p in proxies]:
+        if url not in seen_urls:
             proxies.append({"url": url, "name": host})
 
     return proxies
@@ -161,8 +183,20 @@ class ProxyRotator:
     - 여러 프록시를 순환하며 사용
     - 실패한 프록시 자동 제외 (일정 시간 후 복구)
     - Rate limit 걸린 프록시 자동 전환
+
+    상태 변경 구간에 await가 없어 이벤트 루프에서 중단 없이 실행되므로 별도 락을 두지 않음
     """
 
+    __slots__ = (
+        "_proxies",
+        "_cooldown_minutes",
+        "_current_index",
+        "_failed_until",
+        "_rate_limited_until",
+        "_next_midnight",
+        "_next_midnight_epoch",
+    )
+
     def __init__(self, proxies: List[Dict[str, Any]], cooldown_minutes: int = 30):
         """
         Args:
@@ -172,9 +206,12 @@ class ProxyRotator:
         self._proxies = proxies
         self._cooldown_minutes = cooldown_minutes
         self._current_index = 0
-        self._failed_proxies: Dict[str, datetime] = {}  # url -> 실패 시간
-        self._rate_limited_proxies: Dict[str, datetime] = {}  # url -> rate limit 시간
-        self._lock = asyncio.Lock()
+        # 쿨다운 종료 시각 (time.monotonic 기준) - 시스템 시계 변경에 영향받지 않음
+        self._failed_until: Dict[str, float] = {}  # url -> 실패 쿨다운 종료
+        self._rate_limited_until: Dict[str, float] = {}  # url -> rate limit 해제 (다음 자정)
+        # 다음 자정 캐시 (자정이 지나기 전까지 재계산하지 않음)
+        self._next_midnight: Optional[datetime] = None
+        self._next_midnight_epoch = 0.0
 
         if proxies:
             safe_list = [self._safe_proxy_name(p["url"]) for p in proxies]
@@ -190,104 +227,118 @@ class ProxyRotator:
 
     def _is_proxy_available(self, proxy_url: str) -> bool:
         """프록시가 사용 가능한지 확인"""
-        now = datetime.now()
+        now = time.monotonic()
 
         # 실패 쿨다운 확인
-        if proxy_url in self._failed_proxies:
-            failed_time = self._failed_proxies[proxy_url]
-            if now < failed_time + timedelta(minutes=self._cooldown_minutes):
+        failed_until = self._failed_until.get(proxy_url)
+        if failed_until is not None:
+            if now < failed_until:
                 return False
-            else:
-                # 쿨다운 완료 - 복구
-                del self._failed_proxies[proxy_url]
-                logger.info(f"Proxy recovered from failure cooldown: {self._safe_proxy_name(proxy_url)}")
-
-        # Rate limit 쿨다운 확인 (더 긴 대기 시간)
-        if proxy_url in self._rate_limited_proxies:
-            rate_limit_time = self._rate_limited_proxies[proxy_url]
-            # Rate limit은 다음 날까지 대기
-            next_day = (rate_limit_time + timedelta(days=1)).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-            if now < next_day:
+            # 쿨다운 완료 - 복구
+            del self._failed_until[proxy_url]
+            logger.info(f"Proxy recovered from failure cooldown: {self._safe_proxy_name(proxy_url)}")
+
+        # Rate limit 쿨다운 확인 (다음 날까지 대기)
+        rate_limited_until = self._rate_limited_until.get(proxy_url)
+        if rate_limited_until is not None:
+            if now < rate_limited_until:
                 return False
-            else:
-                # 다음 날이 됨 - 복구
-                del self._rate_limited_proxies[proxy_url]
-                logger.info(f"Proxy recovered from rate limit: {self._safe_proxy_name(proxy_url)}")
+            # 다음 날이 됨 - 복구
+            del self._rate_limited_until[proxy_url]
+            logger.info(f"Proxy recovered from rate limit: {self._safe_proxy_name(proxy_url)}")
 
         return True
 
+    def next_midnight(self) -> datetime:
+        """다음 자정 (로컬 시각) - 실제 자정이 지났을 때만 다시 계산"""
+        if self._next_midnight is None or time.time() >= self._next_midnight_epoch:
+            now = datetime.now()
+            self._next_midnight = (now + timedelta(days=1)).replace(
+                hour=0, minute=0, second=0, microsecond=0
+            )
+            self._next_midnight_epoch = self._next_midnight.timestamp()
+        return self._next_midnight
+
     def get_available_proxies(self) -> List[Dict[str, Any]]:
         """사용 가능한 프록시 목록"""
         return [p for p in self._proxies if self._is_proxy_available(p["url"])]
 
-    async def get_next_proxy(self) -> Optional[Dict[str, Any]]:
+    async def get_next_proxy(self, exclude: Optional[Set[str]] = None) -> Optional[Dict[str, Any]]:
         """
         다음 사용 가능한 프록시 반환
 
+        Args:
+            exclude: 제외할 프록시 URL (같은 요청에서 이미 시도한 프록시)
+
         Returns:
             프록시 정보 {"url": str, "name": str} 또는 None (모든 프록시 사용 불가)
         """
-        async with self._lock:
-            available = self.get_available_proxies()
+        available = self.get_available_proxies()
 
+        if not available:
+            logger.warning("No available proxies - all are in cooldown or rate limited")
+            return None
+
+        if exclude:
+            available = [p for p in available if p["url"] not in exclude]
             if not available:
-                logger.warning("No available proxies - all are in cooldown or rate limited")
                 return None
 
-            # 라운드 로빈
-            self._current_index = self._current_index % len(available)
-            proxy = available[self._current_index]
-            self._current_index = (self._current_index + 1) % len(available)
+        # 라운드 로빈
+        self._current_index = self._current_index % len(available)
+        proxy = available[self._current_index]
+        self._current_index = (self._current_index + 1) % len(available)
 
-            return proxy
+        return proxy
 
     async def mark_failed(self, proxy_url: str, reason: str = "unknown") -> None:
         """프록시를 실패로 표시 (쿨다운 적용)"""
-        async with self._lock:
-            self._failed_proxies[proxy_url] = datetime.now()
-            logger.warning(
-                f"Proxy marked as failed: {self._safe_proxy_name(proxy_url)} "
-                f"(reason: {reason}, cooldown: {self._cooldown_minutes}min)"
-            )
+        self._failed_until[proxy_url] = time.monotonic() + self._cooldown_minutes * 60
+        logger.warning(
+            f"Proxy marked as failed: {self._safe_proxy_name(proxy_url)} "
+            f"(reason: {reason}, cooldown: {self._cooldown_minutes}min)"
+        )
 
     async def mark_rate_limited(self, proxy_url: str) -> None:
         """프록시를 rate limit으로 표시 (다음 날까지 대기)"""
-        async with self._lock:
-            self._rate_limited_proxies[proxy_url] = datetime.now()
-            logger.warning(
-                f"Proxy marked as rate limited: {self._safe_proxy_name(proxy_url)} "
-                f"(will retry after midnight)"
-            )
+        # Rate limit은 다음 날 자정까지 대기
+        self.next_midnight()
+        self._rate_limited_until[proxy_url] = (
+            time.monotonic() + (self._next_midnight_epoch - time.time())
+        )
+        logger.warning(
+            f"Proxy marked as rate limited: {self._safe_proxy_name(proxy_url)} "
+            f"(will retry after midnight)"
+        )
 
     async def reset_proxy(self, proxy_url: str) -> None:
         """프록시 상태 초기화 (수동 복구용)"""
-        async with self._lock:
-            if proxy_url in self._failed_proxies:
-                del self._failed_proxies[proxy_url]
-            if proxy_url in self._rate_limited_proxies:
-                del self._rate_limited_proxies[proxy_url]
-            logger.info(f"Proxy manually reset: {self._safe_proxy_name(proxy_url)}")
+        self._failed_until.pop(proxy_url, None)
+        self._rate_limited_until.pop(proxy_url, None)
+        logger.info(f"Proxy manually reset: {self._safe_proxy_name(proxy_url)}")
 
     async def reset_all(self) -> None:
         """모든 프록시 상태 초기화"""
-        async with self._lock:
-            self._failed_proxies.clear()
-            self._rate_limited_proxies.clear()
-            self._current_index = 0
-            logger.info("All proxies reset")
+        self._failed_until.clear()
+        self._rate_limited_until.clear()
+        self._current_index = 0
+        logger.info("All proxies reset")
 
     def get_status(self) -> Dict[str, Any]:
         """프록시 상태 정보"""
-        now = datetime.now()
-
         status = {
             "total_proxies": len(self._proxies),
             "available_count": len(self.get_available_proxies()),
             "proxies": []
         }
 
+        # monotonic 기준 종료 시각 → 현재 시계 변환용 기준값은 한 번만 조회
+        now = datetime.now()
+        monotonic_now = time.monotonic()
+
+        def available_at(deadline: float) -> str:
+            return (now + timedelta(seconds=max(deadline - monotonic_now, 0.0))).isoformat()
+
         for proxy in self._proxies:
             url = proxy["url"]
             proxy_status = {
@@ -296,18 +347,12 @@ class ProxyRotator:
                 "status": "available"
             }
 
-            if url in self._rate_limited_proxies:
-                rate_limit_time = self._rate_limited_proxies[url]
-                next_day = (rate_limit_time + timedelta(days=1)).replace(
-                    hour=0, minute=0, second=0, microsecond=0
-                )
+            if url in self._rate_limited_until:
                 proxy_status["status"] = "rate_limited"
-                proxy_status["available_at"] = next_day.isoformat()
-            elif url in self._failed_proxies:
-                failed_time = self._failed_proxies[url]
-                available_at = failed_time + timedelta(minutes=self._cooldown_minutes)
+                proxy_status["available_at"] = available_at(self._rate_limited_until[url])
+            elif url in self._failed_until:
                 proxy_status["status"] = "failed"
-                proxy_status["available_at"] = available_at.isoformat()
+                proxy_status["available_at"] = available_at(self._failed_until[url])
 
             status["proxies"].append(proxy_status)
 
@@ -348,15 +393,56 @@ class AdlogProxyService:
         self._proxy_rotator = ProxyRotator(proxy_list, cooldown_minutes=30)
         # 최대 재시도 횟수 (프록시 개수 또는 3 중 큰 값)
         self._max_retries = max(len(proxy_list), 3) if proxy_list else 1
+        # 프록시별 공유 HTTP 클라이언트 (keep-alive로 요청마다 TCP/TLS 연결을 새로 맺지 않도록 재사용)
+        self._clients: Dict[Optional[str], httpx.AsyncClient] = {}
+        self._clients_loop: Optional[asyncio.AbstractEventLoop] = None
+        # 실행 중인 학습 데이터 저장 태스크 (완료 전 GC 방지용 참조 유지)
+        self._background_tasks: Set[asyncio.Task] = set()
+
+    async def _get_client(self, proxy_url: Optional[str]) -> httpx.AsyncClient:
+        """프록시 URL별 HTTP 클라이언트 (현재 이벤트 루프 기준 lazy 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._clients_loop is not loop:
+            # 다른 이벤트 루프에서 만든 클라이언트는 재사용할 수 없으므로 닫고 교체
+            stale = list(self._clients.values())
+            self._clients = {}
+            self._clients_loop = loop
+            for client in stale:
+                if client.is_closed:
+                    continue
+                try:
+                    await client.aclose()
+                except Exception as e:
+                    logger.warning(f"Failed to close HTTP client from previous event loop: {e}")
+
+        client = self._clients.get(proxy_url)
+        if client is None or client.is_closed:
+            client_kwargs = {
+                "timeout": self._timeout,
+                "limits": httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+            }
+            if proxy_url:
+                client_kwargs["proxies"] = proxy_url
+            client = httpx.AsyncClient(**client_kwargs)
+            self._clients[proxy_url] = client
+        return client
+
+    async def aclose(self) -> None:
+        """저장 중인 학습 데이터를 기다린 뒤 공유 HTTP 클라이언트 모두 종료 (앱 종료 시 호출)"""
+        if self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+        clients = list(self._clients.values())
+        self._clients = {}
+        self._clients_loop = None
+        for client in clients:
+            if not client.is_closed:
+                await client.aclose()
 
     def _sanitize_keyword(self, keyword: str) -> str:
         """키워드 입력 검증 및 정제"""
-        keyword = keyword.strip()
-        # XSS, Injection 방지
-        keyword = re.sub(r'[<>"\';]', '', keyword)
-        if len(keyword) > 50:
-            keyword = keyword[:50]
-        return keyword
+        # XSS, Injection 방지 문자 제거 후 50자로 제한
+        return keyword.strip().translate(_KEYWORD_FORBIDDEN)[:50]
 
     def _get_cache_key(self, keyword: str) -> str:
         """캐시 키 생성"""
@@ -411,6 +497,8 @@ class AdlogProxyService:
             raise AdlogApiError("요청이 너무 많습니다. 잠시 후 다시 시도해주세요.")
 
         if not await self._hourly_limiter.acquire():
+            # 분당 토큰은 사용하지 않았으므로 반환
+            await self._rate_limiter.release()
             logger.warning("Rate limit exceeded (per hour)")
             raise AdlogApiError("시간당 요청 제한에 도달했습니다. 잠시 후 다시 시도해주세요.")
 
@@ -419,8 +507,8 @@ class AdlogProxyService:
         tried_proxies = set()
 
         for attempt in range(self._max_retries):
-            # 다음 프록시 가져오기
-            proxy_info = await self._proxy_rotator.get_next_proxy()
+            # 다음 프록시 가져오기 (이미 시도한 프록시 제외)
+            proxy_info = await self._proxy_rotator.get_next_proxy(exclude=tried_proxies)
 
             if proxy_info is None:
                 # 사용 가능한 프록시 없음
@@ -436,10 +524,6 @@ class AdlogProxyService:
                 proxy_url = proxy_info["url"]
                 proxy_name = proxy_info["name"]
 
-                # 이미 시도한 프록시는 건너뛰기
-                if proxy_url in tried_proxies:
-                    continue
-
             tried_proxies.add(proxy_url or "direct")
 
             try:
@@ -487,10 +571,7 @@ class AdlogProxyService:
         if not available_proxies:
             # 모든 프록시가 rate limited
             self._all_proxies_rate_limited = True
-            now = datetime.now()
-            self._all_proxies_rate_limit_reset_time = (now + timedelta(days=1)).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
+            self._all_proxies_rate_limit_reset_time = self._proxy_rotator.next_midnight()
             logger.error("All proxies exhausted - rate limited until midnight")
             raise AdlogRateLimitError(
                 "모든 프록시가 일일 제한에 도달했습니다. 내일 다시 시도해주세요."
@@ -502,6 +583,25 @@ class AdlogProxyService:
             raise last_error
         raise AdlogApiError("분석 서비스 연결에 실패했습니다. 잠시 후 다시 시도해주세요.")
 
+    async def fetch_keywords_bulk(
+        self, keywords: List[str], force_refresh: bool = False
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        여러 키워드 분석 데이터 동시 조회
+
+        사용 가능한 프록시 수만큼 동시에 요청하며, 결과는 입력 순서대로 반환.
+        개별 키워드 실패는 예외 객체로 해당 위치에 담아 반환 (전체 실패로 전파하지 않음)
+        """
+        semaphore = asyncio.Semaphore(max(1, len(self._proxy_rotator.get_available_proxies())))
+
+        async def _fetch_one(keyword: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.fetch_keyword_analysis(keyword, force_refresh=force_refresh)
+
+        return await asyncio.gather(
+            *(_fetch_one(keyword) for keyword in keywords), return_exceptions=True
+        )
+
     async def _call_api_with_proxy(
         self,
         keyword: str,
@@ -525,117 +625,139 @@ class AdlogProxyService:
         """
         logger.info(f"Calling ADLOG API for keyword: {keyword} (proxy: {proxy_name})")
 
-        client_kwargs = {
-            "timeout": self._timeout,
-        }
-        if proxy_url:
-            client_kwargs["proxy"] = proxy_url
-
-        async with httpx.AsyncClient(**client_kwargs) as client:
-            response = await client.post(
-                self._base_url,
-                json={"query": keyword},
-                headers={"Content-Type": "application/json"},
+        client = await self._get_client(proxy_url)
+        response = await client.post(
+            self._base_url,
+            json={"query": keyword},
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        raw_data = orjson.loads(response.content)
+
+        # Rate limit 응답 확인
+        if raw_data.get("code") == "2000":
+            logger.warning(f"ADLOG rate limit response via proxy {proxy_name}")
+            raise AdlogRateLimitError(
+                f"프록시 {proxy_name}의 일일 제한에 도달했습니다."
             )
-            response.raise_for_status()
-            raw_data = response.json()
 
-            # Rate limit 응답 확인
-            if raw_data.get("code") == "2000":
-                logger.warning(f"ADLOG rate limit response via proxy {proxy_name}")
-                raise AdlogRateLimitError(
-                    f"프록시 {proxy_name}의 일일 제한에 도달했습니다."
-                )
+        # 항목 파싱은 한 번만 하고 응답 변환과 학습 데이터 저장에서 함께 사용
+        parsed_items = self._parse_items(raw_data)
 
-            # 응답 변환
-            result = self._transform_response(raw_data, keyword)
+        # 응답 변환
+        result = self._transform_response(parsed_items, keyword)
 
-            # 딥러닝 학습용 DB 저장 (백그라운드, 에러 무시)
-            try:
-                await self._save_training_data(keyword, raw_data)
-            except Exception as e:
-                logger.debug(f"Training data save failed: {e}")
+        # 딥러닝 학습용 DB 저장 (백그라운드 태스크 - 응답이 DB 커밋을 기다리지 않음, 에러는 내부에서 로깅)
+        task = asyncio.create_task(self._save_training_data(keyword, parsed_items))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
 
-            logger.info(f"Successfully fetched data via proxy {proxy_name}")
-            return result
+        logger.info(f"Successfully fetched data via proxy {proxy_name}")
+        return result
 
-    async def _save_training_data(self, keyword: str, raw_data: Dict) -> None:
+    async def _save_training_data(self, keyword: str, parsed_items: List[Dict[str, Any]]) -> None:
         """
         딥러닝 학습용 데이터 DB 저장
         - 30일간 보관 후 자동 삭제 예정 (별도 스케줄러 필요)
         - 에러가 발생해도 API 응답에 영향 없음 (로깅만 함)
         """
         try:
-            items = raw_data.get("items", [])
-            if not items:
-                items = raw_data.get("data", [])
-
-            if not items:
+            if not parsed_items:
                 logger.debug(f"No items to save for keyword: {keyword}")
                 return
 
             now = datetime.now()
             expires_at = now + timedelta(days=TRAINING_DATA_RETENTION_DAYS)
 
-            async with AsyncSessionLocal() as session:
-                for item in items:
-                    training_record = AdlogTrainingData(
-                        keyword=keyword,
-                        place_id=str(item.get("place_id", "")),
-                        place_name=item.get("place_name", ""),
-                        rank=parse_int_safe(item.get("place_rank")),
-                        rank_change=parse_int_safe(item.get("place_rank_compare")),
-                        index_n1=parse_float_safe(item.get("place_index1")),
-                        index_n2=parse_float_safe(item.get("place_index2")),
-                        index_n3=parse_float_safe(item.get("place_index3")),
-                        index_n2_change=parse_float_safe(item.get("place_index2_compare")),
-                        visitor_review_count=parse_int_safe(item.get("place_visit_cnt")) or 0,
-                        blog_review_count=parse_int_safe(item.get("place_blog_cnt")) or 0,
-                        save_count=parse_int_safe(item.get("place_save_cnt")) or 0,
-                        collected_at=now,
-                        expires_at=expires_at
-                    )
-                    session.add(training_record)
+            rows = [
+                {
+                    "keyword": keyword,
+                    "place_id": str(item["place_id"]),
+                    "place_name": item["place_name"],
+                    "rank": item["rank"],
+                    "rank_change": item["rank_change"],
+                    "index_n1": item["n1"],
+                    "index_n2": item["n2"],
+                    "index_n3": item["n3"],
+                    "index_n2_change": item["n2_change"],
+                    "visitor_review_count": item["visit_count"] or 0,
+                    "blog_review_count": item["blog_count"] or 0,
+                    "save_count": item["save_count"] or 0,
+                    "collected_at": now,
+                    "expires_at": expires_at,
+                }
+                for item in parsed_items
+            ]
 
+            # ORM 객체 생성 없이 executemany 한 번으로 일괄 INSERT
+            async with AsyncSessionLocal() as session:
+                await session.execute(insert(AdlogTrainingData), rows)
                 await session.commit()
-                logger.info(f"Saved {len(items)} training records for keyword: {keyword}")
+                logger.info(f"Saved {len(rows)} training records for keyword: {keyword}")
 
         except Exception as e:
             # DB 저장 실패해도 API 응답에는 영향 없음
             logger.error(f"Failed to save training data for keyword '{keyword}': {str(e)}")
 
-    def _transform_response(self, raw: Dict, keyword: str) -> Dict[str, Any]:
-        """응답에서 ADLOG 관련 정보 제거 및 변환"""
+    def _parse_items(self, raw: Dict) -> List[Dict[str, Any]]:
+        """
+        ADLOG 응답 항목의 숫자 필드 파싱 (응답 변환/학습 데이터 저장 공용)
 
+        값이 없으면 None으로 두고 기본값은 각 사용처에서 적용한다.
+        """
         items = raw.get("items", [])
         if not items:
             items = raw.get("data", [])
 
-        places = []
+        # 루프 안에서 반복 조회하지 않도록 파서를 지역 변수로 바인딩
+        to_int = parse_int_safe
+        to_float = parse_float_safe
+
+        parsed_items = []
         for item in items:
-            place = {
-                "place_id": item.get("place_id", ""),
-                "name": item.get("place_name", ""),
-                "rank": parse_int_safe(item.get("place_rank")) or 0,
+            get = item.get
+            parsed_items.append({
+                "place_id": get("place_id", ""),
+                "place_name": get("place_name", ""),
+                "rank": to_int(get("place_rank")),
+                "rank_change": to_int(get("place_rank_compare")),
+                "blog_count": to_int(get("place_blog_cnt")),
+                "visit_count": to_int(get("place_visit_cnt")),
+                "save_count": to_int(get("place_save_cnt")),
+                "n1": to_float(get("place_index1")),
+                "n2": to_float(get("place_index2")),
+                "n3": to_float(get("place_index3")),
+                "n2_change": to_float(get("place_index2_compare")),
+            })
+        return parsed_items
+
+    def _transform_response(self, parsed_items: List[Dict[str, Any]], keyword: str) -> Dict[str, Any]:
+        """응답에서 ADLOG 관련 정보 제거 및 변환"""
+        places = [
+            {
+                "place_id": item["place_id"],
+                "name": item["place_name"],
+                "rank": item["rank"] or 0,
                 "metrics": {
-                    "blog_count": parse_int_safe(item.get("place_blog_cnt")) or 0,
-                    "visit_count": parse_int_safe(item.get("place_visit_cnt")) or 0,
-                    "save_count": parse_int_safe(item.get("place_save_cnt")) or 0,
+                    "blog_count": item["blog_count"] or 0,
+                    "visit_count": item["visit_count"] or 0,
+                    "save_count": item["save_count"] or 0,
                 },
                 "raw_indices": {
-                    "n1": parse_float_safe(item.get("place_index1")),
-                    "n2": parse_float_safe(item.get("place_index2")),
-                    "n3": parse_float_safe(item.get("place_index3")),
+                    "n1": item["n1"],
+                    "n2": item["n2"],
+                    "n3": item["n3"],
                 },
                 "changes": {
-                    "rank_change": parse_int_safe(item.get("place_rank_compare")) or 0,
-                    "n2_change": parse_float_safe(item.get("place_index2_compare")),
+                    "rank_change": item["rank_change"] or 0,
+                    "n2_change": item["n2_change"],
                 }
             }
-            places.append(place)
+            for item in parsed_items
+        ]
 
         # 순위순 정렬
-        places.sort(key=lambda x: x["rank"])
+        places.sort(key=itemgetter("rank"))
 
         return {
             "keyword": keyword,
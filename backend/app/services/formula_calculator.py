@@ -6,12 +6,33 @@ Formula Calculator Service
 - N2: slope * rank + intercept
 - N3: slope * N2 + intercept (선형 공식, 99.97% 정확도)
 """
-from typing import Dict, Any, Optional, List
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Tuple
+import numpy as np
 from app.models.place import KeywordParameter
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 이 개수 이상의 순위는 NumPy 배열 연산으로 일괄 계산 (적으면 파이썬 루프가 더 빠름)
+VECTORIZE_MIN_RANKS = 16
+
+
+@dataclass(frozen=True, slots=True)
+class PreparedParams:
+    """
+    검증을 마친 키워드 파라미터 스냅샷 (plain float)
+
+    KeywordParameter와 같은 속성 이름을 사용하므로 calculate_* 메서드에 그대로 전달 가능.
+    반복 계산 시 ORM 속성 조회/can_calculate 재확인을 피하기 위해 사용
+    """
+    n1_constant: float
+    n2_slope: float
+    n2_intercept: float
+    n3_slope: float
+    n3_intercept: float
+    is_reliable: bool = True
+
 
 class FormulaCalculator:
     """캐싱된 파라미터로 지수 계산"""
@@ -119,6 +140,38 @@ class FormulaCalculator:
             "n3": n3_raw * 100 if n3_raw is not None else None,
         }
 
+    def calculate_all_indices_vec(
+        self,
+        params: KeywordParameter,
+        ranks: np.ndarray
+    ) -> Tuple[Optional[np.ndarray], Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        여러 순위에 대한 지수를 배열 연산으로 한 번에 계산
+
+        calculate_all_indices와 같은 공식/클램프를 적용합니다.
+
+        Args:
+            params: 키워드 파라미터
+            ranks: 순위 배열
+
+        Returns:
+            (n1, n2, n3) 배열 (0-100 스케일, 파라미터가 없는 지수는 None)
+        """
+        ranks = np.asarray(ranks, dtype=np.float64)
+
+        n1_raw = self.calculate_n1(params)
+        n1 = np.full(ranks.shape, n1_raw * 100) if n1_raw is not None else None
+
+        n2 = None
+        n3 = None
+        if params.n2_slope is not None and params.n2_intercept is not None:
+            n2_raw = np.clip(params.n2_slope * ranks + params.n2_intercept, 0.0, 1.0)
+            if params.n3_slope is not None and params.n3_intercept is not None:
+                n3 = np.clip(params.n3_slope * n2_raw + params.n3_intercept, 0.0, 1.0) * 100
+            n2 = n2_raw * 100
+
+        return n1, n2, n3
+
     def generate_calculated_places(
         self,
         params: KeywordParameter,
@@ -134,17 +187,82 @@ class FormulaCalculator:
         Returns:
             [{"rank": int, "n1": float, "n2": float, "n3": float}, ...]
         """
+        # 순위가 많으면 배열 연산으로 한 번에 계산
+        if len(ranks) >= VECTORIZE_MIN_RANKS:
+            return self._generate_calculated_places_vec(params, ranks)
+
+        # 파라미터 속성은 순위마다 다시 읽지 않고 한 번만 조회
+        n1_constant = params.n1_constant
+        n2_slope = params.n2_slope
+        n2_intercept = params.n2_intercept
+        n3_slope = params.n3_slope
+        n3_intercept = params.n3_intercept
+
+        n1 = n1_constant * 100 if n1_constant is not None else None
+        has_n2 = n2_slope is not None and n2_intercept is not None
+        has_n3 = n3_slope is not None and n3_intercept is not None
+
         results = []
 
+        # calculate_all_indices와 같은 공식/클램프 (0-1 스케일 계산 후 0-100 변환)
         for rank in ranks:
-            indices = self.calculate_all_indices(params, rank)
+            n2 = None
+            n3 = None
+            if has_n2:
+                n2_raw = max(0.0, min(1.0, n2_slope * rank + n2_intercept))
+                if has_n3:
+                    n3 = max(0.0, min(1.0, n3_slope * n2_raw + n3_intercept)) * 100
+                n2 = n2_raw * 100
             results.append({
                 "rank": rank,
-                **indices,
+                "n1": n1,
+                "n2": n2,
+                "n3": n3,
             })
 
         return results
 
+    def _generate_calculated_places_vec(
+        self,
+        params: KeywordParameter,
+        ranks: List[int]
+    ) -> List[Dict[str, Any]]:
+        """generate_calculated_places의 배열 연산 버전 (calculate_all_indices_vec 사용)"""
+        n1, n2, n3 = self.calculate_all_indices_vec(params, np.asarray(ranks))
+        size = len(ranks)
+        n1_list = n1.tolist() if n1 is not None else [None] * size
+        n2_list = n2.tolist() if n2 is not None else [None] * size
+        n3_list = n3.tolist() if n3 is not None else [None] * size
+
+        return [
+            {"rank": rank, "n1": n1_value, "n2": n2_value, "n3": n3_value}
+            for rank, n1_value, n2_value, n3_value in zip(ranks, n1_list, n2_list, n3_list)
+        ]
+
+    def prepare(
+        self,
+        params: Optional[KeywordParameter]
+    ) -> Optional[PreparedParams]:
+        """
+        계산 가능한 파라미터를 plain float 스냅샷으로 변환
+
+        Args:
+            params: 키워드 파라미터
+
+        Returns:
+            PreparedParams (자체 계산 불가능하면 None)
+        """
+        if not self.can_calculate(params):
+            return None
+
+        return PreparedParams(
+            n1_constant=float(params.n1_constant),
+            n2_slope=float(params.n2_slope),
+            n2_intercept=float(params.n2_intercept),
+            n3_slope=float(params.n3_slope),
+            n3_intercept=float(params.n3_intercept),
+        )
+
     def can_calculate(
         self,
         params: Optional[KeywordParameter]
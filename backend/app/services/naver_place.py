@@ -63,6 +63,45 @@ def get_proxy_config() -> Optional[Dict[str, str]]:
 
     return None
 
+# 공유 HTTP 세션 (keep-alive + DNS 캐시로 요청마다 TCP/TLS 연결을 새로 맺지 않도록 재사용)
+_http_session: Optional[aiohttp.ClientSession] = None
+_http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """모든 NaverPlaceService 인스턴스가 공유하는 aiohttp 세션 (현재 이벤트 루프 기준 lazy 생성)"""
+    global _http_session, _http_session_loop
+    loop = asyncio.get_running_loop()
+    if _http_session is None or _http_session.closed or _http_session_loop is not loop:
+        stale = _http_session
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                ttl_dns_cache=600,
+                enable_cleanup_closed=True,
+                limit=64,
+                limit_per_host=16,
+            ),
+            # 요청 간 쿠키 공유 방지 (기존 요청별 세션과 동일하게 무상태 유지)
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+        _http_session_loop = loop
+        if stale is not None and not stale.closed:
+            # 다른 이벤트 루프에서 만든 세션은 재사용할 수 없으므로 새 세션으로 교체한 뒤 닫음
+            try:
+                await stale.close()
+            except Exception as e:
+                logger.warning(f"Failed to close HTTP session from previous event loop: {e}")
+    return _http_session
+
+
+async def close_http_session() -> None:
+    """공유 HTTP 세션 종료 (앱 종료 시 호출)"""
+    global _http_session, _http_session_loop
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+    _http_session_loop = None
+
 # User-Agent 목록 (로테이션용)
 USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
@@ -701,47 +740,47 @@ class NaverPlaceService:
 
         for url in urls:
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        url,
-                        headers=headers,
-                        proxy=proxy_url,
-                        timeout=aiohttp.ClientTimeout(total=15)
-                    ) as response:
-                        if response.status != 200:
-                            continue
+                session = await get_http_session()
+                async with session.get(
+                    url,
+                    headers=headers,
+                    proxy=proxy_url,
+                    timeout=aiohttp.ClientTimeout(total=15)
+                ) as response:
+                    if response.status != 200:
+                        continue
 
-                        html = await response.text()
+                    html = await response.text()
 
-                        # 차단 확인
-                        if "서비스 이용이 제한" in html:
-                            logger.warning(f"IP blocked for {url}")
-                            continue
+                    # 차단 확인
+                    if "서비스 이용이 제한" in html:
+                        logger.warning(f"IP blocked for {url}")
+                        continue
 
-                        # 업체명 추출
-                        # 방법 1: APOLLO_STATE에서 name 추출
-                        apollo_match = re.search(r'"name"\s*:\s*"([^"]+)"', html)
-                        if apollo_match:
-                            name = apollo_match.group(1)
-                            # JSON 유니코드 디코딩
-                            try:
-                                name = json.loads(f'"{name}"')
-                            except:
-                                pass
+                    # 업체명 추출
+                    # 방법 1: APOLLO_STATE에서 name 추출
+                    apollo_match = re.search(r'"name"\s*:\s*"([^"]+)"', html)
+                    if apollo_match:
+                        name = apollo_match.group(1)
+                        # JSON 유니코드 디코딩
+                        try:
+                            name = json.loads(f'"{name}"')
+                        except:
+                            pass
+                        if name and len(name) > 1:
+                            logger.info(f"Found place name from detail page: {name}")
+                            return name
+
+                    # 방법 2: <title> 태그에서 추출
+                    title_match = re.search(r'<title>([^<]+)</title>', html)
+                    if title_match:
+                        title = title_match.group(1)
+                        # "업체명 : 네이버 플레이스" 형식에서 업체명 추출
+                        if " : " in title:
+                            name = title.split(" : ")[0].strip()
                             if name and len(name) > 1:
-                                logger.info(f"Found place name from detail page: {name}")
                                 return name
 
-                        # 방법 2: <title> 태그에서 추출
-                        title_match = re.search(r'<title>([^<]+)</title>', html)
-                        if title_match:
-                            title = title_match.group(1)
-                            # "업체명 : 네이버 플레이스" 형식에서 업체명 추출
-                            if " : " in title:
-                                name = title.split(" : ")[0].strip()
-                                if name and len(name) > 1:
-                                    return name
-
             except Exception as e:
                 logger.debug(f"Failed to fetch name from {url}: {e}")
                 continue
@@ -837,98 +876,98 @@ class NaverPlaceService:
 
         for url in urls:
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        url,
-                        headers=headers,
-                        proxy=proxy_url,
-                        timeout=aiohttp.ClientTimeout(total=15)
-                    ) as response:
-                        if response.status != 200:
-                            continue
-
-                        html = await response.text()
-
-                        if "서비스 이용이 제한" in html:
-                            continue
-
-                        result = {
-                            "place_id": place_id,
-                            "name": "",
-                            "category": "",
-                            "address": "",
-                            "road_address": "",
-                            "phone": "",
-                            "visitor_review_count": 0,
-                            "blog_review_count": 0,
-                            "reservation_review_count": 0,
-                            "save_count": 0,
-                            "keywords": [],
-                        }
-
-                        # APOLLO_STATE에서 데이터 추출
-                        # 업체명
-                        name_match = re.search(r'"name"\s*:\s*"([^"]+)"', html)
-                        if name_match:
-                            try:
-                                result["name"] = json.loads(f'"{name_match.group(1)}"')
-                            except:
-                                result["name"] = name_match.group(1)
-
-                        # 카테고리
-                        cat_match = re.search(r'"category"\s*:\s*"([^"]+)"', html)
-                        if cat_match:
-                            result["category"] = cat_match.group(1).split(",")[0]
-
-                        # 주소
-                        addr_match = re.search(r'"address"\s*:\s*"([^"]+)"', html)
-                        if addr_match:
-                            result["address"] = addr_match.group(1)
-
-                        road_match = re.search(r'"roadAddress"\s*:\s*"([^"]+)"', html)
-                        if road_match:
-                            result["road_address"] = road_match.group(1)
+                session = await get_http_session()
+                async with session.get(
+                    url,
+                    headers=headers,
+                    proxy=proxy_url,
+                    timeout=aiohttp.ClientTimeout(total=15)
+                ) as response:
+                    if response.status != 200:
+                        continue
 
-                        # 전화번호
-                        phone_match = re.search(r'"phone"\s*:\s*"([^"]+)"', html)
-                        if phone_match:
-                            result["phone"] = phone_match.group(1)
+                    html = await response.text()
 
-                        # 방문자 리뷰 수
-                        visitor_match = re.search(r'"visitorReviewsTotal"\s*:\s*(\d+)', html)
-                        if visitor_match:
-                            result["visitor_review_count"] = int(visitor_match.group(1))
-                        else:
-                            visitor_match2 = re.search(r'"visitorReviewCount"\s*:\s*"?(\d+)"?', html)
-                            if visitor_match2:
-                                result["visitor_review_count"] = int(visitor_match2.group(1))
+                    if "서비스 이용이 제한" in html:
+                        continue
 
-                        # 블로그 리뷰 수 (여러 패턴 시도)
-                        blog_count = 0
-                        # 패턴 1: og:description 메타 태그 (블로그리뷰 1,884)
-                        og_match = re.search(r'블로그리뷰\s*([0-9,]+)', html)
-                        if og_match:
-                            blog_count = int(og_match.group(1).replace(',', ''))
-                        # 패턴 2: 블로그 리뷰 텍스트 (공백 포함)
-                        if blog_count == 0:
-                            blog_text_match = re.search(r'블로그\s*리뷰\s*([0-9,]+)', html)
-                            if blog_text_match:
-                                blog_count = int(blog_text_match.group(1).replace(',', ''))
-                        # 패턴 3: JSON 필드
-                        if blog_count == 0:
-                            blog_match = re.search(r'"blogCafeReviewCount"\s*:\s*"?([0-9,]+)"?', html)
-                            if blog_match:
-                                blog_count = int(blog_match.group(1).replace(',', ''))
-                        result["blog_review_count"] = blog_count
+                    result = {
+                        "place_id": place_id,
+                        "name": "",
+                        "category": "",
+                        "address": "",
+                        "road_address": "",
+                        "phone": "",
+                        "visitor_review_count": 0,
+                        "blog_review_count": 0,
+                        "reservation_review_count": 0,
+                        "save_count": 0,
+                        "keywords": [],
+                    }
 
-                        # 저장수
-                        save_match = re.search(r'"saveCount"\s*:\s*(\d+)', html)
-                        if save_match:
-                            result["save_count"] = int(save_match.group(1))
+                    # APOLLO_STATE에서 데이터 추출
+                    # 업체명
+                    name_match = re.search(r'"name"\s*:\s*"([^"]+)"', html)
+                    if name_match:
+                        try:
+                            result["name"] = json.loads(f'"{name_match.group(1)}"')
+                        except:
+                            result["name"] = name_match.group(1)
+
+                    # 카테고리
+                    cat_match = re.search(r'"category"\s*:\s*"([^"]+)"', html)
+                    if cat_match:
+                        result["category"] = cat_match.group(1).split(",")[0]
+
+                    # 주소
+                    addr_match = re.search(r'"address"\s*:\s*"([^"]+)"', html)
+                    if addr_match:
+                        result["address"] = addr_match.group(1)
+
+                    road_match = re.search(r'"roadAddress"\s*:\s*"([^"]+)"', html)
+                    if road_match:
+                        result["road_address"] = road_match.group(1)
+
+                    # 전화번호
+                    phone_match = re.search(r'"phone"\s*:\s*"([^"]+)"', html)
+                    if phone_match:
+                        result["phone"] = phone_match.group(1)
+
+                    # 방문자 리뷰 수
+                    visitor_match = re.search(r'"visitorReviewsTotal"\s*:\s*(\d+)', html)
+                    if visitor_match:
+                        result["visitor_review_count"] = int(visitor_match.group(1))
+                    else:
+                        visitor_match2 = re.search(r'"visitorReviewCount"\s*:\s*"?(\d+)"?', html)
+                        if visitor_match2:
+                            result["visitor_review_count"] = int(visitor_match2.group(1))
+
+                    # 블로그 리뷰 수 (여러 패턴 시도)
+                    blog_count = 0
+                    # 패턴 1: og:description 메타 태그 (블로그리뷰 1,884)
+                    og_match = re.search(r'블로그리뷰\s*([0-9,]+)', html)
+                    if og_match:
+                        blog_count = int(og_match.group(1).replace(',', ''))
+                    # 패턴 2: 블로그 리뷰 텍스트 (공백 포함)
+                    if blog_count == 0:
+                        blog_text_match = re.search(r'블로그\s*리뷰\s*([0-9,]+)', html)
+                        if blog_text_match:
+                            blog_count = int(blog_text_match.group(1).replace(',', ''))
+                    # 패턴 3: JSON 필드
+                    if blog_count == 0:
+                        blog_match = re.search(r'"blogCafeReviewCount"\s*:\s*"?([0-9,]+)"?', html)
+                        if blog_match:
+                            blog_count = int(blog_match.group(1).replace(',', ''))
+                    result["blog_review_count"] = blog_count
+
+                    # 저장수
+                    save_match = re.search(r'"saveCount"\s*:\s*(\d+)', html)
+                    if save_match:
+                        result["save_count"] = int(save_match.group(1))
 
-                        if result["name"]:
-                            logger.info(f"Extracted full info from detail page: {result['name']}")
-                            return result
+                    if result["name"]:
+                        logger.info(f"Extracted full info from detail page: {result['name']}")
+                        return result
 
             except Exception as e:
                 logger.debug(f"Failed to fetch full detail from {url}: {e}")
@@ -971,25 +1010,25 @@ class NaverPlaceService:
 
         for url in urls:
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        url,
-                        headers=headers,
-                        proxy=proxy_url,
-                        timeout=aiohttp.ClientTimeout(total=15)
-                    ) as response:
-                        if response.status == 200:
-                            html = await response.text()
-
-                            # 차단 확인
-                            if "서비스 이용이 제한" in html:
-                                logger.warning(f"IP blocked for {url}")
-                                continue
+                session = await get_http_session()
+                async with session.get(
+                    url,
+                    headers=headers,
+                    proxy=proxy_url,
+                    timeout=aiohttp.ClientTimeout(total=15)
+                ) as response:
+                    if response.status == 200:
+                        html = await response.text()
 
-                            # saveCount 찾기
-                            save_match = re.search(r'"saveCount"\s*:\s*(\d+)', html)
-                            if save_match:
-                                return int(save_match.group(1))
+                        # 차단 확인
+                        if "서비스 이용이 제한" in html:
+                            logger.warning(f"IP blocked for {url}")
+                            continue
+
+                        # saveCount 찾기
+                        save_match = re.search(r'"saveCount"\s*:\s*(\d+)', html)
+                        if save_match:
+                            return int(save_match.group(1))
             except Exception as e:
                 logger.debug(f"API fetch failed for {url}: {e}")
                 continue
@@ -1207,44 +1246,44 @@ class NaverPlaceService:
 
             for url in urls:
                 try:
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(
-                            url, headers=headers, proxy=proxy_url,
-                            timeout=aiohttp.ClientTimeout(total=10)
-                        ) as resp:
-                            if resp.status != 200:
-                                continue
-                            html = await resp.text()
+                    session = await get_http_session()
+                    async with session.get(
+                        url, headers=headers, proxy=proxy_url,
+                        timeout=aiohttp.ClientTimeout(total=10)
+                    ) as resp:
+                        if resp.status != 200:
+                            continue
+                        html = await resp.text()
 
-                            if "서비스 이용이 제한" in html:
-                                continue
+                        if "서비스 이용이 제한" in html:
+                            continue
 
-                            # 이름 추출
-                            name_match = re.search(r'"name"\s*:\s*"([^"]+)"', html)
-                            if name_match:
-                                try:
-                                    place["name"] = json.loads(f'"{name_match.group(1)}"')
-                                except:
-                                    place["name"] = name_match.group(1)
-
-                            # 카테고리
-                            cat_match = re.search(r'"category"\s*:\s*"([^"]+)"', html)
-                            if cat_match:
-                                place["category"] = cat_match.group(1).split(",")[0]
-
-                            # 방문자 리뷰
-                            visitor_match = re.search(r'"visitorReviewsTotal"\s*:\s*(\d+)', html)
-                            if visitor_match:
-                                place["visitor_review_count"] = int(visitor_match.group(1))
-
-                            # 블로그 리뷰
-                            blog_match = re.search(r'블로그리뷰\s*([0-9,]+)', html)
-                            if blog_match:
-                                place["blog_review_count"] = int(blog_match.group(1).replace(',', ''))
+                        # 이름 추출
+                        name_match = re.search(r'"name"\s*:\s*"([^"]+)"', html)
+                        if name_match:
+                            try:
+                                place["name"] = json.loads(f'"{name_match.group(1)}"')
+                            except:
+                                place["name"] = name_match.group(1)
 
-                            if place.get("name"):
-                                logger.debug(f"Enriched place name: {place['name']}")
-                                return place
+                        # 카테고리
+                        cat_match = re.search(r'"category"\s*:\s*"([^"]+)"', html)
+                        if cat_match:
+                            place["category"] = cat_match.group(1).split(",")[0]
+
+                        # 방문자 리뷰
+                        visitor_match = re.search(r'"visitorReviewsTotal"\s*:\s*(\d+)', html)
+                        if visitor_match:
+                            place["visitor_review_count"] = int(visitor_match.group(1))
+
+                        # 블로그 리뷰
+                        blog_match = re.search(r'블로그리뷰\s*([0-9,]+)', html)
+                        if blog_match:
+                            place["blog_review_count"] = int(blog_match.group(1).replace(',', ''))
+
+                        if place.get("name"):
+                            logger.debug(f"Enriched place name: {place['name']}")
+                            return place
 
                 except Exception as e:
                     logger.debug(f"Failed to enrich {place_id}: {e}")
@@ -1273,14 +1312,11 @@ class NaverPlaceService:
 
         return places
 
-    async def get_place_rank(
-        self,
-        place_id: str,
-        keyword: str,
-        max_search: int = 300,
-        traffic_count: Optional[int] = None  # 내 업체 유입수 (사용자 입력)
-    ) -> Dict[str, Any]:
-        """특정 플레이스의 키워드 검색 순위 조회"""
+    async def get_ranked_list(self, keyword: str, max_search: int = 300) -> List[Dict[str, Any]]:
+        """키워드 검색 결과를 순위 순서대로 조회 (상위 업체 데이터 보강 포함)
+
+        결과는 대상 업체와 무관하므로 같은 키워드의 여러 업체 순위 조회에서 재사용할 수 있습니다.
+        """
         # 순위 조회 시에는 블로그 보강 건너뜀 (아래에서 별도로 보강)
         search_results = await self.search_places(keyword, max_search, enrich_blog=False)
 
@@ -1296,7 +1332,19 @@ class NaverPlaceService:
         # 최신성(최근 1주일 리뷰 수) 수집
         top_places = await self._enrich_freshness(top_places)
 
-        search_results = top_places + search_results[30:]
+        return top_places + search_results[30:]
+
+    async def get_place_rank(
+        self,
+        place_id: str,
+        keyword: str,
+        max_search: int = 300,
+        traffic_count: Optional[int] = None,  # 내 업체 유입수 (사용자 입력)
+        search_results: Optional[List[Dict[str, Any]]] = None  # get_ranked_list() 결과 재사용
+    ) -> Dict[str, Any]:
+        """특정 플레이스의 키워드 검색 순위 조회"""
+        if search_results is None:
+            search_results = await self.get_ranked_list(keyword, max_search)
 
         result = {
             "place_id": place_id,
@@ -1332,6 +1380,31 @@ class NaverPlaceService:
 
         return result
 
+    @staticmethod
+    def get_place_metadata(rank_result: Dict[str, Any]) -> Dict[str, Any]:
+        """순위 조회 결과에서 대상 업체의 리뷰수/점수 추출
+
+        리뷰수는 업체 단위 값(키워드 무관), 점수는 키워드별 분석 결과입니다.
+        대상 업체가 분석 범위(상위 30위) 밖이면 found=False를 반환합니다.
+        """
+        metadata = {
+            "found": False,
+            "visitor_review_count": 0,
+            "blog_review_count": 0,
+            "place_score": None,
+        }
+
+        analysis = rank_result.get("analysis")
+        if analysis and analysis.get("target_analysis"):
+            target = analysis["target_analysis"]
+            counts = target.get("counts", {})
+            metadata["found"] = True
+            metadata["place_score"] = target.get("total_score")
+            metadata["visitor_review_count"] = counts.get("visitor_review", 0)
+            metadata["blog_review_count"] = counts.get("blog_review", 0)
+
+        return metadata
+
     async def _enrich_blog_reviews(self, places: List[Dict]) -> List[Dict]:
         """블로그 리뷰가 0인 업체들의 상세 정보 보강"""
         import aiohttp
@@ -1359,39 +1432,39 @@ class NaverPlaceService:
 
             for url in urls:
                 try:
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(
-                            url, headers=headers, proxy=proxy_url,
-                            timeout=aiohttp.ClientTimeout(total=10)
-                        ) as resp:
-                            if resp.status != 200:
-                                continue
-                            html = await resp.text()
+                    session = await get_http_session()
+                    async with session.get(
+                        url, headers=headers, proxy=proxy_url,
+                        timeout=aiohttp.ClientTimeout(total=10)
+                    ) as resp:
+                        if resp.status != 200:
+                            continue
+                        html = await resp.text()
 
-                            if "서비스 이용이 제한" in html:
-                                continue
+                        if "서비스 이용이 제한" in html:
+                            continue
 
-                            # 블로그 리뷰 파싱
-                            blog_count = 0
-                            # 패턴 1: og:description (블로그리뷰 1,884 또는 블로그리뷰 55)
-                            og_match = re.search(r'블로그리뷰\s*([0-9,]+)', html)
-                            if og_match:
-                                blog_count = int(og_match.group(1).replace(',', ''))
-                            # 패턴 2: 블로그 리뷰 (공백 포함)
-                            if blog_count == 0:
-                                blog_match = re.search(r'블로그\s*리뷰\s*([0-9,]+)', html)
-                                if blog_match:
-                                    blog_count = int(blog_match.group(1).replace(',', ''))
-                            # 패턴 3: JSON 필드
-                            if blog_count == 0:
-                                json_match = re.search(r'"blogCafeReviewCount"\s*:\s*"?([0-9,]+)"?', html)
-                                if json_match:
-                                    blog_count = int(json_match.group(1).replace(',', ''))
-
-                            if blog_count > 0:
-                                place["blog_review_count"] = blog_count
-                                logger.debug(f"Enriched blog count for {place.get('name')}: {blog_count}")
-                                return place
+                        # 블로그 리뷰 파싱
+                        blog_count = 0
+                        # 패턴 1: og:description (블로그리뷰 1,884 또는 블로그리뷰 55)
+                        og_match = re.search(r'블로그리뷰\s*([0-9,]+)', html)
+                        if og_match:
+                            blog_count = int(og_match.group(1).replace(',', ''))
+                        # 패턴 2: 블로그 리뷰 (공백 포함)
+                        if blog_count == 0:
+                            blog_match = re.search(r'블로그\s*리뷰\s*([0-9,]+)', html)
+                            if blog_match:
+                                blog_count = int(blog_match.group(1).replace(',', ''))
+                        # 패턴 3: JSON 필드
+                        if blog_count == 0:
+                            json_match = re.search(r'"blogCafeReviewCount"\s*:\s*"?([0-9,]+)"?', html)
+                            if json_match:
+                                blog_count = int(json_match.group(1).replace(',', ''))
+
+                        if blog_count > 0:
+                            place["blog_review_count"] = blog_count
+                            logger.debug(f"Enriched blog count for {place.get('name')}: {blog_count}")
+                            return place
                 except Exception as e:
                     logger.debug(f"Failed to enrich {place_id}: {e}")
                     continue
@@ -1436,50 +1509,50 @@ class NaverPlaceService:
 
             for url in urls:
                 try:
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(
-                            url, headers=headers, proxy=proxy_url,
-                            timeout=aiohttp.ClientTimeout(total=10)
-                        ) as resp:
-                            if resp.status != 200:
-                                continue
+                    session = await get_http_session()
+                    async with session.get(
+                        url, headers=headers, proxy=proxy_url,
+                        timeout=aiohttp.ClientTimeout(total=10)
+                    ) as resp:
+                        if resp.status != 200:
+                            continue
 
-                            html = await resp.text()
+                        html = await resp.text()
 
-                            if "서비스 이용이 제한" in html:
-                                continue
+                        if "서비스 이용이 제한" in html:
+                            continue
 
-                            # 방법 1: 리뷰 ID에서 날짜 추출 (MongoDB ObjectId)
-                            # 리뷰 ID 패턴: "id":"6761..." (24자리 hex)
-                            review_ids = re.findall(r'"id"\s*:\s*"([a-f0-9]{24})"', html)
-
-                            today = datetime.now()
-                            week_ago = today - timedelta(days=7)
-
-                            for rid in review_ids[:30]:  # 최근 30개만
-                                try:
-                                    # ObjectId의 처음 8자리는 Unix timestamp (초)
-                                    timestamp = int(rid[:8], 16)
-                                    review_date = datetime.fromtimestamp(timestamp)
-                                    if review_date >= week_ago:
-                                        week_count += 1
-                                except:
-                                    pass
-
-                            # 방법 2: 날짜 텍스트 파싱 (fallback)
-                            if week_count == 0:
-                                # "n일 전", "오늘", "어제" 패턴
-                                today_count = len(re.findall(r'오늘|방금', html))
-                                yesterday_count = len(re.findall(r'어제', html))
-                                days_ago = re.findall(r'(\d+)일\s*전', html)
-
-                                week_count = today_count + yesterday_count
-                                for d in days_ago:
-                                    if int(d) <= 7:
-                                        week_count += 1
-
-                            if week_count > 0:
-                                break
+                        # 방법 1: 리뷰 ID에서 날짜 추출 (MongoDB ObjectId)
+                        # 리뷰 ID 패턴: "id":"6761..." (24자리 hex)
+                        review_ids = re.findall(r'"id"\s*:\s*"([a-f0-9]{24})"', html)
+
+                        today = datetime.now()
+                        week_ago = today - timedelta(days=7)
+
+                        for rid in review_ids[:30]:  # 최근 30개만
+                            try:
+                                # ObjectId의 처음 8자리는 Unix timestamp (초)
+                                timestamp = int(rid[:8], 16)
+                                review_date = datetime.fromtimestamp(timestamp)
+                                if review_date >= week_ago:
+                                    week_count += 1
+                            except:
+                                pass
+
+                        # 방법 2: 날짜 텍스트 파싱 (fallback)
+                        if week_count == 0:
+                            # "n일 전", "오늘", "어제" 패턴
+                            today_count = len(re.findall(r'오늘|방금', html))
+                            yesterday_count = len(re.findall(r'어제', html))
+                            days_ago = re.findall(r'(\d+)일\s*전', html)
+
+                            week_count = today_count + yesterday_count
+                            for d in days_ago:
+                                if int(d) <= 7:
+                                    week_count += 1
+
+                        if week_count > 0:
+                            break
 
                 except Exception as e:
                     logger.debug(f"Failed to fetch freshness for {place_id}: {e}")
@@ -2252,18 +2325,18 @@ class NaverPlaceService:
             # 프록시 URL (있으면)
             proxy_url = self._proxy_config["url"] if self._proxy_config else None
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    headers=headers,
-                    proxy=proxy_url,
-                    timeout=aiohttp.ClientTimeout(total=15)
-                ) as response:
-                    if response.status != 200:
-                        logger.warning(f"Failed to fetch reviews: status {response.status}")
-                        return []
+            session = await get_http_session()
+            async with session.get(
+                url,
+                headers=headers,
+                proxy=proxy_url,
+                timeout=aiohttp.ClientTimeout(total=15)
+            ) as response:
+                if response.status != 200:
+                    logger.warning(f"Failed to fetch reviews: status {response.status}")
+                    return []
 
-                    html = await response.text()
+                html = await response.text()
 
             if len(html) < 50000:
                 logger.warning(f"Review page HTML too small: {len(html)} chars")
@@ -2363,18 +2436,18 @@ class NaverPlaceService:
             # 프록시 URL (있으면)
             proxy_url = self._proxy_config["url"] if self._proxy_config else None
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    headers=headers,
-                    proxy=proxy_url,
-                    timeout=aiohttp.ClientTimeout(total=15)
-                ) as response:
-                    if response.status != 200:
-                        logger.warning(f"Failed to fetch blog reviews: status {response.status}")
-                        return []
-
-                    html = await response.text()
+            session = await get_http_session()
+            async with session.get(
+                url,
+                headers=headers,
+                proxy=proxy_url,
+                timeout=aiohttp.ClientTimeout(total=15)
+            ) as response:
+                if response.status != 200:
+                    logger.warning(f"Failed to fetch blog reviews: status {response.status}")
+                    return []
+
+                html = await response.text()
 
             if len(html) < 50000:
                 logger.warning(f"Review page HTML too small for blog: {len(html)} chars")
@@ -8,7 +8,6 @@ ADLOG API 응답에서 N1, N2, N3 파라미터를 추출하여 저장
 """
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
-from scipy import stats
 import numpy as np
 import logging
 
@@ -88,6 +87,8 @@ class ParameterExtractor:
             logger.warning(f"Not enough data points for N2 regression: {len(ranks)} points")
             return None, None, None
 
+        from scipy import stats  # 회귀 계산 시에만 로드
+
         try:
             # scipy.stats.linregress 사용
             slope, intercept, r_value, p_value, std_err = stats.linregress(ranks, n2_values)
@@ -136,6 +137,8 @@ class ParameterExtractor:
             logger.warning(f"Not enough data points for N3 regression: {len(n2_values)} points")
             return None, None, None
 
+        from scipy import stats  # 회귀 계산 시에만 로드
+
         try:
             # scipy.stats.linregress 사용: N3 = slope * N2 + intercept
             slope, intercept, r_value, p_value, std_err = stats.linregress(n2_values, n3_values)
@@ -246,45 +249,102 @@ class ParameterRepository:
 
         if existing:
             # 기존 레코드 업데이트
-            existing.n1_constant = params.get("n1_constant")
-            existing.n1_std = params.get("n1_std")
-            existing.n2_slope = params.get("n2_slope")
-            existing.n2_intercept = params.get("n2_intercept")
-            existing.n2_r_squared = params.get("n2_r_squared")
-            existing.n3_slope = params.get("n3_slope")
-            existing.n3_intercept = params.get("n3_intercept")
-            existing.n3_r_squared = params.get("n3_r_squared")
-            existing.sample_count = params.get("sample_count", 0)
-            existing.last_trained_at = params.get("last_trained_at")
-            existing.is_reliable = params.get("is_reliable", False)
-            existing.api_call_count = (existing.api_call_count or 0) + 1
-            existing.updated_at = datetime.utcnow()
-
+            self._apply_params(existing, params)
             logger.info(f"Updated parameters for keyword: {keyword}")
             return existing
         else:
             # 새 레코드 생성
-            new_param = KeywordParameter(
-                keyword=keyword,
-                n1_constant=params.get("n1_constant"),
-                n1_std=params.get("n1_std"),
-                n2_slope=params.get("n2_slope"),
-                n2_intercept=params.get("n2_intercept"),
-                n2_r_squared=params.get("n2_r_squared"),
-                n3_slope=params.get("n3_slope"),
-                n3_intercept=params.get("n3_intercept"),
-                n3_r_squared=params.get("n3_r_squared"),
-                sample_count=params.get("sample_count", 0),
-                last_trained_at=params.get("last_trained_at"),
-                api_call_count=1,
-                cache_hit_count=0,
-                is_reliable=params.get("is_reliable", False),
-            )
+            new_param = self._build_param(params)
             db.add(new_param)
 
             logger.info(f"Created new parameters for keyword: {keyword}")
             return new_param
 
+    async def save_or_update_many(
+        self,
+        db: AsyncSession,
+        params_list: List[Dict[str, Any]]
+    ) -> List[KeywordParameter]:
+        """
+        여러 키워드 파라미터를 한 번에 저장 또는 업데이트
+
+        기존 레코드를 IN 쿼리 한 번으로 조회하고 변경 사항은 세션에만 반영한다.
+        커밋은 호출자가 한 번만 수행한다.
+
+        Args:
+            db: DB 세션
+            params_list: 파라미터 딕셔너리 리스트
+
+        Returns:
+            저장된 KeywordParameter 객체 리스트
+        """
+        if not params_list:
+            return []
+
+        result = await db.execute(
+            select(KeywordParameter).where(
+                KeywordParameter.keyword.in_([p["keyword"] for p in params_list])
+            )
+        )
+        existing_by_keyword = {param.keyword: param for param in result.scalars().all()}
+
+        saved = []
+        created = 0
+        for params in params_list:
+            existing = existing_by_keyword.get(params["keyword"])
+            if existing:
+                self._apply_params(existing, params)
+                saved.append(existing)
+            else:
+                new_param = self._build_param(params)
+                db.add(new_param)
+                existing_by_keyword[new_param.keyword] = new_param
+                saved.append(new_param)
+                created += 1
+
+        logger.info(
+            f"Saved parameters for {len(saved)} keywords: "
+            f"{created} created, {len(saved) - created} updated"
+        )
+        return saved
+
+    @staticmethod
+    def _apply_params(existing: KeywordParameter, params: Dict[str, Any]) -> None:
+        """기존 레코드에 파라미터 반영"""
+        existing.n1_constant = params.get("n1_constant")
+        existing.n1_std = params.get("n1_std")
+        existing.n2_slope = params.get("n2_slope")
+        existing.n2_intercept = params.get("n2_intercept")
+        existing.n2_r_squared = params.get("n2_r_squared")
+        existing.n3_slope = params.get("n3_slope")
+        existing.n3_intercept = params.get("n3_intercept")
+        existing.n3_r_squared = params.get("n3_r_squared")
+        existing.sample_count = params.get("sample_count", 0)
+        existing.last_trained_at = params.get("last_trained_at")
+        existing.is_reliable = params.get("is_reliable", False)
+        existing.api_call_count = (existing.api_call_count or 0) + 1
+        existing.updated_at = datetime.utcnow()
+
+    @staticmethod
+    def _build_param(params: Dict[str, Any]) -> KeywordParameter:
+        """파라미터로 새 레코드 생성"""
+        return KeywordParameter(
+            keyword=params["keyword"],
+            n1_constant=params.get("n1_constant"),
+            n1_std=params.get("n1_std"),
+            n2_slope=params.get("n2_slope"),
+            n2_intercept=params.get("n2_intercept"),
+            n2_r_squared=params.get("n2_r_squared"),
+            n3_slope=params.get("n3_slope"),
+            n3_intercept=params.get("n3_intercept"),
+            n3_r_squared=params.get("n3_r_squared"),
+            sample_count=params.get("sample_count", 0),
+            last_trained_at=params.get("last_trained_at"),
+            api_call_count=1,
+            cache_hit_count=0,
+            is_reliable=params.get("is_reliable", False),
+        )
+
     async def increment_cache_hit(
         self,
         db: AsyncSession,
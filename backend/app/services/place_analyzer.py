@@ -1,5 +1,7 @@
 import asyncio
+import heapq
 import math
+import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 from app.services.naver_place import NaverPlaceService
 import logging
@@ -9,24 +11,32 @@ logger = logging.getLogger(__name__)
 
 def calculate_correlation(x: List[float], y: List[float]) -> float:
     """피어슨 상관계수 계산"""
-    n = len(x)
-    if n < 3 or len(y) != n:
-        return 0.0
-
-    mean_x = sum(x) / n
-    mean_y = sum(y) / n
+    return calculate_correlations(x, [y])[0]
 
-    numerator = sum((xi - mean_x) * (yi - mean_y) for xi, yi in zip(x, y))
 
-    sum_sq_x = sum((xi - mean_x) ** 2 for xi in x)
-    sum_sq_y = sum((yi - mean_y) ** 2 for yi in y)
+def calculate_correlations(x: List[float], series: List[List[float]]) -> List[float]:
+    """
+    x와 여러 지표 간 피어슨 상관계수를 한 번에 계산
 
-    denominator = math.sqrt(sum_sq_x * sum_sq_y)
+    길이가 x와 다르거나 분산이 0인 지표는 0.0을 반환한다.
+    """
+    n = len(x)
+    results = [0.0] * len(series)
+    valid = [i for i, y in enumerate(series) if len(y) == n]
+    if n < 3 or not valid:
+        return results
 
-    if denominator == 0:
-        return 0.0
+    # 행 단위로 평균을 빼고 편차곱 합/제곱합을 행렬 연산으로 계산
+    data = np.array([x] + [series[i] for i in valid], dtype=np.float64)
+    data -= data.mean(axis=1, keepdims=True)
+    sum_sq = np.einsum("ij,ij->i", data, data)
+    numerators = data[1:] @ data[0]
+    denominators = np.sqrt(sum_sq[1:] * sum_sq[0])
 
-    return numerator / denominator
+    for i, numerator, denominator in zip(valid, numerators, denominators):
+        if denominator != 0:
+            results[i] = float(numerator / denominator)
+    return results
 
 
 class PlaceAnalyzer:
@@ -400,7 +410,7 @@ class PlaceAnalyzer:
             "score_rank": score_rank,
             "total_competitors": len(competitors),
             "metrics_comparison": metrics_comparison,
-            "top_competitors": sorted(competitor_scores, key=lambda x: x["score"], reverse=True)[:10],
+            "top_competitors": heapq.nlargest(10, competitor_scores, key=lambda x: x["score"]),
             "strengths": self._identify_strengths(target_place, competitors),
             "weaknesses": self._identify_weaknesses(target_place, competitors)
         }
@@ -690,9 +700,9 @@ class PlaceAnalyzer:
         inverse_ranks = [len(places) - r + 1 for r in ranks]
 
         # 상관계수 계산 (역순위와 각 지표)
-        corr_visitor = calculate_correlation(inverse_ranks, visitor_reviews)
-        corr_blog = calculate_correlation(inverse_ranks, blog_reviews)
-        corr_save = calculate_correlation(inverse_ranks, save_counts)
+        corr_visitor, corr_blog, corr_save = calculate_correlations(
+            inverse_ranks, [visitor_reviews, blog_reviews, save_counts]
+        )
 
         # 상관계수 합계로 정규화하여 영향력 비율 계산
         total_corr = abs(corr_visitor) + abs(corr_blog) + abs(corr_save)
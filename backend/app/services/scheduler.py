@@ -1,13 +1,13 @@
 import asyncio
 import logging
 from datetime import datetime, date, timedelta
-from typing import Optional
+from typing import Any, Dict, List, Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
-from sqlalchemy import select, and_, delete
+from sqlalchemy import select, and_, or_, delete, insert, update, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.database import AsyncSessionLocal
+from app.core.database import AsyncSessionLocal, is_postgres
 from app.models.place import (
     TrackedPlace, PlaceStats, RankHistory, SavedKeyword,
     UserActivityLog, AdlogTrainingData
@@ -16,6 +16,9 @@ from app.services.naver_place import NaverPlaceService
 
 logger = logging.getLogger(__name__)
 
+# 만료 데이터 정리 시 한 트랜잭션에서 삭제할 최대 행 수
+PURGE_BATCH_SIZE = 5000
+
 # 학습 상태 저장 (메모리)
 training_status = {
     "is_running": False,
@@ -41,57 +44,51 @@ class PlaceScheduler:
         self.scheduler = AsyncIOScheduler()
 
         # 매일 오전 9시에 실행 (KST) - 일일 데이터 수집
-        self.scheduler.add_job(
+        self._add_job_if_missing(
             self.collect_daily_data,
             CronTrigger(hour=9, minute=0),
-            id="daily_data_collection",
+            job_id="daily_data_collection",
             name="Daily Place Data Collection",
-            replace_existing=True
         )
 
         # 매 6시간마다 순위 체크 (09시, 15시, 21시, 03시)
-        self.scheduler.add_job(
+        self._add_job_if_missing(
             self.check_ranks,
             CronTrigger(hour="3,9,15,21", minute=0),
-            id="rank_check",
+            job_id="rank_check",
             name="Periodic Rank Check",
-            replace_existing=True
         )
 
         # 매일 오전 9시에 저장된 키워드 순위 추적 (순위 추적 페이지용)
-        self.scheduler.add_job(
+        self._add_job_if_missing(
             self.refresh_saved_keywords,
             CronTrigger(hour=9, minute=0),
-            id="saved_keywords_refresh",
+            job_id="saved_keywords_refresh",
             name="Daily Saved Keywords Refresh",
-            replace_existing=True
         )
 
         # 매일 새벽 2시에 키워드 파라미터 자동 학습
-        self.scheduler.add_job(
+        self._add_job_if_missing(
             self.nightly_training_job,
             CronTrigger(hour=2, minute=0),
-            id="nightly_training",
+            job_id="nightly_training",
             name="Nightly Parameter Training",
-            replace_existing=True
         )
 
         # 매일 오전 10시에 Activity D+1/D+7 결과 업데이트
-        self.scheduler.add_job(
+        self._add_job_if_missing(
             self.update_activity_results,
             CronTrigger(hour=10, minute=0),
-            id="activity_results_update",
+            job_id="activity_results_update",
             name="Activity D+1/D+7 Results Update",
-            replace_existing=True
         )
 
         # 매일 새벽 3시에 30일 경과 데이터 자동 삭제
-        self.scheduler.add_job(
+        self._add_job_if_missing(
             self.cleanup_expired_data,
             CronTrigger(hour=3, minute=30),
-            id="cleanup_expired_data",
+            job_id="cleanup_expired_data",
             name="Cleanup Expired Data (30 days)",
-            replace_existing=True
         )
 
         self.scheduler.start()
@@ -106,6 +103,17 @@ class PlaceScheduler:
         logger.info("  - 03,09,15,21:00 | Periodic Rank Check")
         logger.info("=" * 60)
 
+    def _add_job_if_missing(self, func, trigger, job_id: str, name: str):
+        """
+        job이 등록되어 있지 않을 때만 추가
+
+        replace_existing=True는 재시작마다 job store에 삭제+재등록을 수행하므로,
+        이미 있는 job은 그대로 둡니다.
+        """
+        if self.scheduler.get_job(job_id):
+            return
+        self.scheduler.add_job(func, trigger, id=job_id, name=name)
+
     def stop(self):
         """스케줄러 종료"""
         if self.scheduler:
@@ -113,6 +121,17 @@ class PlaceScheduler:
             self._is_running = False
             logger.info("Place Scheduler stopped")
 
+    @staticmethod
+    async def _relax_commit_durability(db: AsyncSession):
+        """
+        현재 트랜잭션에 한해 synchronous_commit 해제 (PostgreSQL 전용)
+
+        RankHistory는 append-only 데이터이고 유실되더라도 다음 크롤링에서 다시 수집되므로,
+        대량 INSERT 시 WAL flush 대기를 생략합니다.
+        """
+        if is_postgres:
+            await db.execute(text("SET LOCAL synchronous_commit = off"))
+
     async def collect_daily_data(self):
         """등록된 모든 플레이스의 일일 데이터 수집"""
         logger.info("Starting daily data collection...")
@@ -149,7 +168,7 @@ class PlaceScheduler:
                             for result in search_results:
                                 if str(result.get("place_id")) == str(tracked.place_id):
                                     place_info = result
-                                    logger.info(f"Found place via keyword '{keyword}': {result.get('name')}")
+                                    logger.debug("Found place via keyword '%s': %s", keyword, result.get("name"))
                                     break
                             if place_info:
                                 break
@@ -229,6 +248,7 @@ class PlaceScheduler:
 
                 total_keywords = 0
                 success_count = 0
+                history_rows: List[Dict[str, Any]] = []
 
                 for tracked in tracked_places:
                     keywords = tracked.keywords or []
@@ -245,15 +265,14 @@ class PlaceScheduler:
                                 keyword
                             )
 
-                            # 기록 저장
-                            rank_history = RankHistory(
-                                place_id=tracked.place_id,
-                                keyword=keyword,
-                                rank=rank_result.get("rank"),
-                                total_results=rank_result.get("total_results", 0),
-                                checked_at=datetime.now()
-                            )
-                            db.add(rank_history)
+                            # 기록 (루프 종료 후 일괄 INSERT)
+                            history_rows.append({
+                                "place_id": tracked.place_id,
+                                "keyword": keyword,
+                                "rank": rank_result.get("rank"),
+                                "total_results": rank_result.get("total_results", 0),
+                                "checked_at": datetime.now(),
+                            })
                             success_count += 1
 
                             # 요청 간격 두기
@@ -262,6 +281,11 @@ class PlaceScheduler:
                         except Exception as e:
                             logger.error(f"Error checking rank for {tracked.place_id} - {keyword}: {e}")
 
+                # 히스토리 일괄 INSERT (ORM 객체 생성/identity map 등록 생략)
+                if history_rows:
+                    await db.execute(insert(RankHistory), history_rows)
+
+                await self._relax_commit_durability(db)
                 await db.commit()
                 logger.info(f"Rank check completed: {success_count}/{total_keywords} keywords checked")
 
@@ -310,20 +334,36 @@ class PlaceScheduler:
             logger.error(f"Error collecting single place {place_id}: {e}")
             return False
 
-    async def refresh_saved_keywords(self):
-        """저장된 키워드들의 순위/리뷰/지수를 크롤링하고 히스토리 저장 (순위 추적 페이지용)"""
+    async def refresh_saved_keywords(self, force: bool = False):
+        """저장된 키워드들의 순위/리뷰/지수를 크롤링하고 히스토리 저장 (순위 추적 페이지용)
+
+        Args:
+            force: True면 이번 크롤링 주기(오전 9시 기준)에 이미 수집된 키워드도 다시 크롤링
+        """
         logger.info("[SavedKeywords] 자동 크롤링 시작...")
 
+        # 이번 크롤링 주기 시작 시각 (가장 최근의 오전 9시)
+        now = datetime.now()
+        crawl_window_start = now.replace(hour=9, minute=0, second=0, microsecond=0)
+        if now < crawl_window_start:
+            crawl_window_start -= timedelta(days=1)
+
         async with AsyncSessionLocal() as db:
             try:
-                # 모든 활성 키워드 조회
-                result = await db.execute(
-                    select(SavedKeyword).where(SavedKeyword.is_active == 1)
-                )
+                # 활성 키워드 중 이번 주기에 아직 크롤링되지 않은 키워드 조회 (재시작 시 중복 크롤링 방지)
+                query = select(SavedKeyword).where(SavedKeyword.is_active == True)
+                if not force:
+                    query = query.where(
+                        or_(
+                            SavedKeyword.last_crawled_at.is_(None),
+                            SavedKeyword.last_crawled_at < crawl_window_start,
+                        )
+                    )
+                result = await db.execute(query)
                 keywords = result.scalars().all()
 
                 if not keywords:
-                    logger.info("[SavedKeywords] 저장된 키워드 없음")
+                    logger.info("[SavedKeywords] 크롤링할 키워드 없음")
                     return
 
                 logger.info(f"[SavedKeywords] 크롤링할 키워드 수: {len(keywords)}")
@@ -331,57 +371,88 @@ class PlaceScheduler:
                 success_count = 0
                 error_count = 0
 
+                # 이번 실행 동안 키워드별 검색 결과 재사용 (같은 키워드는 한 번만 크롤링)
+                serp_cache: Dict[str, List[Dict[str, Any]]] = {}
+                history_rows: List[Dict[str, Any]] = []
+                crawled_ids: List[int] = []
+
                 for kw in keywords:
                     try:
                         # 순위 조회 (분석 포함)
-                        rank_result = await self.naver_service.get_place_rank(kw.place_id, kw.keyword)
+                        serp_key = kw.keyword.lower().strip()
+                        cache_hit = serp_key in serp_cache
+                        if not cache_hit:
+                            serp_cache[serp_key] = await self.naver_service.get_ranked_list(kw.keyword)
+                        rank_result = await self.naver_service.get_place_rank(
+                            kw.place_id, kw.keyword, search_results=serp_cache[serp_key]
+                        )
                         new_rank = rank_result.get("rank")
 
                         # 분석 결과에서 데이터 추출
-                        visitor_review_count = 0
-                        blog_review_count = 0
-                        place_score = None
-
-                        analysis = rank_result.get("analysis")
-                        if analysis and analysis.get("target_analysis"):
-                            target = analysis["target_analysis"]
-                            place_score = target.get("total_score")
-                            counts = target.get("counts", {})
-                            visitor_review_count = counts.get("visitor_review", 0)
-                            blog_review_count = counts.get("blog_review", 0)
-
-                        # 키워드 업데이트
-                        kw.last_rank = new_rank
-                        kw.visitor_review_count = visitor_review_count
-                        kw.blog_review_count = blog_review_count
-                        kw.place_score = place_score
+                        metadata = NaverPlaceService.get_place_metadata(rank_result)
+                        place_score = metadata["place_score"]
+                        visitor_review_count = metadata["visitor_review_count"]
+                        blog_review_count = metadata["blog_review_count"]
+
+                        # 키워드 업데이트 (변화가 없으면 UPDATE 생략, 히스토리는 항상 기록)
+                        new_values = (new_rank, visitor_review_count, blog_review_count, place_score)
+                        old_values = (kw.last_rank, kw.visitor_review_count, kw.blog_review_count, kw.place_score)
+                        if new_values != old_values:
+                            kw.last_rank = new_rank
+                            kw.visitor_review_count = visitor_review_count
+                            kw.blog_review_count = blog_review_count
+                            kw.place_score = place_score
+                            kw.updated_at = datetime.now()
                         if new_rank and (kw.best_rank is None or new_rank < kw.best_rank):
                             kw.best_rank = new_rank
-                        kw.updated_at = datetime.now()
-
-                        # 히스토리 저장
-                        history = RankHistory(
-                            place_id=kw.place_id,
-                            keyword=kw.keyword,
-                            rank=new_rank,
-                            total_results=rank_result.get("total_results"),
-                            visitor_review_count=visitor_review_count,
-                            blog_review_count=blog_review_count,
-                            place_score=place_score,
-                            checked_at=datetime.now()
-                        )
-                        db.add(history)
+
+                        # 히스토리 저장 (루프 종료 후 일괄 INSERT)
+                        history_rows.append({
+                            "place_id": kw.place_id,
+                            "keyword": kw.keyword,
+                            "rank": new_rank,
+                            "total_results": rank_result.get("total_results"),
+                            "visitor_review_count": visitor_review_count,
+                            "blog_review_count": blog_review_count,
+                            "place_score": place_score,
+                            "checked_at": datetime.now(),
+                        })
+                        crawled_ids.append(kw.id)
 
                         success_count += 1
-                        logger.info(f"[SavedKeywords] {kw.place_name} - {kw.keyword}: {new_rank}위, 리뷰: {visitor_review_count}/{blog_review_count}, 점수: {place_score}")
+                        logger.debug(
+                            "[SavedKeywords] %s - %s: %s위, 리뷰: %s/%s, 점수: %s",
+                            kw.place_name, kw.keyword, new_rank,
+                            visitor_review_count, blog_review_count, place_score,
+                        )
 
-                        # 요청 간격 (네이버 차단 방지)
-                        await asyncio.sleep(3)
+                        # 요청 간격 (네이버 차단 방지) - 캐시 재사용 시에는 요청이 없으므로 생략
+                        if not cache_hit:
+                            await asyncio.sleep(3)
 
                     except Exception as e:
                         error_count += 1
                         logger.error(f"[SavedKeywords] 크롤링 실패 - {kw.keyword}: {str(e)}")
 
+                # 히스토리 일괄 INSERT (RETURNING으로 id까지 한 번에 조회)
+                if history_rows:
+                    await self._relax_commit_durability(db)
+                    insert_result = await db.execute(
+                        insert(RankHistory).returning(RankHistory.id),
+                        history_rows
+                    )
+                    history_ids = insert_result.scalars().all()
+                    logger.debug("[SavedKeywords] 히스토리 %d건 저장 (id: %s)", len(history_ids), history_ids)
+
+                # 크롤링 완료 시각 일괄 기록
+                # (updated_at은 현재 값으로 고정 - onupdate로 변경 없는 키워드까지 갱신되지 않도록)
+                if crawled_ids:
+                    await db.execute(
+                        update(SavedKeyword)
+                        .where(SavedKeyword.id.in_(crawled_ids))
+                        .values(last_crawled_at=now, updated_at=SavedKeyword.updated_at)
+                    )
+
                 await db.commit()
                 logger.info(f"[SavedKeywords] 크롤링 완료: 성공 {success_count}, 실패 {error_count}")
 
@@ -402,7 +473,7 @@ class PlaceScheduler:
             logger.warning("[Scheduler] 학습 작업이 이미 실행 중입니다.")
             return
 
-        logger.info(f"[Scheduler] 새벽 자동 학습 시작: {datetime.now()}")
+        logger.info("[Scheduler] 새벽 자동 학습 시작")
         training_status["is_running"] = True
 
         try:
@@ -463,9 +534,13 @@ class PlaceScheduler:
 
                 logger.info(f"[Scheduler] D+1 업데이트 대상: {len(d1_logs)}개")
 
-                for log in d1_logs:
+                # 프록시 수만큼 동시 조회 (결과는 대상 순서대로, 실패는 해당 위치에 예외로 반환)
+                d1_results = await adlog_service.fetch_keywords_bulk([log.keyword for log in d1_logs])
+
+                for log, raw_data in zip(d1_logs, d1_results):
                     try:
-                        raw_data = await adlog_service.fetch_keyword_analysis(log.keyword)
+                        if isinstance(raw_data, BaseException):
+                            raise raw_data
                         places = raw_data.get("places", [])
 
                         for place in places:
@@ -481,12 +556,9 @@ class PlaceScheduler:
                                 log.n3_after_1d = raw_indices.get("n3")
                                 log.measured_at_1d = datetime.now()
                                 updated_count += 1
-                                logger.info(f"[Scheduler] D+1 업데이트: {log.keyword} - 순위 {log.rank_after_1d}")
+                                logger.debug("[Scheduler] D+1 업데이트: %s - 순위 %s", log.keyword, log.rank_after_1d)
                                 break
 
-                        # 요청 간격 (네이버 차단 방지)
-                        await asyncio.sleep(2)
-
                     except AdlogApiError as e:
                         logger.warning(f"[Scheduler] D+1 조회 실패 - {log.keyword}: {str(e)}")
                     except Exception as e:
@@ -506,9 +578,13 @@ class PlaceScheduler:
 
                 logger.info(f"[Scheduler] D+7 업데이트 대상: {len(d7_logs)}개")
 
-                for log in d7_logs:
+                # 프록시 수만큼 동시 조회 (결과는 대상 순서대로, 실패는 해당 위치에 예외로 반환)
+                d7_results = await adlog_service.fetch_keywords_bulk([log.keyword for log in d7_logs])
+
+                for log, raw_data in zip(d7_logs, d7_results):
                     try:
-                        raw_data = await adlog_service.fetch_keyword_analysis(log.keyword)
+                        if isinstance(raw_data, BaseException):
+                            raise raw_data
                         places = raw_data.get("places", [])
 
                         for place in places:
@@ -524,12 +600,9 @@ class PlaceScheduler:
                                 log.n3_after_7d = raw_indices.get("n3")
                                 log.measured_at_7d = datetime.now()
                                 updated_count += 1
-                                logger.info(f"[Scheduler] D+7 업데이트: {log.keyword} - 순위 {log.rank_after_7d}")
+                                logger.debug("[Scheduler] D+7 업데이트: %s - 순위 %s", log.keyword, log.rank_after_7d)
                                 break
 
-                        # 요청 간격 (네이버 차단 방지)
-                        await asyncio.sleep(2)
-
                     except AdlogApiError as e:
                         logger.warning(f"[Scheduler] D+7 조회 실패 - {log.keyword}: {str(e)}")
                     except Exception as e:
@@ -550,22 +623,33 @@ class PlaceScheduler:
         30일 경과 데이터 자동 삭제
 
         AdlogTrainingData 테이블에서 expires_at이 지난 데이터를 삭제합니다.
+        expires_at 인덱스로 만료 행만 골라 PURGE_BATCH_SIZE 단위로 나눠 삭제하고
+        배치마다 커밋해 긴 트랜잭션과 락 점유를 피합니다.
         """
         logger.info("[Scheduler] 만료 데이터 정리 시작...")
 
         try:
             async with AsyncSessionLocal() as db:
                 now = datetime.now()
+                deleted_count = 0
+
+                while True:
+                    expired_ids = (
+                        select(AdlogTrainingData.id)
+                        .where(AdlogTrainingData.expires_at < now)
+                        .limit(PURGE_BATCH_SIZE)
+                        .scalar_subquery()
+                    )
+                    result = await db.execute(
+                        delete(AdlogTrainingData)
+                        .where(AdlogTrainingData.id.in_(expired_ids))
+                        .execution_options(synchronize_session=False)
+                    )
+                    await db.commit()
 
-                # 만료된 AdlogTrainingData 삭제
-                delete_query = delete(AdlogTrainingData).where(
-                    AdlogTrainingData.expires_at < now
-                )
-
-                result = await db.execute(delete_query)
-                deleted_count = result.rowcount
-
-                await db.commit()
+                    deleted_count += result.rowcount
+                    if result.rowcount < PURGE_BATCH_SIZE:
+                        break
 
                 if deleted_count > 0:
                     logger.info(f"[Scheduler] 만료 데이터 정리 완료: {deleted_count}건 삭제")
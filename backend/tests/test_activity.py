@@ -188,6 +188,47 @@ class TestCorrelationAnalyzer:
         assert effect.avg_rank_change_1d == 2.5
         assert effect.avg_rank_change_7d == 5.0
 
+    def test_pearson_fit_matches_scipy(self):
+        """닫힌 형태 상관/회귀 계산이 scipy 결과와 일치"""
+        from scipy import stats
+        from app.ml.correlation_analyzer import _pearson_fit
+
+        x = [1, 2, 3, 5, 8, 13]
+        y = [2.0, 1.5, 4.0, 3.5, 9.0, 12.5]
+
+        corr, p_val, slope, intercept = _pearson_fit(x, y)
+        expected = stats.linregress(x, y)
+
+        assert corr == pytest.approx(expected.rvalue)
+        assert p_val == pytest.approx(expected.pvalue)
+        assert slope == pytest.approx(expected.slope)
+        assert intercept == pytest.approx(expected.intercept)
+
+    def test_pearson_fit_constant_input(self):
+        """x가 상수면 None, y가 상수면 상관계수만 None"""
+        from app.ml.correlation_analyzer import _pearson_fit
+
+        assert _pearson_fit([3, 3, 3], [1, 2, 3]) == (None, None, None, None)
+        assert _pearson_fit([1, 2, 3], [5, 5, 5]) == (None, None, 0.0, 5.0)
+
+    def test_pearson_fit_batch_matches_single(self):
+        """여러 쌍을 한 번에 계산해도 쌍별 계산과 같은 결과"""
+        from app.ml.correlation_analyzer import _pearson_fit, _pearson_fit_batch
+
+        pairs = [
+            ([1, 2, 3, 4], [4.0, 3.0, 2.5, 1.0]),
+            ([2, 4, 6, 8, 10, 12], [1.0, 3.0, 2.0, 5.0, 4.0, 6.0]),
+            ([1, 1, 1], [1.0, 2.0, 3.0]),
+            ([1, 2, 3], [1.0, 2.0]),  # 길이 불일치
+        ]
+
+        batch = _pearson_fit_batch(pairs)
+
+        assert len(batch) == len(pairs)
+        for (x, y), fit in zip(pairs, batch):
+            assert fit == pytest.approx(_pearson_fit(x, y))
+        assert batch[2] == (None, None, None, None)
+        assert batch[3] == (None, None, None, None)
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
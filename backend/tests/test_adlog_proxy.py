@@ -0,0 +1,97 @@
+"""
+ADLOG 프록시 서비스 테스트
+- 여러 키워드 동시 조회 (fetch_keywords_bulk)
+- 이벤트 루프별 HTTP 클라이언트 (_get_client)
+"""
+import asyncio
+
+import pytest
+from unittest.mock import patch
+
+from app.services.adlog_proxy import AdlogApiError, AdlogProxyService, ProxyRotator
+
+
+def _make_service(proxy_count: int) -> AdlogProxyService:
+    service = AdlogProxyService()
+    service._proxy_rotator = ProxyRotator(
+        [{"url": f"http://proxy{i}:8080", "name": f"proxy{i}"} for i in range(proxy_count)]
+    )
+    return service
+
+
+class TestFetchKeywordsBulk:
+    """fetch_keywords_bulk 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_results_keep_input_order(self):
+        """먼저 끝난 요청과 관계없이 결과는 입력 순서대로 반환"""
+        service = _make_service(3)
+        delays = {"강남맛집": 0.03, "역삼맛집": 0.01, "홍대맛집": 0.0}
+
+        async def fake_fetch(keyword, force_refresh=False):
+            await asyncio.sleep(delays[keyword])
+            return {"keyword": keyword}
+
+        with patch.object(service, "fetch_keyword_analysis", side_effect=fake_fetch):
+            results = await service.fetch_keywords_bulk(list(delays))
+
+        assert [r["keyword"] for r in results] == list(delays)
+
+    @pytest.mark.asyncio
+    async def test_failures_returned_in_place(self):
+        """개별 실패는 해당 위치에 예외로 담기고 나머지 결과는 정상 반환"""
+        service = _make_service(2)
+
+        async def fake_fetch(keyword, force_refresh=False):
+            if keyword == "역삼맛집":
+                raise AdlogApiError("조회 실패")
+            return {"keyword": keyword}
+
+        with patch.object(service, "fetch_keyword_analysis", side_effect=fake_fetch):
+            results = await service.fetch_keywords_bulk(["강남맛집", "역삼맛집", "홍대맛집"])
+
+        assert results[0] == {"keyword": "강남맛집"}
+        assert isinstance(results[1], AdlogApiError)
+        assert results[2] == {"keyword": "홍대맛집"}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("proxy_count, expected", [(0, 1), (2, 2)])
+    async def test_concurrency_capped_at_proxy_count(self, proxy_count, expected):
+        """동시 요청 수는 사용 가능한 프록시 수로 제한 (프록시가 없으면 1건씩)"""
+        service = _make_service(proxy_count)
+        in_flight = 0
+        peak = 0
+
+        async def fake_fetch(keyword, force_refresh=False):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"keyword": keyword}
+
+        with patch.object(service, "fetch_keyword_analysis", side_effect=fake_fetch):
+            results = await service.fetch_keywords_bulk([f"키워드{i}" for i in range(6)])
+
+        assert len(results) == 6
+        assert peak == expected
+
+
+class TestGetClient:
+    """_get_client 테스트"""
+
+    def test_clients_from_previous_loop_are_closed(self):
+        """이벤트 루프가 바뀌면 이전 루프의 클라이언트를 닫고 새로 생성"""
+        service = _make_service(0)
+
+        old_client = asyncio.run(service._get_client(None))
+        new_client = asyncio.run(service._get_client(None))
+
+        assert new_client is not old_client
+        assert old_client.is_closed
+        assert not new_client.is_closed
+        asyncio.run(service.aclose())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -4,6 +4,7 @@ ModelAnalyzer 테스트
 - 리포트 생성
 - 예측값 vs 실제값 비교
 """
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from datetime import datetime
@@ -56,20 +57,22 @@ class TestAnalyzeAccuracy:
         """유효한 데이터로 정확도 분석"""
         mock_db = AsyncMock()
 
-        # training data 조회 모킹
+        # 데이터 버전 확인 + training data 조회 모킹
+        version_result = MagicMock()
+        version_result.one.return_value = (datetime.utcnow(), len(mock_training_data))
         training_result = MagicMock()
-        training_result.scalars.return_value.all.return_value = mock_training_data
-        mock_db.execute.return_value = training_result
+        training_result.all.return_value = mock_training_data
+        mock_db.execute.side_effect = [version_result, training_result]
 
         with patch('app.ml.analyzer.parameter_repository') as mock_repo, \
              patch('app.ml.analyzer.formula_calculator') as mock_calc:
             mock_repo.get_by_keyword = AsyncMock(return_value=mock_params)
             mock_calc.can_calculate.return_value = True
-            mock_calc.calculate_all_indices.return_value = {
-                "n1": 45.0,
-                "n2": 80.0,
-                "n3": 65.0
-            }
+            mock_calc.calculate_all_indices_vec.side_effect = lambda params, ranks: (
+                np.full(len(ranks), 45.0),
+                np.full(len(ranks), 80.0),
+                np.full(len(ranks), 65.0),
+            )
 
             result = await analyzer.analyze_accuracy(mock_db, "테스트키워드")
 
@@ -117,9 +120,11 @@ class TestAnalyzeAccuracy:
 
         # 2개 데이터만 반환
         insufficient_data = [MagicMock() for _ in range(2)]
+        version_result = MagicMock()
+        version_result.one.return_value = (datetime.utcnow(), 2)
         training_result = MagicMock()
-        training_result.scalars.return_value.all.return_value = insufficient_data
-        mock_db.execute.return_value = training_result
+        training_result.all.return_value = insufficient_data
+        mock_db.execute.side_effect = [version_result, training_result]
 
         with patch('app.ml.analyzer.parameter_repository') as mock_repo, \
              patch('app.ml.analyzer.formula_calculator') as mock_calc:
@@ -132,6 +137,39 @@ class TestAnalyzeAccuracy:
         assert "데이터 부족" in result["error"]
 
 
+    @pytest.mark.asyncio
+    async def test_analyze_accuracy_uses_cache_when_data_unchanged(self, analyzer, mock_params, mock_training_data):
+        """학습 데이터가 그대로면 두 번째 호출은 버전 확인 쿼리만 실행"""
+        mock_db = AsyncMock()
+        collected_at = datetime.utcnow()
+
+        def version_result():
+            result = MagicMock()
+            result.one.return_value = (collected_at, len(mock_training_data))
+            return result
+
+        training_result = MagicMock()
+        training_result.all.return_value = mock_training_data
+        mock_db.execute.side_effect = [version_result(), training_result, version_result()]
+
+        with patch('app.ml.analyzer.parameter_repository') as mock_repo, \
+             patch('app.ml.analyzer.formula_calculator') as mock_calc:
+            mock_repo.get_by_keyword = AsyncMock(return_value=mock_params)
+            mock_calc.can_calculate.return_value = True
+            mock_calc.calculate_all_indices_vec.side_effect = lambda params, ranks: (
+                np.full(len(ranks), 45.0),
+                np.full(len(ranks), 80.0),
+                np.full(len(ranks), 65.0),
+            )
+
+            first = await analyzer.analyze_accuracy(mock_db, "테스트키워드")
+            second = await analyzer.analyze_accuracy(mock_db, "테스트키워드")
+
+        assert first["success"] is True
+        assert second is first
+        assert mock_db.execute.await_count == 3
+        assert mock_calc.calculate_all_indices_vec.call_count == 1
+
 class TestCalculateMetrics:
     """_calculate_metrics 테스트"""
 
@@ -171,6 +209,19 @@ class TestCalculateMetrics:
         assert result["rmse"] == 0.0
         assert result["r_squared"] == 1.0
 
+    def test_calculate_metrics_mape_skips_zero_actuals(self, analyzer):
+        """실제값이 0인 항목은 MAPE 계산에서 제외"""
+        actual = [0.0, 50.0, 100.0]
+        predicted = [10.0, 40.0, 110.0]
+
+        result = analyzer._calculate_metrics(actual, predicted, "N2")
+
+        # (|50-40|/50 + |100-110|/100) / 2 * 100 = 15%
+        assert result is not None
+        assert result["mape_percent"] == 15.0
+        assert result["mae"] == 10.0
+        assert result["rmse"] == 10.0
+
 
 class TestGenerateReport:
     """generate_report 테스트"""
@@ -184,21 +235,25 @@ class TestGenerateReport:
         params_result = MagicMock()
         params_result.scalars.return_value.all.return_value = [mock_params]
 
+        # 데이터 버전 확인
+        version_result = MagicMock()
+        version_result.all.return_value = [("테스트키워드", datetime.utcnow(), len(mock_training_data))]
+
         # training data 조회
         training_result = MagicMock()
-        training_result.scalars.return_value.all.return_value = mock_training_data
+        training_result.all.return_value = mock_training_data
 
-        mock_db.execute.side_effect = [params_result, training_result]
+        mock_db.execute.side_effect = [params_result, version_result, training_result]
 
         with patch('app.ml.analyzer.parameter_repository') as mock_repo, \
              patch('app.ml.analyzer.formula_calculator') as mock_calc:
             mock_repo.get_by_keyword = AsyncMock(return_value=mock_params)
             mock_calc.can_calculate.return_value = True
-            mock_calc.calculate_all_indices.return_value = {
-                "n1": 45.0,
-                "n2": 80.0,
-                "n3": 65.0
-            }
+            mock_calc.calculate_all_indices_vec.side_effect = lambda params, ranks: (
+                np.full(len(ranks), 45.0),
+                np.full(len(ranks), 80.0),
+                np.full(len(ranks), 65.0),
+            )
 
             result = await analyzer.generate_report(mock_db)
 
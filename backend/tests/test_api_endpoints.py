@@ -128,5 +128,75 @@ class TestHealthEndpoints:
         assert response.status_code == 200
 
 
+class TestStartupImports:
+    """앱 import 시 무거운 ML 모듈 로딩 여부 테스트"""
+
+    def test_app_import_skips_scipy(self):
+        """app.main import만으로는 scipy/학습 모듈을 로드하지 않음 (첫 사용 시 로드)"""
+        import subprocess
+
+        code = (
+            "import sys, app.main; "
+            "print(sorted(m for m in ('scipy', 'app.ml.trainer', 'app.ml.analyzer') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            capture_output=True, text=True, check=True,
+        )
+        assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+class TestCorsOrigins:
+    """CORS origin 허용 범위 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    def _preflight(self, client, origin):
+        return client.options(
+            "/health",
+            headers={"Origin": origin, "Access-Control-Request-Method": "GET"},
+        )
+
+    def test_owned_vercel_origin_allowed(self, client):
+        """프로덕션 Vercel origin은 허용"""
+        response = self._preflight(client, "https://place-chi.vercel.app")
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "https://place-chi.vercel.app"
+
+    def test_foreign_vercel_origin_rejected(self, client):
+        """다른 사람이 만든 place-* Vercel 프로젝트 origin은 거부"""
+        response = self._preflight(client, "https://place-evil.vercel.app")
+        assert response.status_code == 400
+        assert "access-control-allow-origin" not in response.headers
+
+
+class TestKeywordRankSnapshot:
+    """키워드 순위 스냅샷 생성 테스트"""
+
+    def test_build_rank_snapshot_creates_entries(self):
+        """rank_data와 정규화된 순위 항목이 같은 내용으로 생성"""
+        from datetime import datetime
+        from app.api.place import _build_rank_snapshot
+
+        places = [
+            {"place_id": 111, "name": "업체A", "category": "카페", "visitor_review_count": 10},
+            {"place_id": "222", "name": "업체B", "save_count": 5},
+        ]
+
+        snapshot = _build_rank_snapshot("테스트", places, datetime(2025, 1, 1))
+
+        assert snapshot.total_places == 2
+        assert [item["rank"] for item in snapshot.rank_data] == [1, 2]
+        assert [(e.rank, e.place_id, e.name) for e in snapshot.entries] == [
+            (1, "111", "업체A"),
+            (2, "222", "업체B"),
+        ]
+        assert snapshot.entries[0].visitor_review_count == 10
+        assert snapshot.entries[1].save_count == 5
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
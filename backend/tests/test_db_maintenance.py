@@ -0,0 +1,61 @@
+"""
+DB 유지보수 작업 테스트
+- 기존 테이블 스키마 보정 (init_db)
+- 누락 인덱스 생성 DDL (PostgreSQL CONCURRENTLY)
+"""
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.dialects import postgresql
+
+from app.core.database import Base, _upgrade_legacy_schema
+from app.core.db_maintenance import _concurrent_create_index_sql
+from app.models.place import AdlogTrainingData, SavedKeyword
+
+
+class TestUpgradeLegacySchema:
+    """_upgrade_legacy_schema 테스트"""
+
+    def test_adds_last_crawled_at_to_existing_table(self):
+        """last_crawled_at 없이 만들어진 기존 saved_keywords에 컬럼 추가 (재실행해도 안전)"""
+        engine = create_engine("sqlite://")
+        with engine.begin() as conn:
+            Base.metadata.create_all(conn)
+            conn.execute(text("DROP INDEX ix_saved_keywords_last_crawled_at"))
+            conn.execute(text("ALTER TABLE saved_keywords DROP COLUMN last_crawled_at"))
+
+            _upgrade_legacy_schema(conn)
+            _upgrade_legacy_schema(conn)
+
+            columns = {c["name"] for c in inspect(conn).get_columns("saved_keywords")}
+            assert "last_crawled_at" in columns
+            # 모델 조회가 새 컬럼과 함께 동작
+            conn.execute(SavedKeyword.__table__.select())
+
+
+class TestConcurrentCreateIndexSql:
+    """_concurrent_create_index_sql 테스트"""
+
+    def _index(self, name):
+        return next(ix for ix in AdlogTrainingData.__table__.indexes if ix.name == name)
+
+    def test_composite_index(self):
+        """복합 인덱스는 CONCURRENTLY IF NOT EXISTS로 생성"""
+        sql = _concurrent_create_index_sql(
+            self._index("ix_adlog_training_data_keyword_collected"), postgresql.dialect()
+        )
+        assert sql == (
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_adlog_training_data_keyword_collected "
+            "ON adlog_training_data (keyword, collected_at)"
+        )
+
+    def test_brin_index_keeps_options(self):
+        """BRIN 인덱스 옵션 유지"""
+        sql = _concurrent_create_index_sql(
+            self._index("ix_adlog_training_data_collected_brin"), postgresql.dialect()
+        )
+        assert sql.startswith("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_adlog_training_data_collected_brin")
+        assert "USING brin (collected_at) WITH (pages_per_range = 32)" in sql
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -4,10 +4,11 @@ Formula Calculator 테스트
 - N2 회귀
 - N3 계산: predictor.py와 일치 검증
 """
+import numpy as np
 import pytest
 from unittest.mock import MagicMock
 from app.services.formula_calculator import FormulaCalculator
-from app.ml.predictor import calculate_n3
+from app.ml.predictor import calculate_n3, calculate_n3_array
 
 
 @pytest.fixture
@@ -30,6 +31,19 @@ def mock_params():
     return params
 
 
+@pytest.fixture
+def scaled_params():
+    """0~1 스케일 파라미터 (N3 회귀 포함, 순위가 낮으면 N2가 클램프 구간에 들어감)"""
+    params = MagicMock()
+    params.n1_constant = 0.45
+    params.n2_slope = -0.004
+    params.n2_intercept = 0.6
+    params.n3_slope = 0.9
+    params.n3_intercept = 0.05
+    params.is_reliable = True
+    return params
+
+
 @pytest.fixture
 def unreliable_params():
     """신뢰성 없는 파라미터"""
@@ -105,6 +119,16 @@ class TestFormulaCalculator:
             assert abs(fc_n3 - pred_n3) < 0.0001, \
                 f"N1={n1}, N2={n2}: FormulaCalculator={fc_n3}, Predictor={pred_n3}"
 
+    def test_calculate_n3_array_matches_scalar(self):
+        """배열 N3 계산이 스칼라 calculate_n3와 일치 (0-1/0-100 스케일 혼합)"""
+        n1 = [45.0, 0.3, 60.0, 10.0, 0.9, 100.0]
+        n2 = [70.0, 0.5, 0.8, 20.0, 95.0, 0.0]
+
+        n3 = calculate_n3_array(np.array(n1), np.array(n2))
+
+        for i in range(len(n1)):
+            assert n3[i] == pytest.approx(calculate_n3(n1[i], n2[i]))
+
     def test_calculate_n3_edge_cases(self, calculator):
         """N3 계산 경계값 테스트"""
         # 최소값 테스트
@@ -163,6 +187,49 @@ class TestFormulaCalculator:
         # 순위가 높을수록 N2는 낮아져야 함
         assert results[0]["n2"] > results[4]["n2"]
 
+    def test_generate_calculated_places_matches_scalar(self, calculator, scaled_params):
+        """일괄 계산 결과가 순위별 calculate_all_indices와 일치 (클램프 구간 포함)"""
+        # 짧은 목록은 파이썬 루프, 긴 목록(VECTORIZE_MIN_RANKS 이상)은 배열 연산 경로
+        for ranks in ([1, 5, 10, 50, 200], list(range(1, 301, 7))):
+            results = calculator.generate_calculated_places(scaled_params, ranks)
+
+            assert results == [
+                {"rank": rank, **calculator.calculate_all_indices(scaled_params, rank)}
+                for rank in ranks
+            ]
+
+    def test_prepare(self, calculator, scaled_params, unreliable_params):
+        """prepare 스냅샷은 원본 파라미터와 같은 결과, 계산 불가능하면 None"""
+        prepared = calculator.prepare(scaled_params)
+
+        assert prepared is not None
+        assert calculator.can_calculate(prepared)
+        assert calculator.calculate_all_indices(prepared, 7) == calculator.calculate_all_indices(scaled_params, 7)
+        assert calculator.prepare(unreliable_params) is None
+        assert calculator.prepare(None) is None
+
+    def test_calculate_all_indices_vec_matches_scalar(self, calculator, scaled_params):
+        """배열 계산 결과가 순위별 calculate_all_indices와 일치"""
+        ranks = [1, 5, 10, 50, 200]
+        n1, n2, n3 = calculator.calculate_all_indices_vec(scaled_params, np.array(ranks))
+
+        for i, rank in enumerate(ranks):
+            expected = calculator.calculate_all_indices(scaled_params, rank)
+            assert n1[i] == pytest.approx(expected["n1"])
+            assert n2[i] == pytest.approx(expected["n2"])
+            assert n3[i] == pytest.approx(expected["n3"])
+
+    def test_calculate_all_indices_vec_missing_params(self, calculator, unreliable_params):
+        """파라미터가 없는 지수는 None"""
+        unreliable_params.n3_slope = None
+        unreliable_params.n3_intercept = None
+
+        n1, n2, n3 = calculator.calculate_all_indices_vec(unreliable_params, np.array([1, 2]))
+
+        assert n1 is None
+        assert n2 is None
+        assert n3 is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -2,7 +2,10 @@
 Parameter Extractor 테스트
 """
 import pytest
-from app.services.parameter_extractor import ParameterExtractor
+from unittest.mock import AsyncMock, MagicMock
+
+from app.models.place import KeywordParameter
+from app.services.parameter_extractor import ParameterExtractor, ParameterRepository
 
 
 @pytest.fixture
@@ -129,5 +132,43 @@ class TestParameterExtractor:
         assert result["is_reliable"] == True
 
 
+class TestParameterRepository:
+    """ParameterRepository 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_save_or_update_many(self):
+        """기존 키워드는 갱신, 새 키워드는 추가 (조회는 한 번)"""
+        repo = ParameterRepository()
+        existing = KeywordParameter(keyword="기존", n1_constant=1.0, api_call_count=3)
+
+        mock_db = MagicMock()
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = [existing]
+        mock_db.execute = AsyncMock(return_value=mock_result)
+
+        saved = await repo.save_or_update_many(mock_db, [
+            {"keyword": "기존", "n1_constant": 45.0, "sample_count": 12, "is_reliable": True},
+            {"keyword": "신규", "n1_constant": 40.0, "sample_count": 10},
+        ])
+
+        mock_db.execute.assert_awaited_once()
+        assert saved[0] is existing
+        assert existing.n1_constant == 45.0
+        assert existing.api_call_count == 4
+        assert existing.is_reliable is True
+        assert saved[1].keyword == "신규"
+        assert saved[1].api_call_count == 1
+        mock_db.add.assert_called_once_with(saved[1])
+
+    @pytest.mark.asyncio
+    async def test_save_or_update_many_empty(self):
+        """빈 리스트는 DB 조회 없이 반환"""
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock()
+
+        assert await ParameterRepository().save_or_update_many(mock_db, []) == []
+        mock_db.execute.assert_not_awaited()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
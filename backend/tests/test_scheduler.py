@@ -0,0 +1,109 @@
+"""
+PlaceScheduler 테스트
+- 저장 키워드 자동 크롤링 (refresh_saved_keywords)
+"""
+import pytest
+import pytest_asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.core.database import Base
+from app.models.place import SavedKeyword
+from app.services.scheduler import PlaceScheduler
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """인메모리 SQLite 세션 팩토리"""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+class TestRefreshSavedKeywords:
+    """refresh_saved_keywords 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_keyword_keeps_updated_at(self, session_factory):
+        """순위/리뷰수 변화가 없는 키워드는 updated_at 유지, last_crawled_at만 기록"""
+        old_updated_at = datetime(2025, 1, 1, 12, 0, 0)
+
+        async with session_factory() as db:
+            db.add_all([
+                SavedKeyword(
+                    user_id=1, place_id="1234", keyword="강남맛집", last_rank=3, best_rank=3,
+                    visitor_review_count=0, blog_review_count=0, is_active=True,
+                    updated_at=old_updated_at,
+                ),
+                SavedKeyword(
+                    user_id=1, place_id="1234", keyword="역삼맛집", last_rank=10, best_rank=10,
+                    visitor_review_count=0, blog_review_count=0, is_active=True,
+                    updated_at=old_updated_at,
+                ),
+            ])
+            await db.commit()
+
+        scheduler = PlaceScheduler()
+        scheduler.naver_service = AsyncMock()
+        scheduler.naver_service.get_ranked_list.return_value = []
+        # 강남맛집은 기존과 같은 3위, 역삼맛집은 10위 → 5위로 변경
+        scheduler.naver_service.get_place_rank.side_effect = lambda place_id, keyword, **kwargs: {
+            "rank": 3 if keyword == "강남맛집" else 5,
+            "total_results": 50,
+        }
+
+        with patch("app.services.scheduler.AsyncSessionLocal", session_factory), \
+             patch("app.services.scheduler.asyncio.sleep", AsyncMock()):
+            await scheduler.refresh_saved_keywords()
+
+        async with session_factory() as db:
+            result = await db.execute(select(SavedKeyword).order_by(SavedKeyword.id))
+            unchanged, changed = result.scalars().all()
+
+        assert unchanged.updated_at == old_updated_at
+        assert unchanged.last_crawled_at is not None
+        assert changed.last_rank == 5
+        assert changed.updated_at != old_updated_at
+        assert changed.last_crawled_at is not None
+
+    @pytest.mark.asyncio
+    async def test_keywords_of_same_place_keep_own_counts(self, session_factory):
+        """같은 업체의 키워드라도 리뷰수는 각 키워드의 순위 조회 결과를 사용 (조회 순서 무관)"""
+        async with session_factory() as db:
+            db.add_all([
+                SavedKeyword(user_id=1, place_id="1234", keyword="강남맛집", is_active=True),
+                SavedKeyword(user_id=1, place_id="1234", keyword="역삼맛집", is_active=True),
+            ])
+            await db.commit()
+
+        counts = {"강남맛집": (100, 20), "역삼맛집": (120, 25)}
+        scheduler = PlaceScheduler()
+        scheduler.naver_service = AsyncMock()
+        scheduler.naver_service.get_ranked_list.return_value = []
+        scheduler.naver_service.get_place_rank.side_effect = lambda place_id, keyword, **kwargs: {
+            "rank": 1,
+            "total_results": 50,
+            "analysis": {"target_analysis": {
+                "total_score": 50.0,
+                "counts": {"visitor_review": counts[keyword][0], "blog_review": counts[keyword][1]},
+            }},
+        }
+
+        with patch("app.services.scheduler.AsyncSessionLocal", session_factory), \
+             patch("app.services.scheduler.asyncio.sleep", AsyncMock()):
+            await scheduler.refresh_saved_keywords()
+
+        async with session_factory() as db:
+            result = await db.execute(select(SavedKeyword).order_by(SavedKeyword.id))
+            saved = result.scalars().all()
+
+        assert {kw.keyword: (kw.visitor_review_count, kw.blog_review_count) for kw in saved} == counts
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -269,3 +269,41 @@ class TestTargetRankRequestValidation:
                 current_rank=10,
                 target_rank=5
             )
+
+
+class TestEstimateRank:
+    """PredictionService.estimate_rank 테스트"""
+
+    def test_estimate_rank_counts_higher_scores(self):
+        """내 점수보다 높은 경쟁사 수 + 1 (동점은 앞 순위)"""
+        from app.ml.predictor import PredictionService
+
+        competitors = [
+            {"scores": {"keyword_score": 40.0, "quality_score": score}}
+            for score in (90.0, 70.0, 70.0, 50.0)
+        ]
+        service = PredictionService()
+
+        assert service.estimate_rank(70.0, competitors) == 2
+        assert service.estimate_rank(95.0, competitors) == 1
+        assert service.estimate_rank(10.0, competitors) == 5
+        # N3 기준: 같은 N1/N2면 같은 N3 → 동점 처리
+        assert service.estimate_rank(70.0, competitors, use_n3=True, my_n1=40.0) == 2
+
+
+class TestGenerateRecommendations:
+    """PredictionService.generate_recommendations 테스트"""
+
+    def test_recommendations_follow_loaded_coefficients(self):
+        """load_model로 계수가 바뀌면 미리 계산된 추천 효과도 갱신"""
+        from app.ml.predictor import PredictionService
+
+        service = PredictionService()
+        before = {r["type"]: r["effect"] for r in service.generate_recommendations(50.0)}
+        assert before["블로그리뷰"] == service.calculate_effect("blog_review", 15)
+
+        service.load_model({"blog_review": 0.01})
+        after = {r["type"]: r["effect"] for r in service.generate_recommendations(50.0)}
+
+        assert after["블로그리뷰"] == service.calculate_effect("blog_review", 15) == 15.0
+        assert after["유입수"] == before["유입수"]
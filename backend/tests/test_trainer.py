@@ -146,6 +146,26 @@ class TestCalculateN2FromData:
 
         assert result["n2_slope"] is None
 
+    def test_calculate_n2_from_data_matches_linregress(self, trainer):
+        """닫힌 형태 회귀가 scipy linregress 결과와 일치"""
+        from scipy import stats
+
+        ranks = [1, 2, 4, 7, 11, 16]
+        n2_values = [82.0, 80.5, 71.0, 66.5, 52.0, 40.5]
+        data_list = []
+        for rank, n2 in zip(ranks, n2_values):
+            data = MagicMock()
+            data.rank = rank
+            data.index_n2 = n2
+            data_list.append(data)
+
+        result = trainer.calculate_n2_from_data(data_list)
+        expected = stats.linregress(ranks, n2_values)
+
+        assert result["n2_slope"] == pytest.approx(expected.slope)
+        assert result["n2_intercept"] == pytest.approx(expected.intercept)
+        assert result["n2_r_squared"] == pytest.approx(expected.rvalue ** 2)
+
 
 class TestTrainKeyword:
     """train_keyword 테스트"""
@@ -155,7 +175,7 @@ class TestTrainKeyword:
         """키워드 학습 성공"""
         mock_db = AsyncMock()
         mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = mock_training_data_valid
+        mock_result.all.return_value = mock_training_data_valid
         mock_db.execute.return_value = mock_result
 
         with patch('app.ml.trainer.parameter_repository') as mock_repo:
@@ -175,7 +195,7 @@ class TestTrainKeyword:
         mock_db = AsyncMock()
         mock_result = MagicMock()
         # 5개 데이터만 반환 (MIN_SAMPLES=10 미만)
-        mock_result.scalars.return_value.all.return_value = [MagicMock() for _ in range(5)]
+        mock_result.all.return_value = [MagicMock() for _ in range(5)]
         mock_db.execute.return_value = mock_result
 
         result = await trainer.train_keyword(mock_db, "테스트키워드")
@@ -186,6 +206,18 @@ class TestTrainKeyword:
         assert result["sample_count"] == 5
 
 
+def mock_stream_result(*partitions):
+    """AsyncSession.stream 결과 모킹 (partitions()가 주어진 묶음을 순서대로 반환)"""
+    async def _partitions(size=None):
+        for partition in partitions:
+            yield partition
+
+    result = MagicMock()
+    result.partitions = _partitions
+    result.close = AsyncMock()
+    return result
+
+
 class TestTrainAllKeywords:
     """train_all_keywords 테스트"""
 
@@ -194,33 +226,45 @@ class TestTrainAllKeywords:
         """전체 키워드 학습"""
         mock_db = AsyncMock()
 
-        # get_all_keywords 모킹
-        keywords_result = MagicMock()
-        keywords_result.scalars.return_value.all.return_value = ["키워드1", "키워드2"]
-
-        # get_training_data 모킹
-        training_result = MagicMock()
-        training_result.scalars.return_value.all.return_value = mock_training_data_valid
-
-        mock_db.execute.side_effect = [keywords_result, training_result, training_result]
+        # 전체 학습 데이터 일괄 조회 모킹 (키워드 순 정렬)
+        rows = []
+        for keyword in ["키워드1", "키워드2"]:
+            for data in mock_training_data_valid:
+                row = MagicMock()
+                row.keyword = keyword
+                row.rank = data.rank
+                row.index_n1 = data.index_n1
+                row.index_n2 = data.index_n2
+                rows.append(row)
+        # 키워드1 데이터가 두 묶음에 걸쳐 스트리밍되는 경우
+        mock_db.stream.return_value = mock_stream_result(rows[:10], rows[10:])
 
         with patch('app.ml.trainer.parameter_repository') as mock_repo:
-            mock_repo.save_or_update = AsyncMock()
+            mock_repo.save_or_update_many = AsyncMock()
 
             result = await trainer.train_all_keywords(mock_db)
 
         assert result["success"] is True
         assert result["total_keywords"] == 2
-        assert result["trained"] >= 0
+        assert result["trained"] == 2
         assert result["duration_seconds"] >= 0
+        # 두 키워드 파라미터를 한 번에 저장하고 커밋도 한 번만 수행
+        mock_repo.save_or_update_many.assert_awaited_once()
+        saved = mock_repo.save_or_update_many.await_args.args[1]
+        assert [p["keyword"] for p in saved] == ["키워드1", "키워드2"]
+        # 배치 전체가 같은 학습 시각을 공유
+        assert {p["last_trained_at"].isoformat() for p in saved} == {result["started_at"]}
+        mock_db.commit.assert_awaited_once()
+        # 키워드 목록과 학습 데이터를 스트리밍 쿼리 한 번으로 조회
+        mock_db.stream.assert_awaited_once()
+        mock_db.execute.assert_not_awaited()
+        assert all(p["sample_count"] == 15 for p in saved)
 
     @pytest.mark.asyncio
     async def test_train_all_keywords_no_keywords(self, trainer):
         """학습할 키워드가 없는 경우"""
         mock_db = AsyncMock()
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []  # 키워드 없음
-        mock_db.execute.return_value = mock_result
+        mock_db.stream.return_value = mock_stream_result()  # 학습 데이터 없음
 
         result = await trainer.train_all_keywords(mock_db)
 
@@ -229,6 +273,74 @@ class TestTrainAllKeywords:
         assert result["trained"] == 0
         assert "No keywords to train" in result.get("message", "")
 
+    @pytest.mark.asyncio
+    async def test_train_all_keywords_stream_error_cancels_fits(self, trainer, mock_training_data_valid):
+        """스트리밍 도중 실패하면 이미 투입한 계산 태스크를 정리하고 예외 전파"""
+        import asyncio
+        import threading
+
+        rows = []
+        for keyword in ["키워드1", "키워드2"]:
+            for data in mock_training_data_valid:
+                row = MagicMock()
+                row.keyword = keyword
+                row.rank = data.rank
+                rows.append(row)
+
+        async def _partitions(size=None):
+            yield rows[:15]
+            yield rows[15:]
+            raise ConnectionError("stream lost")
+
+        stream_result = MagicMock()
+        stream_result.partitions = _partitions
+        stream_result.close = AsyncMock()
+        mock_db = AsyncMock()
+        mock_db.stream.return_value = stream_result
+
+        # 계산이 끝나지 않은 상태에서 스트리밍 실패
+        release = threading.Event()
+        trainer._fit_keyword = lambda *args: release.wait(5)
+
+        try:
+            with pytest.raises(ConnectionError):
+                await trainer.train_all_keywords(mock_db)
+            pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        finally:
+            release.set()
+
+        assert pending == []
+        stream_result.close.assert_awaited_once()
+
+
+class TestTrainingReport:
+    """get_training_report 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_get_training_report_uses_aggregate_queries(self, trainer):
+        """파라미터/학습 데이터 통계를 집계 쿼리 두 번으로 조회"""
+        last_trained_at = datetime(2025, 1, 1, 12, 0, 0)
+
+        param_stats = MagicMock()
+        param_stats.one.return_value = (4, 3, 0.81234, 12.5, last_trained_at)
+        data_stats = MagicMock()
+        data_stats.one.return_value = (120, 5)
+
+        mock_db = AsyncMock()
+        mock_db.execute.side_effect = [param_stats, data_stats]
+
+        report = await trainer.get_training_report(mock_db)
+
+        assert mock_db.execute.await_count == 2
+        assert report["parameters"]["total_keywords"] == 4
+        assert report["parameters"]["reliable_keywords"] == 3
+        assert report["parameters"]["unreliable_keywords"] == 1
+        assert report["parameters"]["reliability_ratio"] == 0.75
+        assert report["parameters"]["avg_r_squared"] == 0.8123
+        assert report["parameters"]["avg_sample_count"] == 12.5
+        assert report["training_data"] == {"total_records": 120, "unique_keywords": 5}
+        assert report["last_trained_at"] == last_trained_at.isoformat()
+
 
 class TestTrainerConfiguration:
     """Trainer 설정 테스트"""